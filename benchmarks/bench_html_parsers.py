@@ -0,0 +1,117 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Time and peak memory of the HTML parsers of ecosystem/request.py on the
+saved pages in tests/resources/html.
+
+    python benchmarks/bench_html_parsers.py [--repeat 50]
+
+If BeautifulSoup is installed, the same extractions done by building the
+whole document (as before ecosystem/scraping.py) are measured too.
+"""
+
+import argparse
+from pathlib import Path
+import re
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from ecosystem.request import (
+    parse_github_contributors_sidebar,
+    parse_github_dependants,
+    parse_github_package_ids,
+    parse_juliapackages,
+)
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+PAGES = Path(__file__).resolve().parent.parent / "tests" / "resources" / "html"
+
+
+def soup_contributors(html_text):
+    """The contributors counter, with a whole BeautifulSoup tree"""
+    return BeautifulSoup(html_text, "html.parser").find("span", attrs={"title": "3"})
+
+
+def soup_package_ids(html_text):
+    """The package menu and status, with a whole BeautifulSoup tree"""
+    soup = BeautifulSoup(html_text, "html.parser")
+    menu = soup.find("div", {"class": "select-menu-list"})
+    return menu.find_all("a"), soup.find("p", {"role": "status"}).find("strong")
+
+
+def soup_dependants(html_text):
+    """The dependents counters, with a whole BeautifulSoup tree"""
+    soup = BeautifulSoup(html_text, "html.parser")
+    return (
+        soup.find_all(string=re.compile(r"( Repository| Repositories)\s*$")),
+        soup.find_all(string=re.compile(r"( Packages| Package)\s*$")),
+    )
+
+
+def soup_juliapackages(html_text):
+    """The package name and repository, with a whole BeautifulSoup tree"""
+    soup = BeautifulSoup(html_text, "html.parser")
+    return soup.find("h2"), soup.find("span", {"class": "shadow-sm rounded-md"}).find(
+        "a", {"href": re.compile(r"github.com")}
+    )
+
+
+BENCHMARKS = [
+    # (page, parser, the same with BeautifulSoup)
+    (
+        "github_contributors_list.html",
+        parse_github_contributors_sidebar,
+        soup_contributors,
+    ),
+    ("github_dependents.html", parse_github_package_ids, soup_package_ids),
+    ("github_dependents.html", parse_github_dependants, soup_dependants),
+    ("juliapackages.html", parse_juliapackages, soup_juliapackages),
+]
+
+
+def measure(function, html_text, repeat):
+    """Milliseconds per call and peak KiB of memory of function(html_text)"""
+    seconds = timeit.timeit(lambda: function(html_text), number=repeat)
+    tracemalloc.start()
+    function(html_text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds / repeat * 1000, peak / 1024
+
+
+def main():
+    """Prints a table with the measures of each parser"""
+    argparser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argparser.add_argument("--repeat", type=int, default=50)
+    args = argparser.parse_args()
+
+    print(f"{'parser':36} {'page':30} {'ms':>8} {'KiB':>8}")
+    for page, parser, soup_parser in BENCHMARKS:
+        html_text = (PAGES / page).read_text(encoding="utf-8")
+        candidates = [(parser.__name__, parser)]
+        if BeautifulSoup is not None:
+            candidates.append((f"  {soup_parser.__name__}", soup_parser))
+        for name, function in candidates:
+            milliseconds, kib = measure(function, html_text, args.repeat)
+            print(f"{name:36} {page:30} {milliseconds:8.2f} {kib:8.0f}")
+
+
+if __name__ == "__main__":
+    main()
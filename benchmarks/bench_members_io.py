@@ -0,0 +1,134 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Time to load and to dump the whole member database, for synthetic
+databases of 180 and 10000 members made from resources/members.
+
+    python benchmarks/bench_members_io.py [--sizes 180 10000] [--repeat 3]
+
+load parses every TOML file (no snapshot) and builds the Member objects,
+dump writes every member (as TomlStorage does, each file atomically replaced)
+and serialize only builds the TOML documents. If the `toml` package is
+installed, the same is measured with it (as before tomllib and TomlWriter).
+"""
+
+import argparse
+from copy import deepcopy
+from functools import partial
+from pathlib import Path
+import sys
+import tempfile
+import timeit
+import tomllib
+import uuid
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from ecosystem.dao import MemberIndex, TomlStorage, TomlWriter
+from ecosystem.member import Member
+
+try:
+    import toml
+except ImportError:
+    toml = None
+
+MEMBERS = Path(__file__).resolve().parent.parent / "resources" / "members"
+
+
+def synthetic_members(size: int) -> dict[str, Member]:
+    """size members, cycling through the real ones with new names and UUIDs"""
+    raws = []
+    for path in sorted(MEMBERS.glob("*.toml")):
+        with open(path, "rb") as file:
+            raws.append(tomllib.load(file))
+    members = {}
+    for i in range(size):
+        raw = deepcopy(raws[i % len(raws)])
+        raw["name"] = f"{raw['name']} {i}"
+        raw["uuid"] = str(uuid.UUID(int=i))
+        member = Member.from_dict(raw)
+        members[member.name_id] = member
+    return members
+
+
+def load(root: Path):
+    """Parses all the files and builds the members, with tomllib"""
+    index = MemberIndex(root / "members")
+    index.refresh()
+    return [index.member(name_id) for name_id in index.name_ids()]
+
+
+def dump(root: Path, members: dict[str, Member]):
+    """Writes all the members (with TomlWriter)"""
+    TomlStorage(root, snapshot=False).write(members, force=True)
+
+
+def serialize(members: dict[str, Member]):
+    """The TOML documents of all the members, with TomlWriter"""
+    writer = TomlWriter()
+    return [writer.dumps(member.to_dict()) for member in members.values()]
+
+
+def toml_serialize(members: dict[str, Member]):
+    """The TOML documents of all the members, with toml"""
+    return [toml.dumps(member.to_dict()) for member in members.values()]
+
+
+def toml_load(root: Path):
+    """Parses all the files and builds the members, with toml"""
+    return [
+        Member.from_dict(toml.load(path)) for path in (root / "members").glob("*.toml")
+    ]
+
+
+def toml_dump(root: Path, members: dict[str, Member]):
+    """Writes all the members, with toml"""
+    for name_id, member in members.items():
+        path = root / "members" / f"{name_id}.toml"
+        with open(path, "w", encoding="utf-8") as file:
+            toml.dump(member.to_dict(), file)
+
+
+def main():
+    """Prints a table with the seconds of each operation and database size"""
+    argparser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argparser.add_argument("--sizes", type=int, nargs="+", default=[180, 10000])
+    argparser.add_argument("--repeat", type=int, default=3)
+    args = argparser.parse_args()
+
+    print(f"{'operation':18} {'members':>8} {'seconds':>9} {'ms/member':>10}")
+    for size in args.sizes:
+        members = synthetic_members(size)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            dump(root, members)
+            candidates = [
+                ("dump", partial(dump, root, members)),
+                ("serialize", partial(serialize, members)),
+                ("load", partial(load, root)),
+            ]
+            if toml is not None:
+                candidates += [
+                    ("  toml dump", partial(toml_dump, root, members)),
+                    ("  toml serialize", partial(toml_serialize, members)),
+                    ("  toml load", partial(toml_load, root)),
+                ]
+            for name, function in candidates:
+                seconds = min(timeit.repeat(function, number=1, repeat=args.repeat))
+                print(
+                    f"{name:18} {size:8} {seconds:9.3f} {seconds / size * 1000:10.3f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
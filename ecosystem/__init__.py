@@ -15,14 +15,26 @@
 import fire
 
 from ecosystem.cli import CliMembers, CliCI, build_website
+from ecosystem.recording import exchange_archive
+from ecosystem.request import (
+    circuit_breaker,
+    http_cache,
+    negative_cache,
+    single_flight,
+)
 
 
 def main():
     # pylint: disable=missing-function-docstring
-    fire.Fire(
-        {
-            "members": CliMembers,
-            "build": build_website,
-            "ci": CliCI,
-        }
-    )
+    try:
+        with exchange_archive.from_env(), single_flight.run():
+            with negative_cache.run(), circuit_breaker.run():
+                fire.Fire(
+                    {
+                        "members": CliMembers,
+                        "build": build_website,
+                        "ci": CliCI,
+                    }
+                )
+    finally:
+        http_cache.close()
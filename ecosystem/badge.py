@@ -20,6 +20,11 @@ from .request import URL, request_json
 from .serializable import JsonSerializable
 
 
+def parse_badge_svg(text):
+    """If the page is an SVG image"""
+    return {"exists": text.startswith("<svg xmlns") and text.endswith("</svg>")}
+
+
 @dataclass
 class BadgeData(JsonSerializable):
     """
@@ -60,9 +65,7 @@ class BadgeData(JsonSerializable):
 
         qisk_dot_it_link_check = request_json(
             short_url,
-            parser=lambda x: {
-                "exists": x.startswith("<svg xmlns") and x.endswith("</svg>")
-            },
+            parser=parse_badge_svg,
         )
         if qisk_dot_it_link_check["exists"]:
             self.url = short_url
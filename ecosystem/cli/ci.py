@@ -15,14 +15,23 @@
 import traceback
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from slugify import slugify
 
 from ecosystem.dao import DAO
 from ecosystem.submission_parser import parse_submission_issue
-from ecosystem.error_handling import set_actions_output
-from ecosystem.validation import validate_member
+from ecosystem.error_handling import set_actions_output, logger, ThreadLogBuffer
+from ecosystem.github import GitHubData
+from ecosystem.julia import JuliaData
+from ecosystem.request import (
+    circuit_breaker,
+    negative_cache,
+    request_telemetry,
+    single_flight,
+)
+from ecosystem.validation import validate_members
 
 
 class CliCI:
@@ -83,7 +92,11 @@ class CliCI:
 
     @staticmethod
     def validate_member(
-        member_id: str, exclude: str = None, *, resources_dir: str | None = None
+        member_id: str,
+        exclude: str = None,
+        *,
+        resources_dir: str | None = None,
+        jobs: int = 1,
     ) -> None:
         """TODO
 
@@ -92,6 +105,8 @@ class CliCI:
             exclude: like `-e "recommendation, legacy, best_practice"`. They can be category or
              importance. Excluding here means, "do not exit with error if a failure in this
              category".
+            resources_dir: optional. Path to resource directory.
+            jobs: how many processes validate members at the same time.
 
         Returns:
             None (it has no side-effect)
@@ -106,8 +121,10 @@ class CliCI:
         if isinstance(exclude, str):
             exclude_set.add(exclude)
         dao = DAO(path=resources_dir)
-        for member in dao.get_all(member_id):
-            report = validate_member(member, verbose_level="-v")
+        members = list(dao.get_all(member_id))
+        reports = validate_members(members, verbose_level="-v", jobs=int(jobs))
+        for member in members:
+            report = reports[member.name_id]
             exit_failed = False
             if report.exitcode == 0:
                 print(f"::notice::  {member.name} ({member.name_id}) ✅")
@@ -145,35 +162,84 @@ class CliCI:
 
     @staticmethod
     def update_member_data(
-        member_id: str | None = None, resources_dir: str | None = None
+        member_id: str | None = None,
+        resources_dir: str | None = None,
+        workers: int = 1,
+        report: str | None = None,
     ) -> None:
-        """Update all the member dynamic data"""
+        """Update all the member dynamic data
+
+        Args:
+            member_id: loads the file ../resources/*_<member_id>.toml
+            resources_dir: optional. Path to resource directory.
+            workers: how many members are updated at the same time. The output of each
+             member is printed in its own group, in order, once the member is done.
+            report: optional. Path of a JSON file for the telemetry of the requests
+             (see RequestTelemetry). The summary is printed, compared with the
+             previous report in that file, and added to the GitHub Actions job summary.
+        """
         env_resources_dir = os.getenv("ECOSYSTEM_RESOURCES_DIR")
         resources_dir = Path(
             resources_dir or env_resources_dir or (Path.cwd() / "resources")
         )
+        dao = DAO(path=resources_dir)
+        log_buffer = ThreadLogBuffer(logger)
+
+        def update_member(member):
+            with log_buffer.capture() as output:
+                updated = CliCI._update_member(member, resources_dir, output)
+            return member, updated, output.getvalue()
+
+        members = list(dao.get_all(member_id))
+        with request_telemetry.run():
+            GitHubData.prefetch(
+                member.github for member in members if member.status != "Alumni"
+            )
+            JuliaData.prefetch(
+                julia
+                for member in members
+                if member.status != "Alumni"
+                for julia in member.julia.values()
+            )
+            with ThreadPoolExecutor(max_workers=max(1, int(workers))) as pool:
+                for member, updated, output in pool.map(update_member, members):
+                    # Only this (main) thread writes in the database
+                    print(output, end="")
+                    if updated:
+                        dao.update(member.name_id, member=member)
+                    print("::endgroup::")
+        counters = {
+            "repeated requests not fetched again": single_flight.saved,
+            "known failures not requested again": negative_cache.hits,
+            "requests to failing hosts not made": circuit_breaker.rejected,
+        }
+        print(request_telemetry.write_report(report, counters))
+
+    @staticmethod
+    def _update_member(member, resources_dir, output) -> bool:
+        """Runs the member update methods, writing the log in output.
+        Returns True if any of them succeeded."""
         to_update = [
             "github",
             "pypi",
             "julia",
         ]
-        dao = DAO(path=resources_dir)
-        for member in dao.get_all(member_id):
-            print(f"\n::group:: {member.name}️ ({member.name_id})")
-            if member.status == "Alumni":
-                print('member.status == "Alumni", so skip')
-                print("::endgroup::")
-                continue
-            for update_method_str in to_update:
-                print(f"Updating {update_method_str}️")
-                update_method = getattr(member, f"update_{update_method_str}")
-                try:
-                    update_method()
-                    dao.update(member.name_id, member=member)
-                except Exception as e:
-                    print(
-                        f"\n::warning file={resources_dir}/members/{member.name_id}.toml::Error "
-                        f"updating {member.name_id} when {update_method_str}️ - {e}"
-                    )
-                    print(traceback.format_exc())
-            print("::endgroup::")
+        print(f"\n::group:: {member.name}️ ({member.name_id})", file=output)
+        if member.status == "Alumni":
+            print('member.status == "Alumni", so skip', file=output)
+            return False
+        updated = False
+        for update_method_str in to_update:
+            print(f"Updating {update_method_str}️", file=output)
+            update_method = getattr(member, f"update_{update_method_str}")
+            try:
+                update_method()
+                updated = True
+            except Exception as e:
+                print(
+                    f"\n::warning file={resources_dir}/members/{member.name_id}.toml::Error "
+                    f"updating {member.name_id} when {update_method_str}️ - {e}",
+                    file=output,
+                )
+                print(traceback.format_exc(), file=output)
+        return updated
@@ -23,8 +23,12 @@ from jsonpath import findall, query
 from slugify import slugify
 
 from ecosystem.dao import DAO
+from ecosystem.downloads import downloads_store
 from ecosystem.classifications import ClassificationsToml
 from ecosystem.error_handling import logger
+from ecosystem.github import GitHubData
+from ecosystem.julia import JuliaData
+from ecosystem.validation import validate_members
 
 
 class CliMembers:
@@ -127,7 +131,7 @@ class CliMembers:
                     "Example Badge endpoint (status=Under review): %s",
                     os.path.join(output_directory, filename),
                 )
-        for project in self.dao.get_all(name):
+        for project in self.dao.get_all(name, fields=["badge", "status"]):
             # Create a json to be consumed by https://shields.io/badges/endpoint-badge
             if project.badge is None:
                 continue
@@ -187,7 +191,7 @@ class CliMembers:
                 for i in getattr(self.classifications_toml, f"{classification}_names")
             }
             classification_summary[classification][None] = []
-        for project in self.dao.get_all():
+        for project in self.dao.get_all(fields=classifications):
             for classification in classifications:
                 value = getattr(project, classification)
                 if isinstance(value, list):
@@ -327,7 +331,7 @@ class CliMembers:
         Path(output_file).touch(exist_ok=True)
 
         projects = []
-        for project in self.dao.get_all():
+        for project in self.dao.get_all(fields=["badge"]):
             if project.badge is None:
                 self.logger.warning(
                     "badge not found for %s (%s)",
@@ -378,7 +382,9 @@ class CliMembers:
         Otherwise, all the members with name_id that contains <name>
         as substring are checked.
         """
-        for project in self.dao.get_all(name):
+        projects = list(self.dao.get_all(name))
+        GitHubData.prefetch(project.github for project in projects)
+        for project in projects:
             project.update_github()
             self.dao.update(project.name_id, github=project.github)
 
@@ -393,6 +399,15 @@ class CliMembers:
             project.update_pypi()
             self.dao.update(project.name_id, pypi=project.pypi)
 
+    def ingest_downloads(self, csv_path: str):
+        """
+        Loads a bulk export of daily PyPI downloads (a CSV file with package,
+        date and downloads columns, and optionally category) in the downloads
+        store, so update_pypi does not request pypistats.org for those packages.
+        """
+        rows = downloads_store.ingest_csv(csv_path)
+        self.logger.info("%d rows of downloads loaded from %s", rows, csv_path)
+
     def update_julia(self, name=None):
         """
         Updates Julia data.
@@ -401,11 +416,15 @@ class CliMembers:
         Otherwise, all the members with name_id that contains <name>
         as substring are checked.
         """
-        for project in self.dao.get_all(name):
+        projects = list(self.dao.get_all(name))
+        JuliaData.prefetch(
+            julia for project in projects for julia in project.julia.values()
+        )
+        for project in projects:
             project.update_julia()
             self.dao.update(project.name_id, julia=project.julia)
 
-    def update_checkups(self, name=None, checker=None, update_all=False):
+    def update_checkups(self, name=None, checker=None, update_all=False, jobs=1):
         """
         Updates checkups data.
         Args:
@@ -413,12 +432,22 @@ class CliMembers:
              that contains <name> as substring are checked.
             checker: It can be something like test_classifications.py::test_004 or nothing
             update_all: If False (default) runs on all project. Otherwise Alumni are excluded.
+            jobs: how many processes validate members at the same time.
         """
-        for project in self.dao.get_all(name):
-            if project.status == "Alumni" and not update_all:
-                # "Alumni" projects are not updated in their checkups
-                continue
-            project.update_checkups(checker=checker)
+        # "Alumni" projects are not updated in their checkups
+        projects = [
+            project
+            for project in self.dao.get_all(name)
+            if update_all or project.status != "Alumni"
+        ]
+        reports = validate_members(
+            projects,
+            tests_to_run=checker,
+            verbose_level="-q" if checker is None else "-v",
+            jobs=int(jobs),
+        )
+        for project in projects:
+            project.update_checkups(report=reports[project.name_id])
             if project.checks:
                 for checkup_id, checkup in project.checks.items():
                     if checkup.xfailed:
@@ -21,38 +21,315 @@ File structure:
         └── repo-name.toml
 """
 
+from fnmatch import fnmatchcase
 from pathlib import Path
+import datetime
+import hashlib
+import math
+import os
+import pickle
+import re
 import shutil
-import toml
-from toml import TomlEncoder as TomlEncoderUpstream
+import tempfile
+import tomllib
+from packaging.utils import canonicalize_name
 
 from ecosystem.error_handling import logger, EcosystemError
 from ecosystem.member import Member
+from ecosystem.request import URL
 
+# Bump when the content of the snapshot changes, so old snapshots are ignored
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILE = ".members_snapshot.pickle"
 
-class TomlEncoder(TomlEncoderUpstream):
-    """TOML encoder that keeps short lists on a single line.
+# The umask, for the mode of new files (os.umask can only be read by setting it)
+UMASK = os.umask(0o022)
+os.umask(UMASK)
 
-    Upstream's encoder always dumps lists multiline, which makes the diffs of
-    the member TOML files noisy. This subclass renders lists inline when they
-    are short enough to stay readable, and falls back to one element per line
-    otherwise.
+
+def replace_file(tmp_path: str, path: Path):
+    """Moves tmp_path (a temporary file, that is 0600) to path, with the mode of
+    the file it replaces, or the one open() gives to new files"""
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o666 & ~UMASK
+    os.chmod(tmp_path, mode)
+    os.replace(tmp_path, path)
+
+
+class TomlWriter:
+    """Serializes the member dicts to TOML, formatted as `taplo fmt` does with
+    its default options, so the files are written ready to be committed.
+
+    Keys with scalars and arrays go first, then one [table] per dict, level by
+    level as toml.dump did (tables with nothing but subtables have no header of
+    their own). Arrays stay on one
+    line unless that line is longer than `column_width`, then they get one
+    element per line, with a trailing comma.
     """
 
-    def dump_list(self, v):
-        """Override to dump empty lists without trailing comma"""
-        oneline = f"[{', '.join( str(self.dump_value(u)) for u in v )}]"
-        multiline = (
-            f"[\n{'\n'.join( '  ' + str(self.dump_value(u)) + ',' for u in v )}\n]"
-        )
-        if len(oneline) < 60:
-            return oneline
-        if len(oneline) > 65:
-            max_element = max(len(str(self.dump_value(u))) for u in v if u is not None)
-            if max_element <= 10:
-                return oneline
-            return multiline
-        return oneline
+    BARE_KEY = re.compile(r"^[A-Za-z0-9_-]+$")
+    ESCAPES = {
+        '"': '\\"',
+        "\\": "\\\\",
+        "\b": "\\b",
+        "\t": "\\t",
+        "\n": "\\n",
+        "\f": "\\f",
+        "\r": "\\r",
+    }
+    TO_ESCAPE = re.compile(r'["\\\x00-\x1f\x7f]')
+
+    def __init__(self, column_width: int = 80):
+        self.column_width = column_width
+
+    def dumps(self, data: dict) -> str:
+        """The TOML document of data"""
+        lines = []
+        tables = [((), data)]
+        while tables:
+            subtables = []
+            for path, table in tables:
+                values = [(k, v) for k, v in table.items() if not isinstance(v, dict)]
+                children = [(k, v) for k, v in table.items() if isinstance(v, dict)]
+                if path and (values or not children):
+                    if lines:
+                        lines.append("")
+                    lines.append(f"[{'.'.join(self.key(k) for k in path)}]")
+                for key, value in values:
+                    if value is not None:
+                        lines.extend(self._key_value(self.key(key), value))
+                subtables.extend((path + (key,), child) for key, child in children)
+            tables = subtables
+        return "\n".join(lines) + "\n"
+
+    def _key_value(self, key: str, value) -> list[str]:
+        if not isinstance(value, list):
+            return [f"{key} = {self.value(value)}"]
+        elements = [self.value(element) for element in value]
+        oneline = f"{key} = [{', '.join(elements)}]"
+        if len(oneline) <= self.column_width or not elements:
+            return [oneline]
+        return [f"{key} = ["] + [f"  {element}," for element in elements] + ["]"]
+
+    def key(self, key: str) -> str:
+        """A bare key if possible, a quoted one otherwise"""
+        return key if TomlWriter.BARE_KEY.match(key) else self.string(key)
+
+    def value(self, value) -> str:  # pylint: disable=too-many-return-statements
+        """A scalar or an inline array/table"""
+        if isinstance(value, str):
+            return self.string(value)
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, int):
+            return str(value)
+        if isinstance(value, float):
+            return repr(value) if math.isfinite(value) else str(value)
+        if isinstance(value, (datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, list):
+            return f"[{', '.join(self.value(element) for element in value)}]"
+        if isinstance(value, dict):
+            pairs = (f"{self.key(k)} = {self.value(v)}" for k, v in value.items())
+            return f"{{ {', '.join(pairs)} }}"
+        raise EcosystemError(f"Cannot write {value!r} ({type(value).__name__}) to TOML")
+
+    @staticmethod
+    def string(value: str) -> str:
+        """A basic string, with the escapes of the TOML spec"""
+        return f'"{TomlWriter.TO_ESCAPE.sub(TomlWriter._escape, value)}"'
+
+    @staticmethod
+    def _escape(match) -> str:
+        char = match.group()
+        return TomlWriter.ESCAPES.get(char) or f"\\u{ord(char):04x}"
+
+
+class MemberIndex:
+    """In-memory index of the member TOML files.
+
+    Keeps the parsed content of each TOML file together with its modification
+    time and size, so a refresh only parses the files that changed since the
+    previous one. Lookups by name_id, URL, short UUID and package name are
+    dictionary hits over the parsed content.
+
+    If snapshot_path is given, the first refresh loads the parsed content from
+    that (pickle) snapshot when the hash of the TOML files matches the one it
+    was saved with, and saves a new snapshot otherwise.
+    """
+
+    def __init__(self, toml_dir: Path, snapshot_path: Path = None):
+        self.toml_dir = toml_dir
+        self.snapshot_path = snapshot_path
+        self._stats = {}  # name_id -> (st_mtime_ns, st_size)
+        self._raw = {}  # name_id -> dict, as parsed from the TOML file
+        self._by_url = {}
+        self._by_short_uuid = {}
+        self._by_package = {}
+
+    def refresh(self):
+        """Re-parses the TOML files that were added or modified since the last refresh"""
+        stats = {}
+        paths = {}
+        for path in self.toml_dir.glob("*.toml"):
+            stat = path.stat()
+            stats[path.stem] = (stat.st_mtime_ns, stat.st_size)
+            paths[path.stem] = path
+        if stats == self._stats:
+            return
+        if not self._stats and self.snapshot_path is not None:
+            self._raw = self._load_all(paths)
+        else:
+            for name_id in self._stats.keys() - stats.keys():
+                del self._raw[name_id]
+            for name_id, stat in stats.items():
+                if self._stats.get(name_id) != stat:
+                    self._raw[name_id] = MemberIndex.load(paths[name_id])
+        self._stats = stats
+        self._reindex()
+
+    def _load_all(self, paths: dict[str, Path]) -> dict:
+        """Parses all the files, unless the snapshot has the same content hash"""
+        content_hash = MemberIndex.content_hash(paths)
+        raw = self._read_snapshot(content_hash)
+        if raw is None:
+            raw = {name_id: MemberIndex.load(path) for name_id, path in paths.items()}
+            self._write_snapshot(content_hash, raw)
+        return raw
+
+    @staticmethod
+    def content_hash(paths: dict[str, Path]) -> str:
+        """sha256 of the names and contents of the files"""
+        digest = hashlib.sha256()
+        for name_id in sorted(paths):
+            content = paths[name_id].read_bytes()
+            digest.update(f"{name_id}\0{len(content)}\0".encode())
+            digest.update(content)
+        return digest.hexdigest()
+
+    def _read_snapshot(self, content_hash: str) -> dict | None:
+        """The parsed content in the snapshot, None if missing or outdated"""
+        try:
+            with open(self.snapshot_path, "rb") as file:
+                snapshot = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning("Ignoring unreadable %s: %r", self.snapshot_path, exc)
+            return None
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            return None
+        if snapshot.get("content_hash") != content_hash:
+            return None
+        return snapshot["raw"]
+
+    def _write_snapshot(self, content_hash: str, raw: dict):
+        """Saves the snapshot (a failure to save it is not an error)"""
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "content_hash": content_hash,
+            "raw": raw,
+        }
+        try:
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=self.snapshot_path.parent, suffix=".tmp", delete=False
+            ) as file:
+                pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+            replace_file(file.name, self.snapshot_path)
+        except OSError as exc:
+            logger.warning("Could not save %s: %s", self.snapshot_path, exc)
+
+    @staticmethod
+    def load(path: Path) -> dict:
+        """Parses a member TOML file"""
+        try:
+            with open(path, "rb") as file:
+                raw = tomllib.load(file)
+        except tomllib.TOMLDecodeError as err:
+            raise EcosystemError(f"{path} unparsable TOML. {err.args[0]}") from err
+        if not raw:
+            raise EcosystemError(f"TOML empty? {path}")
+        return raw
+
+    def _reindex(self):
+        self._by_url = {}
+        self._by_short_uuid = {}
+        self._by_package = {}
+        for name_id, raw in self._raw.items():
+            if raw.get("url"):
+                self._by_url[MemberIndex.url_key(raw["url"])] = name_id
+            if raw.get("uuid"):
+                self._by_short_uuid[raw["uuid"].split("-")[0]] = name_id
+            for section in ("pypi", "julia"):
+                for package_name in raw.get(section, {}):
+                    self._by_package[MemberIndex.package_key(package_name)] = name_id
+
+    @staticmethod
+    def url_key(url) -> str:
+        """Normalized URL, as used to index the members"""
+        return str(url) if isinstance(url, URL) else str(URL(url))
+
+    @staticmethod
+    def package_key(package_name: str) -> str:
+        """Normalized package name, as used to index the members"""
+        return canonicalize_name(package_name)
+
+    def __contains__(self, name_id):
+        return name_id in self._raw
+
+    def raw(self, name_id: str) -> dict | None:
+        """The content of the member TOML file, as parsed in the last refresh"""
+        return self._raw.get(name_id)
+
+    def name_ids(self, pattern: str = "*") -> list[str]:
+        """The name_ids of the files that match the glob pattern (without the extension)"""
+        if pattern == "*":
+            return list(self._raw)
+        return [name_id for name_id in self._raw if fnmatchcase(name_id, pattern)]
+
+    def name_id_by_url(self, url) -> str | None:
+        """The name_id of the member with that URL, None if not found"""
+        return self._by_url.get(MemberIndex.url_key(url))
+
+    def name_id_by_short_uuid(self, short_uuid: str) -> str | None:
+        """The name_id of the member with that short UUID, None if not found"""
+        return self._by_short_uuid.get(short_uuid)
+
+    def name_id_by_package(self, package_name: str) -> str | None:
+        """The name_id of the member with that PyPI or Julia package, None if not found"""
+        return self._by_package.get(MemberIndex.package_key(package_name))
+
+    def member(self, name_id: str, fields=None) -> Member:
+        """Builds a new Member object from the indexed data.
+        With fields, only those fields (and name and uuid) are set, see DAO.get_all."""
+        raw = self._raw[name_id]
+        if fields is not None:
+            fields = set(fields) | {"name", "uuid"}
+            raw = {key: value for key, value in raw.items() if key in fields}
+        try:
+            member = Member.from_dict(raw)
+        except TypeError as exc:
+            raise EcosystemError(f"TOML empty? {self.toml_dir / name_id}.toml") from exc
+        member._filename = name_id  # pylint: disable=protected-access
+        return member
+
+
+class MemberDict(dict):
+    """dict of members that remembers which name_ids were set or marked as dirty."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dirty = set()
+
+    def __setitem__(self, name_id, member):
+        super().__setitem__(name_id, member)
+        self.dirty.add(name_id)
+
+    def mark_dirty(self, name_id):
+        """Flags the member as (potentially) modified, so it is considered for writing"""
+        self.dirty.add(name_id)
 
 
 class TomlStorage:
@@ -63,36 +340,40 @@ class TomlStorage:
     with TomlStorage() as data:  # Data is read from TOML files
         data[name_id] = new_repo # Mutate the data
                                  # Changes are saved on exit
+
+    On exit, only the members that were set (or marked with `data.mark_dirty(name_id)`)
+    are considered, and only the ones with a `to_dict()` different from the one in disk
+    are written.
+
+    Unless `snapshot` is False, the parsed files are also kept in a snapshot in
+    root_path (see MemberIndex), so read-only runs do not need to parse them.
     """
 
-    def __init__(self, root_path: str):
+    def __init__(self, root_path: str, snapshot: bool = True):
         self.toml_dir = Path(root_path, "members")
         self._data = None  # for use with context manager
+        self._written = {}  # name_id -> dict as last written
+        snapshot_path = Path(root_path, SNAPSHOT_FILE) if snapshot else None
+        self.index = MemberIndex(self.toml_dir, snapshot_path)
 
     def _name_id_to_path(self, name_id):
         return self.toml_dir / f"{name_id}.toml"
 
-    def read(self, short_id: str = None) -> dict:
+    def read(self, short_id: str = None, fields=None) -> dict:
         """
         Search for TOML files and read into dict with types:
-        { url (str): repo (Submission) }
+        { name_id (str): repo (Member) }
+        Only the files modified since the last read are parsed again (see MemberIndex).
+        With fields, the members only have those fields (see DAO.get_all).
         """
-        data = {}
-        toml_patter = "*.toml"
+        name_id_pattern = "*"
         if short_id:
-            toml_patter = (
-                f"*_{short_id}.toml" if len(short_id) == 8 else f"*{short_id}.toml"
-            )
-        for path in self.toml_dir.glob(toml_patter):
-            try:
-                repo = Member.from_dict(toml.load(path))
-                repo._filename = path.stem  # pylint: disable=protected-access
-            except TypeError as exc:
-                raise EcosystemError(f"TOML empty? {path}") from exc
-            except toml.decoder.TomlDecodeError as err:
-                raise EcosystemError(f"{path} unparsable TOML. {err.args[0]}") from err
-            data[path.stem] = repo
-        return data
+            name_id_pattern = f"*_{short_id}" if len(short_id) == 8 else f"*{short_id}"
+        self.index.refresh()
+        return {
+            name_id: self.index.member(name_id, fields)
+            for name_id in self.index.name_ids(name_id_pattern)
+        }
 
     def refresh_files(self):
         """Forces dumping the DAO to files"""
@@ -100,12 +381,14 @@ class TomlStorage:
         # (we erase everything to clean up any deleted repos from data)
         if self.toml_dir.exists():
             shutil.rmtree(self.toml_dir)
-        self.write(self._data)
+        self.write(self._data, force=True)
 
-    def write(self, data: dict):
+    def write(self, data: dict, force: bool = False):
         """
-        Dump everything to TOML files from dict of types
-        { key (any): repo (Submission) }
+        Dump to TOML files from dict of types
+        { key (any): repo (Member) }
+        Members with the same `to_dict()` as their file in disk are skipped, unless
+        `force` is True.
         """
         if not self.toml_dir.exists():
             self.toml_dir.mkdir()
@@ -113,18 +396,51 @@ class TomlStorage:
         # Write to human-readable TOML
         for submission in data.values():
             submission_dict = submission.to_dict()
-            with open(self._name_id_to_path(submission.name_id), "w") as file:
-                toml.dump(submission_dict, file, encoder=TomlEncoder(preserve=True))
-
-    def __enter__(self) -> dict:
+            name_id = submission.name_id
+            if not force and submission_dict == self._last_written(name_id):
+                continue
+            self._dump(name_id, submission_dict)
+            self._written[name_id] = submission_dict
+
+    def _last_written(self, name_id):
+        if name_id in self._written:
+            return self._written[name_id]
+        return self.index.raw(name_id)
+
+    def _dump(self, name_id, submission_dict):
+        """Writes a temporary file and moves it into place, so files are never half written"""
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=self.toml_dir,
+            prefix=f".{name_id}.",
+            suffix=".tmp",
+            delete=False,
+        ) as file:
+            try:
+                file.write(TomlWriter().dumps(submission_dict))
+            except Exception:
+                file.close()
+                os.unlink(file.name)
+                raise
+        replace_file(file.name, self._name_id_to_path(name_id))
+
+    def __enter__(self) -> MemberDict:
         if self._data is None:
-            self._data = self.read()
+            self._data = MemberDict(self.read())
         return self._data
 
     def __exit__(self, _type, _value, exception):
         if _type is not None:
             return False
-        self.write(self._data)
+        self.write(
+            {
+                name_id: self._data[name_id]
+                for name_id in self._data.dirty
+                if name_id in self._data
+            }
+        )
+        self._data.dirty.clear()
         return True
 
 
@@ -156,31 +472,67 @@ class DAO:
         with self.storage as data:
             del data[name_id]
 
+    def _get_indexed(self, name_id: str | None) -> Member | None:
+        if name_id is None:
+            return None
+        return self.storage.index.member(name_id)
+
     def get_by_url(self, url: str) -> Member:
         """
         Returns project by URL. None if the repo is not found
         """
-        for project in self.get_all():
-            if project.url == url:
-                return project
-        return None
+        self.storage.index.refresh()
+        return self._get_indexed(self.storage.index.name_id_by_url(url))
 
-    def __getitem__(self, name_id):
-        """gets a project by name in the most inefficient way"""
-        for project in self.get_all():
-            if project.name_id == name_id:
-                return project
-        raise KeyError(f"No project with name : {name_id}")
+    def get_by_short_uuid(self, short_uuid: str) -> Member:
+        """
+        Returns project by the short version of its UUID. None if the repo is not found
+        """
+        self.storage.index.refresh()
+        return self._get_indexed(self.storage.index.name_id_by_short_uuid(short_uuid))
 
-    def get_all(self, short_id: str | None = None, sort_key=None) -> list[Member]:
+    def get_by_package(self, package_name: str) -> Member:
+        """
+        Returns the project with a PyPI or Julia package called <package_name>.
+        None if the repo is not found
+        """
+        self.storage.index.refresh()
+        return self._get_indexed(self.storage.index.name_id_by_package(package_name))
+
+    def __getitem__(self, name_id):
+        """gets a project by name"""
+        self.storage.index.refresh()
+        if name_id not in self.storage.index:
+            raise KeyError(f"No project with name : {name_id}")
+        return self._get_indexed(name_id)
+
+    def get_all(
+        self, short_id: str | None = None, sort_key=None, fields=None
+    ) -> list[Member]:
         """
         Returns list of all repositories.
+
+        If fields is given (like ["name", "badge"]), the members are built with only
+        those fields, plus name and uuid. These partial members are for reading: do
+        not write them back.
         """
-        projects = self.storage.read(str(short_id) if short_id else None).values()
+        short_id = str(short_id) if short_id else None
+        projects = self.storage.read(short_id, fields).values()
         if sort_key:
             return sorted(projects, key=sort_key)
         return projects
 
+    def get_all_dicts(self) -> dict[str, dict]:
+        """
+        Returns the data of all the repositories, as in their TOML files, by name_id
+        (sorted). Do not modify it: it is the data the DAO has indexed.
+        """
+        self.storage.index.refresh()
+        return {
+            name_id: self.storage.index.raw(name_id)
+            for name_id in sorted(self.storage.index.name_ids())
+        }
+
     def update(self, name_id: str = None, **kwargs):
         """
         Update attributes of repository.
@@ -199,9 +551,10 @@ class DAO:
                 data[name_id] = kwargs["member"]
                 del kwargs["member"]
             for arg, value in kwargs.items():
-                current_value = data[name_id].__dict__.get(arg)
+                current_value = getattr(data[name_id], arg, None)
                 DAO.log_update(current_value, value, arg, name_id)
-                data[name_id].__dict__[arg] = value
+                setattr(data[name_id], arg, value)
+                data.mark_dirty(name_id)
 
     def refresh_files(self):
         """Forces dumping the DAO to files"""
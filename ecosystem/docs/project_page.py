@@ -131,14 +131,20 @@ class ProjectPage:  # pylint: disable=redefined-outer-name
         ret += packages.get(None, [])
         return ret
 
+    def render(self):
+        """The content of the page"""
+        return "\n".join(self.generate_all_lines()) + "\n"
+
+    @property
+    def edit_path(self):
+        """The file to edit the page"""
+        return f"resources/members/{self.project.short_uuid}.toml"
+
     def write_page(self):
         """takes the lines and writes them down"""
         with mkdocs_gen_files.open(self.filename, "w") as f:
-            print("\n".join(self.generate_all_lines()), file=f)
-        mkdocs_gen_files.set_edit_path(
-            self.filename,
-            f"resources/members/{self.project.short_uuid}.toml",
-        )
+            f.write(self.render())
+        mkdocs_gen_files.set_edit_path(self.filename, self.edit_path)
 
     def front_matter(self):
         """returns lines with front matter"""
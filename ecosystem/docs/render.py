@@ -0,0 +1,113 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Rendering of the member pages (docs/p/ and docs/pypi/) in worker processes.
+
+The workers get the members as the dicts of their TOML files and return the
+pages as strings, so only the main process (where mkdocs runs) writes files.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+import sys
+import threading
+
+from ecosystem.docs.project_page import ProjectPage
+from ecosystem.docs.pypi_page import PypiPage
+from ecosystem.member import Member
+
+# A worker costs about as much as rendering this many members (0.5 ms each), so
+# fewer members per worker are not worth it: forking one (and getting its pages
+# back) takes about 13 ms, and spawning one (a new interpreter importing
+# ecosystem) about 0.9 s
+MIN_MEMBERS_PER_JOB = {"fork": 50, "spawn": 1500}
+
+
+def start_method() -> str:
+    """How the workers are started: forked on Linux, if this process has no other
+    threads (that a fork could leave holding locks), and spawned otherwise"""
+    if sys.platform.startswith("linux") and threading.active_count() == 1:
+        return "fork"
+    return "spawn"
+
+
+def render_member(name_id: str, member_dict: dict) -> dict:
+    """The pages of a member, as (filename, content, edit_path), and its entries
+    in the navigation and in the lists of active projects and PyPI packages"""
+    project = Member.from_dict(member_dict)
+    project._filename = name_id  # pylint: disable=protected-access
+    project_page = ProjectPage(project, f"p/{project.short_uuid}.md")
+    rendered = {
+        "pages": [
+            (project_page.filename, project_page.render(), project_page.edit_path)
+        ],
+        "project_nav": (project.name, f"{project.short_uuid}.md"),
+        "pypi_nav": [],
+        "active_projects": [],
+        "active_pypi": [],
+    }
+    active = project.status != "Alumni"
+    if active:
+        rendered["active_projects"].append(
+            {
+                "name": f"<a href='../p/{project.short_uuid}'>{project.name}</a>",
+                "status": project.status or "Active project",
+                "maturity": project.maturity,
+            }
+        )
+    for package in project.pypi.values():
+        pypi_page = PypiPage(package, project, f"pypi/{package.package_name}.md")
+        rendered["pages"].append(
+            (pypi_page.filename, pypi_page.render(), pypi_page.edit_path)
+        )
+        rendered["pypi_nav"].append(
+            (package.package_name, f"{package.package_name}.md")
+        )
+        if active:
+            rendered["active_pypi"].append(
+                {
+                    "name": f"<a href='../pypi/{package.package_name}'>"
+                    f"{package.package_name}</a>",
+                    "status": project.status or "Active project",
+                    "maturity": project.maturity,
+                }
+            )
+    return rendered
+
+
+def render_members(
+    member_dicts: dict[str, dict], jobs: int = None, min_members_per_job: int = None
+) -> list[dict]:
+    """render_member of each of the member_dicts (by name_id), in order, on a pool
+    of `jobs` processes (by default, $ECOSYSTEM_DOCS_JOBS or the number of CPUs),
+    with at least min_members_per_job members per process (by default, the one
+    of its start method in MIN_MEMBERS_PER_JOB)"""
+    method = start_method()
+    if min_members_per_job is None:
+        min_members_per_job = MIN_MEMBERS_PER_JOB[method]
+    jobs = jobs or int(os.getenv("ECOSYSTEM_DOCS_JOBS", "0")) or os.cpu_count() or 1
+    jobs = min(jobs, len(member_dicts) // max(1, min_members_per_job))
+    if jobs <= 1:
+        return [render_member(*item) for item in member_dicts.items()]
+    with ProcessPoolExecutor(
+        max_workers=jobs, mp_context=multiprocessing.get_context(method)
+    ) as pool:
+        chunksize = max(1, len(member_dicts) // (jobs * 4))
+        return list(
+            pool.map(
+                render_member,
+                member_dicts.keys(),
+                member_dicts.values(),
+                chunksize=chunksize,
+            )
+        )
@@ -0,0 +1,144 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Local store of daily PyPI downloads."""
+
+from contextlib import closing, contextmanager
+from datetime import date, timedelta
+import csv
+import sqlite3
+
+from packaging.utils import canonicalize_name
+
+from .error_handling import EcosystemError
+
+# Column names accepted by DownloadsStore.ingest_csv, for each field
+CSV_COLUMNS = {
+    "package": ["package", "project", "file_project"],
+    "date": ["date", "download_date"],
+    "downloads": ["downloads", "num_downloads"],
+    "category": ["category"],
+}
+
+
+class DownloadsStore:
+    """Daily downloads per package and category (with_mirrors, without_mirrors),
+    as reported by https://pypistats.org/api/packages/<package>/overall or loaded
+    from a bulk CSV export.
+
+    Each package is fetched at most once per day: the store remembers until
+    when its data is fresh, and the download counts are aggregated from it.
+    """
+
+    def __init__(self, db_path: str = "_ecosystem_downloads.sqlite"):
+        self.db_path = db_path
+
+    @contextmanager
+    def _connect(self):
+        """A connection to db_path, committed and closed at the end of the block"""
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as connection:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS downloads (package TEXT, date TEXT, "
+                    "category TEXT, downloads INTEGER, "
+                    "PRIMARY KEY (package, date, category))"
+                )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS fresh "
+                    "(package TEXT PRIMARY KEY, until TEXT)"
+                )
+                yield connection
+
+    def is_fresh(self, package: str, today: date = None) -> bool:
+        """If the downloads of package are up to date (fetched today)"""
+        today = today or date.today()
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT until FROM fresh WHERE package = ?",
+                (canonicalize_name(package),),
+            ).fetchone()
+        return row is not None and row[0] >= today.isoformat()
+
+    def add(self, package: str, rows, fresh_until: date = None):
+        """Stores the (date, category, downloads) rows of package,
+        which is fresh until fresh_until (by default, today)"""
+        package = canonicalize_name(package)
+        fresh_until = fresh_until or date.today()
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO downloads VALUES (?, ?, ?, ?)",
+                ((package, day, category, int(n)) for day, category, n in rows),
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO fresh VALUES (?, ?)",
+                (package, fresh_until.isoformat()),
+            )
+
+    def ingest_csv(self, csv_path: str) -> int:
+        """Loads a bulk export (like a BigQuery dump) with a row per package and
+        day, see CSV_COLUMNS. Rows without category are "without_mirrors".
+        Each package is fresh until the day after its last date in the file.
+        Returns how many rows were loaded."""
+        rows = {}
+        with open(csv_path, newline="", encoding="utf-8") as csv_file:
+            reader = csv.DictReader(csv_file)
+            columns = {}
+            for field, names in CSV_COLUMNS.items():
+                found = [n for n in names if n in (reader.fieldnames or [])]
+                if found:
+                    columns[field] = found[0]
+                elif field != "category":
+                    raise EcosystemError(
+                        f"{csv_path} has no {field} column (one of {names})"
+                    )
+            for row in reader:
+                category = row.get(columns.get("category")) or "without_mirrors"
+                rows.setdefault(canonicalize_name(row[columns["package"]]), []).append(
+                    (row[columns["date"]][:10], category, row[columns["downloads"]])
+                )
+        for package, package_rows in rows.items():
+            last_day = date.fromisoformat(max(day for day, _, _ in package_rows))
+            self.add(package, package_rows, fresh_until=last_day + timedelta(days=1))
+        return sum(len(package_rows) for package_rows in rows.values())
+
+    def stats(self, package: str) -> dict:
+        """The downloads of package, shaped like PyPIData._pypistats_json: the last
+        30 days and the last 180 days up to its last stored day.
+        Empty if there is no data about package."""
+        package = canonicalize_name(package)
+        with self._connect() as connection:
+            (last_day,) = connection.execute(
+                "SELECT MAX(date) FROM downloads WHERE package = ?", (package,)
+            ).fetchone()
+            if last_day is None:
+                return {}
+            last_day = date.fromisoformat(last_day)
+
+            def total(days, category):
+                first_day = last_day - timedelta(days=days - 1)
+                (downloads,) = connection.execute(
+                    "SELECT SUM(downloads) FROM downloads "
+                    "WHERE package = ? AND category = ? AND date >= ?",
+                    (package, category, first_day.isoformat()),
+                ).fetchone()
+                return downloads or 0
+
+            return {
+                "recent_downloads": {"last_month": total(30, "without_mirrors")},
+                "overall_downloads": {
+                    "with_mirrors": total(180, "with_mirrors"),
+                    "without_mirrors": total(180, "without_mirrors"),
+                },
+            }
+
+
+downloads_store = DownloadsStore()
@@ -13,7 +13,10 @@
 """Logging module."""
 
 import os
+import io
 import logging
+import threading
+from contextlib import contextmanager
 from typing import Tuple, List, Union
 import coloredlogs
 
@@ -41,6 +44,77 @@ coloredlogs.DEFAULT_FIELD_STYLES = {
 coloredlogs.install(fmt="%(asctime)s %(name)s %(levelname)s %(message)s", logger=logger)
 
 
+# worker thread -> the thread it works for (see log_as)
+_thread_parents = {}
+
+
+@contextmanager
+def log_as(thread_id: int):
+    """Inside the block, the log records of the current thread are handled as the
+    ones of thread_id (for example, written in its ThreadLogBuffer)"""
+    current = threading.get_ident()
+    previous = _thread_parents.get(current)
+    if thread_id != current:
+        _thread_parents[current] = thread_id
+    try:
+        yield
+    finally:
+        if previous is None:
+            _thread_parents.pop(current, None)
+        else:
+            _thread_parents[current] = previous
+
+
+class ThreadLogBuffer(logging.Filter):
+    """Diverts the log records of a thread into a buffer, instead of the log handlers.
+
+    Used when members are processed concurrently, so the output of each one
+    (prints and logs) can be printed in one go, in order, and inside its group:
+
+        log_buffer = ThreadLogBuffer(logger)
+        with log_buffer.capture() as output:  # in the worker thread
+            logger.info("this goes to output")
+
+    The records of the threads that work for it (see log_as) go there too.
+    """
+
+    def __init__(self, target_logger: logging.Logger):
+        super().__init__()
+        self._logger = target_logger
+        self._buffers = {}
+        self._lock = threading.Lock()
+        handlers = target_logger.handlers
+        self._formatter = handlers[0].formatter if handlers else logging.Formatter()
+
+    @contextmanager
+    def capture(self):
+        """Yields a StringIO with the log records of the current thread"""
+        buffer = io.StringIO()
+        thread_id = threading.get_ident()
+        with self._lock:
+            if not self._buffers:
+                self._logger.addFilter(self)
+            self._buffers[thread_id] = buffer
+        try:
+            yield buffer
+        finally:
+            with self._lock:
+                del self._buffers[thread_id]
+                if not self._buffers:
+                    self._logger.removeFilter(self)
+
+    def filter(self, record):
+        thread_id = record.thread
+        buffer = self._buffers.get(thread_id)
+        while buffer is None and thread_id in _thread_parents:
+            thread_id = _thread_parents[thread_id]
+            buffer = self._buffers.get(thread_id)
+        if buffer is None:
+            return True
+        buffer.write(self._formatter.format(record) + "\n")
+        return False
+
+
 def set_actions_output(outputs: List[Tuple[str, Union[str, bool, float, int]]]) -> None:
     """Sets output for GitHub actions.
 
@@ -0,0 +1,243 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Failed requests: remembered (NegativeCache), retried (backoff_delay) and
+stopped for the hosts that keep failing (CircuitBreaker)."""
+
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+
+from .error_handling import EcosystemError, logger
+
+# How long a failed GET is remembered, by status code or class (the code first).
+# A 0 is not remembered. The rate limits (429) are handled by the RateLimiter.
+NEGATIVE_CACHE_TTL = {
+    # GitHub answers 401/403 when a token is missing or rate limited
+    "401": timedelta(0),
+    "403": timedelta(0),
+    "404": timedelta(days=3),
+    "410": timedelta(days=7),
+    "429": timedelta(0),
+    "4xx": timedelta(hours=6),
+    # what is still failing after the retries
+    "5xx": timedelta(minutes=30),
+}
+# Tries of a request that gets a 5xx, or no response at all
+RETRY_ATTEMPTS = 3
+# The n-th retry waits a random time up to min(BACKOFF_MAX, BACKOFF_BASE * 2**n)
+BACKOFF_BASE = 2
+BACKOFF_MAX = 60
+# Failures in a row that open the circuit of a host, and for how many seconds
+CIRCUIT_THRESHOLD = 5
+CIRCUIT_COOLDOWN = 120
+
+
+def backoff_delay(attempt: int) -> float:
+    """Seconds to wait before the retry number `attempt` (from 0), with full jitter,
+    so the clients that failed together do not retry together"""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt))
+
+
+class NegativeCache:
+    """The failed GET requests, with their status, remembered for the time of its
+    class in `ttls` (see NEGATIVE_CACHE_TTL), so a missing resource is not
+    requested again on every run. Outside of `run()` it does nothing.
+
+    The entries are kept in `path` between runs. Their keys include the headers,
+    so a request with another token is not affected.
+    """
+
+    def __init__(self, path: str, ttls: dict[str, timedelta] | None = None):
+        self.path = Path(path)
+        self.ttls = dict(NEGATIVE_CACHE_TTL if ttls is None else ttls)
+        self.ttls |= NegativeCache.parse_ttls(os.getenv("ECOSYSTEM_NEGATIVE_CACHE_TTL"))
+        self.enabled = False
+        self.hits = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def parse_ttls(text: str | None) -> dict[str, timedelta]:
+        """Parses strings like "404=72,5xx=0" (in hours)"""
+        ttls = {}
+        for item in (text or "").split(","):
+            if not item.strip():
+                continue
+            status, _, hours = item.partition("=")
+            try:
+                ttls[status.strip().lower()] = timedelta(hours=float(hours))
+            except ValueError as error:
+                raise EcosystemError(f"invalid negative cache TTL: {item}") from error
+        return ttls
+
+    def ttl(self, status_code: int) -> float:
+        """Seconds to remember a response with status_code"""
+        ttl = self.ttls.get(str(status_code), self.ttls.get(f"{status_code // 100}xx"))
+        return ttl.total_seconds() if ttl else 0
+
+    @staticmethod
+    def key(url: str, headers: dict) -> str:
+        """The request, as a key (a hash, so the credentials are not stored)"""
+        request = json.dumps([url, sorted(headers.items())])
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    @contextmanager
+    def run(self):
+        """Remembers the failures inside the block, and saves them at the end (if
+        there are any, so runs without failures do not create the file)"""
+        self._load()
+        self.enabled = True
+        try:
+            yield self
+        finally:
+            self.enabled = False
+            if self.hits:
+                logger.info("%d known failures were not requested again", self.hits)
+            if self._entries:
+                self.save()
+
+    def _load(self):
+        try:
+            entries = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            entries = {}
+        except (OSError, ValueError) as error:
+            logger.warning("Ignoring the failures in %s: %s", self.path, error)
+            entries = {}
+        with self._lock:
+            self._entries = entries
+            self.hits = 0
+
+    def save(self):
+        """Writes the failures that are not expired yet"""
+        now = time.time()
+        with self._lock:
+            entries = {
+                key: entry
+                for key, entry in self._entries.items()
+                if entry["expires"] > now
+            }
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(entries, indent=1, sort_keys=True))
+        os.replace(tmp_path, self.path)
+
+    def get(self, key: str) -> dict | None:
+        """The remembered failure of the request, if any"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["expires"] <= time.time():
+                return None
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, url: str, response):
+        """Remembers a failed response to the request, if its status is cached"""
+        ttl = self.ttl(response.status_code)
+        if not self.enabled or ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = {
+                "url": url,
+                "status_code": response.status_code,
+                "reason": response.reason,
+                "expires": time.time() + ttl,
+            }
+
+
+class CircuitBreaker:
+    """Stops requesting a host that keeps failing. After `threshold` failures in a
+    row (5xx or no response), the requests to the host fail right away for
+    `cooldown` seconds; then one request is let through, and the circuit closes
+    if it succeeds. Outside of `run()` it does nothing.
+    """
+
+    def __init__(self, threshold: int = CIRCUIT_THRESHOLD, cooldown=CIRCUIT_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.enabled = False
+        self.rejected = 0
+        self._failures = {}  # host -> failures in a row
+        self._open_until = {}  # host -> time
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def run(self):
+        """Breaks the circuits inside the block, and closes them at the end"""
+        self.reset()
+        self.enabled = True
+        try:
+            yield self
+        finally:
+            self.enabled = False
+            if self.rejected:
+                logger.info("%d requests to failing hosts were not made", self.rejected)
+            self.reset()
+
+    def reset(self):
+        """Closes all the circuits"""
+        with self._lock:
+            self._failures = {}
+            self._open_until = {}
+            self.rejected = 0
+
+    def check(self, hostname: str):
+        """Raises EcosystemError if the circuit of hostname is open"""
+        if not self.enabled:
+            return
+        with self._lock:
+            open_until = self._open_until.get(hostname)
+            if open_until is None:
+                return
+            now = time.time()
+            if now >= open_until:
+                # half open: this request is the trial, the others keep failing
+                self._open_until[hostname] = now + self.cooldown
+                return
+            self.rejected += 1
+        raise EcosystemError(
+            f"{hostname} keeps failing, not requested for {open_until - now:.0f} secs"
+        )
+
+    def success(self, hostname: str):
+        """Closes the circuit of hostname"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._failures.pop(hostname, None)
+            self._open_until.pop(hostname, None)
+
+    def failure(self, hostname: str):
+        """Counts a failure, that opens the circuit of hostname after `threshold`"""
+        if not self.enabled:
+            return
+        with self._lock:
+            failures = self._failures[hostname] = self._failures.get(hostname, 0) + 1
+            if failures < self.threshold:
+                return
+            was_open = hostname in self._open_until
+            self._open_until[hostname] = time.time() + self.cooldown
+        if not was_open:
+            logger.warning(
+                "%s failed %d times in a row, not requested for %d secs",
+                hostname,
+                failures,
+                self.cooldown,
+            )
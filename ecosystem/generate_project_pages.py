@@ -19,8 +19,7 @@ import csv
 import mkdocs_gen_files
 
 from ecosystem.cli.members import CliMembers
-from ecosystem.docs.project_page import ProjectPage
-from ecosystem.docs.pypi_page import PypiPage
+from ecosystem.docs.render import render_members
 
 project_nav = mkdocs_gen_files.Nav()
 pypi_nav = mkdocs_gen_files.Nav()
@@ -28,32 +27,19 @@ pypi_nav = mkdocs_gen_files.Nav()
 active_projects = []
 active_pypi = []
 
-for project in CliMembers().dao.get_all(sort_key=lambda x: x.name_id):
-    project_page = ProjectPage(project, f"p/{project.short_uuid}.md")
-    project_page.write_page()
-    project_nav[project.name] = f"{project.short_uuid}.md"
-    if project.status != "Alumni":
-        active_projects.append(
-            {
-                "name": f"<a href='../p/{project.short_uuid}'>{project.name}</a>",
-                "status": project.status or "Active project",
-                "maturity": project.maturity,
-            }
-        )
-    if project.pypi:
-        for package in project.pypi.values():
-            pypi_page = PypiPage(package, project, f"pypi/{package.package_name}.md")
-            pypi_page.write_page()
-            pypi_nav[package.package_name] = f"{package.package_name}.md"
-            if project.status != "Alumni":
-                active_pypi.append(
-                    {
-                        "name": f"<a href='../pypi/{package.package_name}'>"
-                        f"{package.package_name}</a>",
-                        "status": project.status or "Active project",
-                        "maturity": project.maturity,
-                    }
-                )
+# The pages are rendered in worker processes (see ecosystem.docs.render),
+# but only written here, where mkdocs_gen_files can collect them
+for rendered in render_members(CliMembers().dao.get_all_dicts()):
+    for filename, content, edit_path in rendered["pages"]:
+        with mkdocs_gen_files.open(filename, "w") as page_file:
+            page_file.write(content)
+        mkdocs_gen_files.set_edit_path(filename, edit_path)
+    name, filename = rendered["project_nav"]
+    project_nav[name] = filename
+    for name, filename in rendered["pypi_nav"]:
+        pypi_nav[name] = filename
+    active_projects += rendered["active_projects"]
+    active_pypi += rendered["active_pypi"]
 
 with mkdocs_gen_files.open("p/SUMMARY.md", "w") as nav_file:
     nav_file.writelines(project_nav.build_literate_nav())
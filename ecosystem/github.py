@@ -12,21 +12,93 @@
 
 """GitHub section."""
 
+import json
+import os
 from re import match
-from functools import reduce
-from jsonpath import findall
 
 from .license import License
-from .serializable import JsonSerializable, parse_date
+from .serializable import JsonPathAttributes, JsonSerializable, parse_date
 from .error_handling import EcosystemError, logger
 from .request import (
     request_json,
+    fetch_all,
     parse_github_package_ids,
     parse_github_dependants,
     parse_github_contributors_sidebar,
     URL,
 )
 
+# How many dependents pages of a repository are fetched at the same time
+DEPENDENTS_CONCURRENCY = 4
+# How many repositories are fetched in a single GraphQL query (see GitHubData.prefetch)
+GRAPHQL_BATCH_SIZE = 50
+
+GRAPHQL_REPOSITORY_FRAGMENT = """
+fragment repositoryFields on Repository {
+    name
+    owner { login }
+    url
+    stargazerCount
+    homepageUrl
+    description
+    isPrivate
+    isArchived
+    isDisabled
+    pushedAt
+    licenseInfo { name spdxId }
+    issues(first: 1, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes { updatedAt }
+    }
+    pullRequests(first: 1, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes { updatedAt }
+    }
+}
+"""
+
+
+def graphql_repositories_query(owner_repos):
+    """A GraphQL query for many repositories, aliased as r0, r1, ..."""
+    repositories = "\n".join(
+        f"  r{index}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)})"
+        " { ...repositoryFields }"
+        for index, (owner, repo) in enumerate(owner_repos)
+    )
+    return f"query {{\n{repositories}\n}}\n{GRAPHQL_REPOSITORY_FRAGMENT}"
+
+
+def graphql_repository_to_rest(repository, metadata=None):
+    """Maps a GraphQL repository into the (subset of the) JSON responses of
+    api.github.com/repos/{owner}/{repo} and api.github.com/networks/{owner}/{repo}/events
+    that GitHubData uses. The last activity is the latest push, issue or pull request
+    update."""
+    metadata = metadata or {}
+    license_info = repository.get("licenseInfo")
+    json_repo = {
+        "name": repository["name"],
+        "owner": {"login": repository["owner"]["login"]},
+        "html_url": repository["url"],
+        "stargazers_count": repository["stargazerCount"],
+        "homepage": repository["homepageUrl"],
+        "description": repository["description"],
+        "private": repository["isPrivate"],
+        "archived": repository["isArchived"],
+        "disabled": repository["isDisabled"],
+        "pushed_at": repository["pushedAt"],
+        "license": (
+            {"name": license_info["name"], "spdx_id": license_info["spdxId"]}
+            if license_info
+            else None
+        ),
+    }
+    activity = [repository["pushedAt"]] + [
+        node["updatedAt"]
+        for connection in ("issues", "pullRequests")
+        for node in (repository.get(connection) or {}).get("nodes", [])
+    ]
+    activity = [date for date in activity if date]
+    json_events = {"data": [{"created_at": max(activity)}] if activity else []}
+    return json_repo | metadata, json_events | metadata
+
 
 class GitHubData(JsonSerializable):
     """
@@ -65,6 +137,9 @@ class GitHubData(JsonSerializable):
         "pushed_at": parse_date,
     }
     reduce = {}
+    json_attributes = JsonPathAttributes(aliases, json_types, reduce)
+    # (owner, repo) in lower case -> (json_repo, json_events), see GitHubData.prefetch
+    prefetched = {}
 
     def __init__(self, owner: str, repo: str, tree: str = None, **kwargs):
         self.owner = owner
@@ -72,9 +147,11 @@ class GitHubData(JsonSerializable):
         self.tree = tree
         self._kwargs = kwargs or {}
         self._json_repo = None
+        self._json_values = (None, {})
         self._json_events = None
         self._json_package_ids = None
         self._json_dependants = None
+        self._total_dependents = None
         self._json_contributors_sidebar = None
 
     def to_dict(self, keys=None) -> dict:
@@ -116,6 +193,47 @@ class GitHubData(JsonSerializable):
 
         return GitHubData(owner=owner, repo=repo, tree=tree_path)
 
+    @classmethod
+    def prefetch(cls, github_datas, batch_size=GRAPHQL_BATCH_SIZE, token=None) -> int:
+        """
+        Fetches the repository metadata of many repositories with a GraphQL query per
+        batch_size of them. The next update_json of each one uses it, instead of
+        requesting api.github.com/repos/... and api.github.com/networks/.../events.
+        The GraphQL API requires a token (GH_TOKEN), so without it, nothing is
+        prefetched. Returns how many repositories were prefetched.
+        """
+        owner_repos = list(
+            dict.fromkeys((gh.owner, gh.repo) for gh in github_datas if gh is not None)
+        )
+        token = os.getenv("GH_TOKEN") if token is None else token
+        if not owner_repos:
+            return 0
+        if not token:
+            logger.info("No GH_TOKEN, so no GraphQL prefetch")
+            return 0
+        prefetched = 0
+        for start in range(0, len(owner_repos), batch_size):
+            batch = owner_repos[start : start + batch_size]
+            try:
+                response = request_json(
+                    "api.github.com/graphql",
+                    post={"query": graphql_repositories_query(batch)},
+                    token=token,
+                )
+            except EcosystemError as exc:
+                logger.warning("GraphQL prefetch failed, using REST: %s", exc)
+                continue
+            metadata = {k: v for k, v in response.items() if k.startswith("__")}
+            data = response.get("data") or {}
+            for index, (owner, repo) in enumerate(batch):
+                # missing repositories come as None (and an "errors" entry)
+                if data.get(f"r{index}"):
+                    cls.prefetched[(owner.lower(), repo.lower())] = (
+                        graphql_repository_to_rest(data[f"r{index}"], metadata)
+                    )
+                    prefetched += 1
+        return prefetched
+
     def update_json(self):
         """
         Fetches remote data from:
@@ -123,12 +241,20 @@ class GitHubData(JsonSerializable):
           - github.com/{self.owner}/{self.repo}/network/dependents
           - github.com/{self.owner}/{self.repo}
           - api.github.com/networks/{self.owner}/{self.repo}/events
-
+        The first and last ones come from GitHubData.prefetch, if prefetched.
         """
-        self._json_repo = request_json(f"api.github.com/repos/{self.owner}/{self.repo}")
-        self._json_events = request_json(
-            f"api.github.com/networks/{self.owner}/{self.repo}/events"
+        prefetched = GitHubData.prefetched.pop(
+            (self.owner.lower(), self.repo.lower()), None
         )
+        if prefetched:
+            self._json_repo, self._json_events = prefetched
+        else:
+            self._json_repo = request_json(
+                f"api.github.com/repos/{self.owner}/{self.repo}"
+            )
+            self._json_events = request_json(
+                f"api.github.com/networks/{self.owner}/{self.repo}/events"
+            )
         self._json_contributors_sidebar = request_json(
             f"github.com/{self.owner}/{self.repo}/contributors_list?deferred=true",
             parser=parse_github_contributors_sidebar,
@@ -142,35 +268,48 @@ class GitHubData(JsonSerializable):
             for v, k in self._json_package_ids.items()
             if isinstance(v, str) and not v.startswith("__")
         }
-        self._json_dependants = {}
-        for package, package_id in self._json_package_ids.items():
-            try:
-                self._json_dependants[package] = request_json(
-                    f"github.com/{self.owner}/{self.repo}/network/dependents?"
+        self.update_dependants()
+
+    def update_dependants(self):
+        """
+        Fetches github.com/{self.owner}/{self.repo}/network/dependents for each
+        package id, concurrently, and sums up the dependents of all of them.
+        The packages that could not be fetched are reported in a single warning.
+        """
+        results = fetch_all(
+            {
+                package: {
+                    "url": f"github.com/{self.owner}/{self.repo}/network/dependents?"
                     f"dependent_type=REPOSITORY&package_id={package_id}",
-                    parser=parse_github_dependants,
-                )
-            except EcosystemError:
-                logger.warning("json_dependants could not be updated")
+                    "parser": parse_github_dependants,
+                }
+                for package, package_id in self._json_package_ids.items()
+            },
+            max_workers=DEPENDENTS_CONCURRENCY,
+        )
+        self._json_dependants = {
+            package: result
+            for package, result in results.items()
+            if not isinstance(result, Exception)
+        }
+        failed = {k: v for k, v in results.items() if k not in self._json_dependants}
+        if failed:
+            logger.warning(
+                "json_dependants of %d out of %d packages could not be updated: %s",
+                len(failed),
+                len(results),
+                "; ".join(f"{package}: {error}" for package, error in failed.items()),
+            )
+        self._total_dependents = None
+        if self._json_dependants:
+            self._total_dependents = {
+                key: sum(r.get(key, 0) for r in self._json_dependants.values())
+                for key in ["repositories", "packages"]
+            }
 
     def __getattr__(self, item):
         if self._json_repo:
-            if item in GitHubData.aliases:
-                item = GitHubData.aliases[item]
-
-            json_elements = findall(item, self._json_repo)
-            if item in GitHubData.json_types:
-                json_elements = [GitHubData.json_types[item](e) for e in json_elements]
-
-            if len(json_elements) == 1:
-                return json_elements[0]
-
-            if len(json_elements) >= 2:
-                return reduce(GitHubData.reduce[item], json_elements)
-
-            raise AttributeError(
-                f"'{type(self).__name__}' object has no " f"attribute '{item}'"
-            )
+            return GitHubData.json_attributes.get(self, self._json_repo, item)
 
         if item in self._kwargs:
             return self._kwargs[item]
@@ -214,15 +353,15 @@ class GitHubData(JsonSerializable):
     @property
     def total_dependent_repositories(self):
         """Sum of repository dependants"""
-        if self.dependants():
-            return sum(r.get("repositories", 0) for r in self.dependants().values())
+        if self._total_dependents:
+            return self._total_dependents["repositories"]
         return self._kwargs.get("total_dependent_repositories")
 
     @property
     def total_dependent_packages(self):
         """Sum of package dependants"""
-        if self.dependants():
-            return sum(r.get("packages", 0) for r in self.dependants().values())
+        if self._total_dependents:
+            return self._total_dependents["packages"]
         return self._kwargs.get("total_dependent_packages")
 
     @property
@@ -12,20 +12,146 @@
 
 """Julia section."""
 
-from functools import reduce
 from urllib.parse import ParseResult
 from datetime import datetime
-from io import BytesIO
+import json
+import os
+import threading
 
 
 import tomllib
 
-from jsonpath import findall
 
 from .license import License
-from .serializable import JsonSerializable
-from .error_handling import EcosystemError
-from .request import request_json, URL, parse_juliapackages, find_first_in_csv_gz
+from .serializable import JsonPathAttributes, JsonSerializable
+from .error_handling import EcosystemError, logger
+from .request import request_json, fetch_all, URL, parse_juliapackages, CsvGzIndex
+
+
+def parse_nothing(_):
+    """Parses a page that is only checked for existence"""
+    return {}
+
+
+def parse_commit_sha(text):
+    """Parses a commit requested as application/vnd.github.sha"""
+    return {"sha": text.strip()}
+
+
+class PackageRequests:
+    """The Julia package download stats, package_requests.csv.gz (100+ MB), indexed
+    by (package_uuid, client_type, status) in an on-disk CsvGzIndex.
+    It is fetched at most once per run and shared by all the JuliaData objects.
+    See https://discourse.julialang.org/t/announcing-package-download-stats/69073
+    """
+
+    url = (
+        "https://julialang-logs.s3.amazonaws.com/public_outputs/"
+        "current/package_requests.csv.gz"
+    )
+    db_path = "_ecosystem_package_requests.sqlite"
+    _index = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def find_first(cls, subdict_to_find: dict) -> dict:
+        """The first row matching subdict_to_find, see CsvGzIndex.find_first"""
+        with cls._lock:
+            if cls._index is None:
+                index = CsvGzIndex(
+                    cls.db_path, ["package_uuid", "client_type", "status"]
+                )
+                request_json(cls.url, parser=index.update, stream=True)
+                cls._index = index
+        return cls._index.find_first(subdict_to_find)
+
+    @classmethod
+    def reset(cls):
+        """Forgets the index of this run, so the next run fetches the file again"""
+        with cls._lock:
+            cls._index = None
+
+
+class GeneralRegistry:
+    """The Julia General registry, indexed by package name as name -> (uuid, path).
+    The index is built at most once per run and persisted in index_path, keyed by
+    the registry commit, so it is only rebuilt when the registry changes.
+    The checks for https://github.com/JuliaRegistries/General/tree/master/<path>
+    are also done once per run, concurrently for all the paths in check_trees.
+    """
+
+    commit_url = "api.github.com/repos/JuliaRegistries/General/commits/master"
+    registry_url = (
+        "https://raw.githubusercontent.com/JuliaRegistries/"
+        "General/{ref}/Registry.toml"
+    )
+    tree_url = "https://github.com/JuliaRegistries/General/tree/master/{path}"
+    index_path = "_ecosystem_general_registry.json"
+    _packages = None
+    _trees = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def lookup(cls, package_name: str) -> tuple[str, str] | None:
+        """The (uuid, path) of package_name in the registry, or None"""
+        with cls._lock:
+            if cls._packages is None:
+                cls._packages = cls._load_index()
+        return cls._packages.get(package_name)
+
+    @classmethod
+    def check_trees(cls, paths) -> dict[str, bool]:
+        """For each registry path, if its GitHub tree URL responds with 2xx"""
+        paths = list(dict.fromkeys(paths))
+        with cls._lock:
+            missing = [path for path in paths if path not in cls._trees]
+            results = fetch_all(
+                {
+                    path: {
+                        "url": cls.tree_url.format(path=path),
+                        "parser": parse_nothing,
+                    }
+                    for path in missing
+                }
+            )
+            for path, result in results.items():
+                cls._trees[path] = not isinstance(result, Exception)
+            return {path: cls._trees[path] for path in paths}
+
+    @classmethod
+    def reset(cls):
+        """Forgets the index and tree checks of this run"""
+        with cls._lock:
+            cls._packages = None
+            cls._trees = {}
+
+    @classmethod
+    def _load_index(cls) -> dict:
+        try:
+            commit = request_json(
+                cls.commit_url,
+                headers={"Accept": "application/vnd.github.sha"},
+                parser=parse_commit_sha,
+            )["sha"]
+        except EcosystemError as exc:
+            logger.warning("Cannot get the General registry commit: %s", exc)
+            commit = None
+        if commit and os.path.exists(cls.index_path):
+            with open(cls.index_path, encoding="utf-8") as index_file:
+                index = json.load(index_file)
+            if index.get("commit") == commit:
+                return {name: tuple(pkg) for name, pkg in index["packages"].items()}
+        registry = request_json(
+            cls.registry_url.format(ref=commit or "refs/heads/master"),
+            parser=tomllib.loads,
+        )
+        packages = {}
+        for uuid, pkg in registry["packages"].items():
+            packages.setdefault(pkg["name"], (uuid, pkg["path"]))
+        if commit:
+            with open(cls.index_path, "w", encoding="utf-8") as index_file:
+                json.dump({"commit": commit, "packages": packages}, index_file)
+        return packages
 
 
 class JuliaData(JsonSerializable):
@@ -57,6 +183,7 @@ class JuliaData(JsonSerializable):
         "license": lambda x: License(x) if x else None,
     }
     reduce = {}
+    json_attributes = JsonPathAttributes(aliases, json_types, reduce)
 
     def __init__(
         self,
@@ -71,9 +198,10 @@ class JuliaData(JsonSerializable):
         self._juliahub_url = None
 
         self.juliapackages_url = juliapackages_url
-        self.general_registry_url = None
+        self.general_registry_url = self._kwargs.pop("general_registry_url", None)
 
         self._juliahub_json = None
+        self._json_values = (None, {})
         self._juliapackages_json = None
         self._package_requests_json = None
         self._juliapkgstats_json = None
@@ -116,6 +244,25 @@ class JuliaData(JsonSerializable):
             return None
         return JuliaData(package_name=package_name, registry=registry)
 
+    @staticmethod
+    def prefetch(julia_datas):
+        """
+        Checks the General registry tree URLs of many JuliaData objects at once,
+        so their get_general_registry_url does not need to request them one by one.
+        """
+        paths = []
+        try:
+            for julia_data in julia_datas:
+                if julia_data.registry == "General" and julia_data.package_name:
+                    pkg = GeneralRegistry.lookup(julia_data.package_name)
+                    if pkg is not None:
+                        paths.append(pkg[1])
+        except EcosystemError as exc:
+            logger.warning("Cannot prefetch the General registry: %s", exc)
+            return
+        if paths:
+            GeneralRegistry.check_trees(paths)
+
     def update_json(self):
         """
         Fetches remote json data from:
@@ -142,21 +289,12 @@ class JuliaData(JsonSerializable):
             if "juliahub_url" in self._kwargs:
                 del self._kwargs["juliahub_url"]
         if self.uuid:
-            # see https://discourse.julialang.org/t/announcing-package-download-stats/69073
-            url = (
-                "https://julialang-logs.s3.amazonaws.com/public_outputs/"
-                "current/package_requests.csv.gz"
-            )
-            self._package_requests_json = request_json(
-                url,
-                parser=find_first_in_csv_gz(
-                    {
-                        "package_uuid": self.uuid,
-                        "statuses": ["200", "302", "301"],
-                        "client_type": "user",
-                    }
-                ),
-                content_handler=BytesIO,
+            self._package_requests_json = PackageRequests.find_first(
+                {
+                    "package_uuid": self.uuid,
+                    "statuses": ["200", "302", "301"],
+                    "client_type": "user",
+                }
             )
         self.get_general_registry_url()
         try:
@@ -187,22 +325,7 @@ class JuliaData(JsonSerializable):
 
     def __getattr__(self, item):
         if self._juliahub_json:
-            if item in JuliaData.aliases:
-                item = JuliaData.aliases[item]
-
-            json_elements = findall(item, self._juliahub_json)
-            if item in JuliaData.json_types:
-                json_elements = [JuliaData.json_types[item](e) for e in json_elements]
-
-            if len(json_elements) == 1:
-                return json_elements[0]
-
-            if len(json_elements) >= 2:
-                return reduce(JuliaData.reduce[item], json_elements)
-
-            raise AttributeError(
-                f"'{type(self).__name__}' object has no " f"attribute '{item}'"
-            )
+            return JuliaData.json_attributes.get(self, self._juliahub_json, item)
 
         if item in self._kwargs:
             return self._kwargs[item]
@@ -221,27 +344,19 @@ class JuliaData(JsonSerializable):
 
     def get_general_registry_url(self):
         """updates general_registry_url if exists and returns 2xx. Otherwise, nothing"""
-        if self.registry == "General":
-            registry = request_json(
-                "https://raw.githubusercontent.com/JuliaRegistries/"
-                "General/refs/heads/master/Registry.toml",
-                parser=tomllib.loads,
-            )
-        else:
+        if self.registry != "General":
             return None
-        for pkg in registry["packages"].values():
-            if pkg["name"] == self.package_name:
-                dirname = pkg["path"]
-                break
-        else:
+        pkg = GeneralRegistry.lookup(self.package_name)
+        if pkg is None:
             return None
-        url = f"https://github.com/JuliaRegistries/General/tree/master/{dirname}"
-        try:
-            empty = request_json(url, parser=lambda x: {})
-            if empty == {}:
-                self.general_registry_url = URL(url)
-        except EcosystemError:
+        dirname = pkg[1]
+        if GeneralRegistry.check_trees([dirname])[dirname]:
+            self.general_registry_url = URL(
+                GeneralRegistry.tree_url.format(path=dirname)
+            )
+        else:
             self.general_registry_url = None
+        return None
 
     @property
     def estimated_unique_users(self):
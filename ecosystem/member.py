@@ -12,6 +12,7 @@
 
 """Submission model."""
 
+from copy import deepcopy
 import pprint
 from uuid import uuid4
 from slugify import slugify
@@ -19,7 +20,7 @@ from slugify import slugify
 from .error_handling import EcosystemError
 from .julia import JuliaData
 from .license import License
-from .serializable import JsonSerializable, parse_date
+from .serializable import JsonSerializable, Lazy, LazyAttribute, parse_date
 from .github import GitHubData
 from .pypi import PyPIData
 from .check import CheckData
@@ -28,9 +29,65 @@ from .request import URL
 from .validation import validate_member
 
 
+def _build_badge(raw):
+    return BadgeData(url=raw) if isinstance(raw, str) else BadgeData.from_dict(raw)
+
+
+def _build_license(raw):
+    return License(raw, where="user")
+
+
+def _build_packages(raw):
+    return [URL(p) for p in raw]
+
+
+def _build_checks(raw):
+    return {id_: CheckData(id_, **kwargs) for id_, kwargs in raw.items()}
+
+
+def _build_julia(raw):
+    return {
+        name: JuliaData.from_dict({"package_name": name} | julia_dict)
+        for name, julia_dict in raw.items()
+    }
+
+
+def _build_pypi(raw):
+    return {
+        name: PyPIData.from_dict({"package_name": name} | pypi_dict)
+        for name, pypi_dict in raw.items()
+    }
+
+
 class Member(JsonSerializable):  # pylint: disable=too-many-instance-attributes
     """main Members class that represent a single entry in the Ecosystem."""
 
+    # Attributes that from_dict builds on first access, from the raw TOML data
+    lazy_builders = {
+        "url": URL,
+        "license": _build_license,
+        "website": URL,
+        "reference_paper": URL,
+        "documentation": URL,
+        "packages": _build_packages,
+        "badge": _build_badge,
+        "checks": _build_checks,
+        "github": GitHubData.from_dict,
+        "pypi": _build_pypi,
+        "julia": _build_julia,
+    }
+    url = LazyAttribute()
+    license = LazyAttribute()
+    website = LazyAttribute()
+    reference_paper = LazyAttribute()
+    documentation = LazyAttribute()
+    packages = LazyAttribute()
+    badge = LazyAttribute()
+    checks = LazyAttribute()
+    github = LazyAttribute()
+    pypi = LazyAttribute()
+    julia = LazyAttribute()
+
     def __init__(  # pylint: disable=too-many-arguments, too-many-locals
         self,
         name: str,
@@ -108,7 +165,9 @@ class Member(JsonSerializable):  # pylint: disable=too-many-instance-attributes
 
     @classmethod
     def from_dict(cls, dictionary: dict):
-        """Transform dictionary to Member.
+        """Transform dictionary to Member. The sections in Member.lazy_builders
+        are only built (from a copy of their data) when they are first read,
+        and dictionary is not modified.
 
         Args:
             dictionary: dict object
@@ -116,40 +175,16 @@ class Member(JsonSerializable):  # pylint: disable=too-many-instance-attributes
         Return: Member
         """
         submission_fields = vars(Member)["__static_attributes__"]
-        filtered_dict = {k: v for k, v in dictionary.items() if k in submission_fields}
-
-        if "badge" in filtered_dict:
-            filtered_dict["badge"] = (
-                BadgeData(url=filtered_dict["badge"])
-                if isinstance(filtered_dict["badge"], str)
-                else BadgeData.from_dict(filtered_dict["badge"])
-            )
-
-        if "github" in filtered_dict:
-            filtered_dict["github"] = GitHubData.from_dict(filtered_dict["github"])
-
-        if "julia" in filtered_dict:
-            for project_name, julia_dict in filtered_dict["julia"].items():
-                julia_data = JuliaData.from_dict(
-                    {"package_name": project_name} | julia_dict
-                )
-                filtered_dict["julia"][project_name] = julia_data
-
-        if "pypi" in filtered_dict:
-            for project_name, pypi_dict in filtered_dict["pypi"].items():
-                pypi_data = PyPIData.from_dict(
-                    {"package_name": project_name} | pypi_dict
-                )
-                filtered_dict["pypi"][project_name] = pypi_data
-        if "packages" in filtered_dict:
-            filtered_dict["packages"] = [URL(p) for p in filtered_dict["packages"]]
-        if "checks" in filtered_dict:
-            filtered_dict["checks"] = {
-                id_: CheckData(id_, **kwargs)
-                for id_, kwargs in filtered_dict["checks"].items()
-            }
-        if "license" in filtered_dict and filtered_dict["license"] is not None:
-            filtered_dict["license"] = License(filtered_dict["license"], where="user")
+        filtered_dict = {}
+        for key, value in dictionary.items():
+            if key not in submission_fields:
+                continue
+            if key in Member.lazy_builders and value is not None:
+                filtered_dict[key] = Lazy(Member.lazy_builders[key], value)
+            elif isinstance(value, (list, dict)):
+                filtered_dict[key] = deepcopy(value)
+            else:
+                filtered_dict[key] = value
         return Member(**filtered_dict)
 
     def to_dict(self, keys=None) -> dict:
@@ -302,13 +337,16 @@ class Member(JsonSerializable):  # pylint: disable=too-many-instance-attributes
             if hasattr(check, "xfailed") and check.xfailed
         ]
 
-    def update_checkups(self, checker=None):
-        """Runs validation tests and updates the check-ups sections"""
+    def update_checkups(self, checker=None, report=None):
+        """Runs validation tests and updates the check-ups sections.
+        If a report (from validate_members) is given, it is used instead."""
         checkups = {}
-        if checker is None:
-            report = validate_member(self, verbose_level="-q")
-        else:
-            report = validate_member(self, verbose_level="-v", tests_to_run=checker)
+        if report is None:
+            report = validate_member(
+                self,
+                verbose_level="-q" if checker is None else "-v",
+                tests_to_run=checker,
+            )
 
         if report.internalerror:
             raise ExceptionGroup(
@@ -12,20 +12,22 @@
 
 """PyPI section."""
 
-from functools import reduce, cached_property
+from bisect import bisect_left, bisect_right
+from functools import cached_property
 from re import match
 from os import path
 import json
+import threading
 
 from packaging.requirements import Requirement
 from packaging.utils import canonicalize_name
 from packaging.specifiers import SpecifierSet
 from packaging.version import Version
 
-from jsonpath import findall
 
 from .license import License
-from .serializable import JsonSerializable, parse_date
+from .serializable import JsonPathAttributes, JsonSerializable, parse_date
+from .downloads import downloads_store
 from .error_handling import EcosystemError, logger
 from .request import request_json
 
@@ -59,16 +61,18 @@ class PyPIData(JsonSerializable):  # pylint: disable=too-many-public-methods
         "description": "info.summary",
         "development_status": "info.classifiers[?('Development Status' in @)]",
     }
-    # runs on each findall element
+    # runs on each jsonpath match
     json_types = {
         "info.classifiers[?('Development Status' in @)]": lambda x: x.split(" :: ")[-1]
     }
-    reduce = {}  # if findall returns more than one element
+    reduce = {}  # if the query has more than one match
+    json_attributes = JsonPathAttributes(aliases, json_types, reduce)
 
     def __init__(self, package_name: str, **kwargs):
         self.package_name = canonicalize_name(package_name, validate=True)
         self._kwargs = kwargs or {}
         self._pypi_json = None
+        self._json_values = (None, {})
         self._pypi_simple_json = None
         self._pypistats_json = None
         self._all_qiskit_versions = None
@@ -135,22 +139,7 @@ class PyPIData(JsonSerializable):  # pylint: disable=too-many-public-methods
 
     def __getattr__(self, item):
         if self._pypi_json:
-            if item in PyPIData.aliases:
-                item = PyPIData.aliases[item]
-
-            json_elements = findall(item, self._pypi_json)
-            if item in PyPIData.json_types:
-                json_elements = [PyPIData.json_types[item](e) for e in json_elements]
-
-            if len(json_elements) == 1:
-                return json_elements[0]
-
-            if len(json_elements) >= 2:
-                return reduce(PyPIData.reduce[item], json_elements)
-
-            raise AttributeError(
-                f"'{type(self).__name__}' object has no " f"attribute '{item}'"
-            )
+            return PyPIData.json_attributes.get(self, self._pypi_json, item)
 
         if item in self._kwargs:
             return self._kwargs[item]
@@ -203,37 +192,9 @@ class PyPIData(JsonSerializable):  # pylint: disable=too-many-public-methods
 
     def all_qiskit_versions(self, force_update=False):
         """Returns a dictionary with all the Qiskit releases,
-        with version numbers as key and extra data"""
-        dir_path = path.dirname(path.realpath(__file__))
-        all_qiskit_versions_json = path.join(dir_path, "all_qiskit_versions.json")
-        if force_update:
-            qiskit_json = request_json("pypi.org/pypi/qiskit/json")
-            str_versions = findall("$.releases.~", qiskit_json)
-            self._all_qiskit_versions = {}
-            for str_version in str_versions:
-                str_dates = findall(
-                    f'$.releases["{str_version}"].*.upload_time_iso_8601', qiskit_json
-                )
-                if not str_dates:
-                    raise EcosystemError(f"Qiskit {str_version} has no release?")
-                last_date = max(parse_date(d) for d in str_dates)
-                self._all_qiskit_versions[str_version] = {"upload_at": last_date}
-            with open(all_qiskit_versions_json, "w") as json_file:
-                json.dump(self._all_qiskit_versions, json_file, indent=4, default=str)
-
-        if self._all_qiskit_versions is None:
-            try:
-                with open(all_qiskit_versions_json) as data_file:
-                    versions_dates_dict = json.load(data_file)
-            except FileNotFoundError:
-                logger.warning(
-                    "%s not found. Getting it back fom PyPI.", all_qiskit_versions_json
-                )
-                return self.all_qiskit_versions(force_update=True)
-            self._all_qiskit_versions = {
-                k: {"upload_at": parse_date(v["upload_at"])}
-                for k, v in versions_dates_dict.items()
-            }
+        with version numbers as key and extra data.
+        See QiskitReleases.shared"""
+        self._all_qiskit_versions = QiskitReleases.shared(force_update=force_update)
         return self._all_qiskit_versions
 
     def compatible_with_qiskit(self, major: int):
@@ -282,48 +243,34 @@ class PyPIData(JsonSerializable):  # pylint: disable=too-many-public-methods
                 self._kwargs["highest_supported_qiskit_release_date"],
             )
 
-        qiskit_specifier = SpecifierSet(self.requires_qiskit)
-        all_qiskit_versions = sorted(
-            self.all_qiskit_versions().items(),
-            key=lambda x: Version(x[0]),
-            reverse=True,
+        all_qiskit_versions = self.all_qiskit_versions()
+        if not isinstance(all_qiskit_versions, QiskitReleases):
+            all_qiskit_versions = QiskitReleases(all_qiskit_versions)
+        qiskit_version = all_qiskit_versions.highest_in(
+            SpecifierSet(self.requires_qiskit)
         )
-        for qiskit_version, version_data in all_qiskit_versions:
-            if qiskit_specifier.contains(qiskit_version):
-                return qiskit_version, version_data["upload_at"]
-        return None
+        if qiskit_version is None:
+            return None
+        return qiskit_version, all_qiskit_versions[qiskit_version]["upload_at"]
 
     def request_pypistats(self):
-        """uses pypistats to get stats about python package"""
-        getters = ["recent", "overall"]
-        ret = {}
-        for getter in getters:
+        """Downloads stats of the package, from the downloads store. Once a day, the
+        store is updated with https://pypistats.org/api/packages/<package>/overall
+        (the last 180 days, per day and category)."""
+        if not downloads_store.is_fresh(self.package_name):
             try:
                 raw_data = request_json(
-                    f"https://pypistats.org/api/packages/{self.package_name}/{getter}",
-                    delay=3,
+                    f"https://pypistats.org/api/packages/{self.package_name}/overall"
                 )
             except EcosystemError as err:
                 if "Not Found (404)" in err.message:
-                    return ret
+                    return {}
                 raise err
-
-            if isinstance(raw_data["data"], list):
-                ret[raw_data["type"]] = {
-                    "with_mirrors": sum(
-                        i["downloads"]
-                        for i in raw_data["data"]
-                        if i["category"] == "with_mirrors"
-                    ),
-                    "without_mirrors": sum(
-                        i["downloads"]
-                        for i in raw_data["data"]
-                        if i["category"] == "without_mirrors"
-                    ),
-                }
-            else:
-                ret[raw_data["type"]] = raw_data["data"]
-        return ret
+            downloads_store.add(
+                self.package_name,
+                ((i["date"], i["category"], i["downloads"]) for i in raw_data["data"]),
+            )
+        return downloads_store.stats(self.package_name)
 
     @property
     def last_month_downloads(self):
@@ -388,3 +335,103 @@ class PyPIData(JsonSerializable):  # pylint: disable=too-many-public-methods
         if self._pypi_simple_json:
             return self._pypi_simple_json.get("project-status", {}).get("status")
         return project_status or self._kwargs.get("status")
+
+
+class QiskitReleases(dict):
+    """The Qiskit releases in PyPI, as {version: {"upload_at": date}}.
+
+    There is a single, process-wide, instance (see `QiskitReleases.shared`) that is
+    fetched from PyPI at most once per run and shared by all the PyPIData objects.
+    The versions are kept sorted, so the highest version matching a specifier can be
+    found with a bisection instead of checking every release.
+    """
+
+    _shared = None
+    _fetched = False
+    _lock = threading.Lock()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._keys = sorted(self, key=Version)
+        self._versions = [Version(k) for k in self._keys]
+
+    @classmethod
+    def shared(cls, force_update=False) -> "QiskitReleases":
+        """The releases for this run. If force_update, makes sure they were fetched from
+        PyPI during this run. Otherwise, they might come from all_qiskit_versions.json
+        """
+        with cls._lock:
+            if force_update and not cls._fetched:
+                cls._shared = cls.fetch()
+            elif cls._shared is None:
+                try:
+                    cls._shared = cls.load()
+                    return cls._shared
+                except FileNotFoundError:
+                    logger.warning(
+                        "%s not found. Getting it back fom PyPI.", cls.json_path()
+                    )
+                    cls._shared = cls.fetch()
+            else:
+                return cls._shared
+            cls._fetched = True
+            return cls._shared
+
+    @classmethod
+    def reset(cls):
+        """Forgets the shared releases, so the next run starts from scratch"""
+        with cls._lock:
+            cls._shared = None
+            cls._fetched = False
+
+    @staticmethod
+    def json_path():
+        """Where the releases are cached between runs"""
+        dir_path = path.dirname(path.realpath(__file__))
+        return path.join(dir_path, "all_qiskit_versions.json")
+
+    @classmethod
+    def fetch(cls) -> "QiskitReleases":
+        """Gets the releases from pypi.org/pypi/qiskit/json and saves them in json_path"""
+        qiskit_json = request_json("pypi.org/pypi/qiskit/json")
+        releases = {}
+        for str_version, files in qiskit_json.get("releases", {}).items():
+            str_dates = [
+                f["upload_time_iso_8601"] for f in files if "upload_time_iso_8601" in f
+            ]
+            if not str_dates:
+                raise EcosystemError(f"Qiskit {str_version} has no release?")
+            releases[str_version] = {"upload_at": max(parse_date(d) for d in str_dates)}
+        with open(cls.json_path(), "w") as json_file:
+            json.dump(releases, json_file, indent=4, default=str)
+        return cls(releases)
+
+    @classmethod
+    def load(cls) -> "QiskitReleases":
+        """Reads the releases from json_path"""
+        with open(cls.json_path()) as data_file:
+            versions_dates_dict = json.load(data_file)
+        return cls(
+            {
+                k: {"upload_at": parse_date(v["upload_at"])}
+                for k, v in versions_dates_dict.items()
+            }
+        )
+
+    def highest_in(self, specifier: SpecifierSet) -> str | None:
+        """The highest release that satisfies the specifier, None if none does.
+
+        Releases above the upper bounds (`<` and `<=`) of the specifier are skipped
+        with a bisection, and the rest are checked from the highest one down.
+        PyPI does not accept local versions, so the order of the releases and the
+        upper bounds agree."""
+        upper = len(self._versions)
+        for spec in specifier:
+            if spec.operator == "<":
+                upper = min(upper, bisect_left(self._versions, Version(spec.version)))
+            elif spec.operator == "<=":
+                upper = min(upper, bisect_right(self._versions, Version(spec.version)))
+        for index in range(upper - 1, -1, -1):
+            if specifier.contains(self._keys[index]):
+                return self._keys[index]
+        return None
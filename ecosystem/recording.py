@@ -0,0 +1,237 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Record and replay of the HTTP exchanges of request_json.
+
+    ECOSYSTEM_RECORD=exchanges/ python manager.py ci update_member_data
+    ECOSYSTEM_REPLAY=exchanges/ python manager.py ci update_member_data
+
+The archive is a directory with an index.json (request -> response metadata)
+and the gzipped response bodies in objects/, named by their sha256, so the
+same body is stored once. Credentials are never recorded.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+import gzip
+import hashlib
+import json
+import os
+import threading
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .error_handling import logger
+
+# Request headers that select a different response for the same URL
+KEY_HEADERS = ["Accept"]
+# Response headers that are not kept
+DROPPED_HEADERS = {"set-cookie", "authorization"}
+
+
+class ExchangeArchive:
+    """The exchanges of request_json, recorded to or replayed from a directory.
+
+    When replaying, the requests are served from the archive (and a request
+    that is not in it raises requests.ConnectionError, as if offline), marked as
+    cached, so nothing waits for rate limits.
+    """
+
+    def __init__(self):
+        self.path = None
+        self.mode = None  # None, "record" or "replay"
+        self._index = {}
+        self._lock = threading.Lock()
+
+    @property
+    def replaying(self) -> bool:
+        """If the requests are served from the archive"""
+        return self.mode == "replay"
+
+    @contextmanager
+    def from_env(self):
+        """Records to $ECOSYSTEM_RECORD or replays from $ECOSYSTEM_REPLAY (a
+        directory) inside the block, if any of them is set"""
+        if os.getenv("ECOSYSTEM_REPLAY"):
+            with self.replay(os.getenv("ECOSYSTEM_REPLAY")):
+                yield self
+        elif os.getenv("ECOSYSTEM_RECORD"):
+            with self.record(os.getenv("ECOSYSTEM_RECORD")):
+                yield self
+        else:
+            yield self
+
+    @contextmanager
+    def record(self, path):
+        """Records the exchanges inside the block into the archive in path (the
+        exchanges already there are kept, unless they are done again)"""
+        self._open(path, "record")
+        try:
+            yield self
+        finally:
+            self.save()
+            logger.info("%d exchanges recorded in %s", len(self._index), self.path)
+            self._close()
+
+    @contextmanager
+    def replay(self, path):
+        """Serves the requests inside the block from the archive in path"""
+        self._open(path, "replay")
+        if not self._index:
+            logger.warning("No exchanges to replay in %s", self.path)
+        try:
+            yield self
+        finally:
+            self._close()
+
+    def _open(self, path, mode):
+        self.path = Path(path)
+        index_path = self.path / "index.json"
+        self._index = json.loads(index_path.read_text()) if index_path.exists() else {}
+        self.mode = mode
+
+    def _close(self):
+        self.path = None
+        self.mode = None
+        self._index = {}
+
+    def save(self):
+        """Writes the index of the archive"""
+        with self._lock:
+            index = json.dumps(self._index, indent=1, sort_keys=True)
+        self.path.mkdir(parents=True, exist_ok=True)
+        (self.path / "index.json").write_text(index)
+
+    @staticmethod
+    def key(method: str, url: str, headers: dict, body) -> str:
+        """The request, as a key of the index"""
+        request = [method, url] + [headers.get(name) for name in KEY_HEADERS]
+        if body is not None:
+            request.append(json.dumps(body, sort_keys=True))
+        return hashlib.sha256(json.dumps(request).encode()).hexdigest()
+
+    def _object_path(self, digest: str) -> Path:
+        return self.path / "objects" / f"{digest}.gz"
+
+    def session(self, session):
+        """The stand-in for session: it records or replays, if enabled"""
+        if self.mode == "record":
+            return RecordingSession(self, session)
+        if self.mode == "replay":
+            return ReplayingSession(self)
+        return session
+
+    def put(self, method: str, url: str, headers: dict, body, response):
+        """Stores the exchange (the last one of each request wins)"""
+        content = response.content or b""
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = object_path.with_suffix(f".{threading.get_ident()}.tmp")
+            temp_path.write_bytes(gzip.compress(content, mtime=0))
+            os.replace(temp_path, object_path)
+        created_at = getattr(response, "created_at", None)
+        entry = {
+            "method": method,
+            "url": url,
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in DROPPED_HEADERS
+            },
+            "response_url": response.url,
+            "created_at": (
+                created_at.isoformat() if isinstance(created_at, datetime) else None
+            ),
+            "content": digest,
+        }
+        with self._lock:
+            self._index[ExchangeArchive.key(method, url, headers, body)] = entry
+
+    def get(self, method: str, url: str, headers: dict, body) -> requests.Response:
+        """The recorded response to the request"""
+        key = ExchangeArchive.key(method, url, headers, body)
+        with self._lock:
+            entry = self._index.get(key)
+        if entry is None:
+            raise requests.ConnectionError(f"{method} {url} is not in {self.path}")
+        response = requests.Response()
+        response.status_code = entry["status_code"]
+        response.reason = entry["reason"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.url = entry["response_url"]
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        # pylint: disable=protected-access
+        response._content = gzip.decompress(
+            self._object_path(entry["content"]).read_bytes()
+        )
+        response.created_at = (
+            datetime.fromisoformat(entry["created_at"]) if entry["created_at"] else None
+        )
+        response.from_cache = True
+        return response
+
+
+class RecordingSession:
+    """A session that stores every exchange in an ExchangeArchive"""
+
+    def __init__(self, archive: ExchangeArchive, session):
+        self.archive = archive
+        self.session = session
+
+    def _send(self, method, url, headers, body, **kwargs):
+        response = getattr(self.session, method.lower())(url, headers=headers, **kwargs)
+        self.archive.put(method, url, headers, body, response)
+        return response
+
+    def get(self, url, headers=None, **kwargs):
+        """GET, recorded"""
+        return self._send("GET", url, headers or {}, None, **kwargs)
+
+    def post(self, url, headers=None, json=None, **kwargs):
+        """POST, recorded"""
+        # pylint: disable=redefined-outer-name
+        return self._send("POST", url, headers or {}, json, json=json, **kwargs)
+
+    def put(self, url, headers=None, json=None, **kwargs):
+        """PUT, recorded"""
+        # pylint: disable=redefined-outer-name
+        return self._send("PUT", url, headers or {}, json, json=json, **kwargs)
+
+
+class ReplayingSession:
+    """A session that serves the requests from an ExchangeArchive"""
+
+    def __init__(self, archive: ExchangeArchive):
+        self.archive = archive
+
+    def get(self, url, headers=None, **_):
+        """GET, from the archive"""
+        return self.archive.get("GET", url, headers or {}, None)
+
+    def post(self, url, headers=None, json=None, **_):
+        """POST, from the archive"""
+        # pylint: disable=redefined-outer-name
+        return self.archive.get("POST", url, headers or {}, json)
+
+    def put(self, url, headers=None, json=None, **_):
+        """PUT, from the archive"""
+        # pylint: disable=redefined-outer-name
+        return self.archive.get("PUT", url, headers or {}, json)
+
+
+exchange_archive = ExchangeArchive()
@@ -14,24 +14,437 @@
 
 import os
 import re
+import sqlite3
+from collections import Counter
+from contextlib import closing, contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from email.utils import parsedate_to_datetime
 from urllib.parse import urlparse, urlunparse
 import json
 import csv
 import gzip
+import hashlib
+import threading
 import time
 
 import requests
+from requests.adapters import HTTPAdapter
 import requests_cache
-from bs4 import BeautifulSoup
 
-from .error_handling import EcosystemError, logger
+from .error_handling import EcosystemError, log_as, logger
+from .failures import RETRY_ATTEMPTS, CircuitBreaker, NegativeCache, backoff_delay
+from .recording import exchange_archive
+from .spool import DownloadSpool
+from .telemetry import RequestTelemetry
+from .scraping import FirstLinkInElement, GithubPackageIds, MatchingTexts, TextOfElement
+
+# How long a response is fresh, by URL glob pattern (the first match wins).
+# Stale responses with an ETag or a Last-Modified header are revalidated, so an
+# unchanged resource costs a 304 instead of a full download.
+CACHE_EXPIRE_AFTER = {
+    # new Qiskit releases change the compatibility of the members
+    "pypi.org/pypi/qiskit/json": timedelta(hours=6),
+    # Registry.toml changes often, but it is revalidated
+    "raw.githubusercontent.com/JuliaRegistries/*": timedelta(hours=6),
+    # package_requests.csv.gz is 100+ MB and only used for monthly stats
+    "julialang-logs.s3.amazonaws.com/*": timedelta(days=7),
+    "api.github.com/*": timedelta(hours=12),
+    "*": timedelta(days=1),
+}
+# The cache is trimmed to this size (ECOSYSTEM_CACHE_MAX_MB) at the end of each run
+CACHE_MAX_MB = int(os.getenv("ECOSYSTEM_CACHE_MAX_MB", "1024"))
 
-# 86400 seconds == 1 day
 requests_cache.install_cache(
-    "_ecosystem_cache", expire_after=86400, allowable_codes=(200,)
+    "_ecosystem_cache",
+    urls_expire_after=CACHE_EXPIRE_AFTER,
+    allowable_codes=(200,),
 )
 
 
+class HttpCache:
+    """Statistics and size bound for the HTTP cache installed by requests_cache.
+
+    requests_cache stores the responses and revalidates the stale ones (see
+    CACHE_EXPIRE_AFTER). This counts the hits, misses and revalidations of the run,
+    and remembers when each cached response was used last, so the cache can be
+    trimmed to `max_mb`, least recently used first.
+    """
+
+    def __init__(self, cache=None, max_mb: float = CACHE_MAX_MB):
+        self._cache = cache
+        self.max_mb = max_mb
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self._used = {}
+
+    @property
+    def cache(self) -> requests_cache.SQLiteCache:
+        """The requests_cache backend (by default, the installed one)"""
+        if self._cache is None:
+            self._cache = requests_cache.get_cache()
+        return self._cache
+
+    @property
+    def db_path(self):
+        """The SQLite file with the cached responses"""
+        return self.cache.responses.db_path
+
+    def record(self, response) -> str:
+        """Counts a response as "hit", "revalidated" (a 304) or "miss" """
+        if getattr(response, "revalidated", False):
+            outcome = "revalidated"
+        elif getattr(response, "from_cache", False):
+            outcome = "hit"
+        else:
+            outcome = "miss"
+        with self._lock:
+            self.stats[outcome] += 1
+            if getattr(response, "cache_key", None):
+                self._used[response.cache_key] = time.time()
+        return outcome
+
+    @contextmanager
+    def _connect(self):
+        """A connection to db_path, committed and closed at the end of the block"""
+        with closing(sqlite3.connect(self.db_path)) as connection:
+            with connection:
+                yield connection
+
+    def save_last_used(self):
+        """Saves when the responses of this run were used"""
+        with self._lock:
+            used, self._used = self._used, {}
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS last_used (key TEXT PRIMARY KEY, used_at REAL)"
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO last_used (key, used_at) VALUES (?, ?)",
+                used.items(),
+            )
+
+    def trim(self) -> int:
+        """Deletes cached responses, least recently used first, until they take
+        no more than max_mb. Returns how many were deleted."""
+        self.save_last_used()
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT responses.key, LENGTH(responses.value) FROM responses "
+                "LEFT JOIN last_used ON last_used.key = responses.key "
+                "ORDER BY COALESCE(last_used.used_at, 0)"
+            ).fetchall()
+        excess = sum(size for _, size in rows) - int(self.max_mb * 1024 * 1024)
+        to_delete = []
+        for key, size in rows:
+            if excess <= 0:
+                break
+            to_delete.append(key)
+            excess -= size
+        if to_delete:
+            self.cache.delete(*to_delete)
+            with self._connect() as connection:
+                connection.executemany(
+                    "DELETE FROM last_used WHERE key = ?", [(k,) for k in to_delete]
+                )
+        return len(to_delete)
+
+    def close(self):
+        """At the end of a run: trims the cache and logs the statistics"""
+        deleted = self.trim()
+        if self.stats:
+            logger.info(
+                "HTTP cache: %d hits, %d revalidated, %d misses, %d evicted",
+                self.stats["hit"],
+                self.stats["revalidated"],
+                self.stats["miss"],
+                deleted,
+            )
+
+
+http_cache = HttpCache()
+
+# How many requests can be in flight at the same time, per host.
+# It can be overridden with ECOSYSTEM_HOST_CONCURRENCY="pypistats.org=1,api.github.com=8"
+HOST_CONCURRENCY = {
+    "api.github.com": 4,
+    "github.com": 4,
+    "raw.githubusercontent.com": 4,
+    "pypi.org": 8,
+    "pypistats.org": 1,
+    "juliahub.com": 4,
+    "juliapkgstats.com": 2,
+    "julialang-logs.s3.amazonaws.com": 1,
+}
+DEFAULT_HOST_CONCURRENCY = 4
+
+
+class HostPool:
+    """A pooled session and a concurrency limit for each host.
+
+    Requests to the same host reuse the connections of a single session (which is
+    cached by requests_cache, as any other session), and no more than `limit(host)`
+    of them run at the same time, regardless of how many threads are fetching.
+    """
+
+    def __init__(self, limits: dict[str, int] | None = None):
+        self.limits = dict(HOST_CONCURRENCY if limits is None else limits)
+        self.limits |= HostPool.parse_limits(os.getenv("ECOSYSTEM_HOST_CONCURRENCY"))
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._slots = {}
+
+    @staticmethod
+    def parse_limits(text: str | None) -> dict[str, int]:
+        """Parses strings like "pypistats.org=1,api.github.com=8" """
+        limits = {}
+        for item in (text or "").split(","):
+            if not item.strip():
+                continue
+            host, _, limit = item.partition("=")
+            if not limit.strip().isdigit() or int(limit) < 1:
+                raise EcosystemError(f"invalid host concurrency limit: {item}")
+            limits[host.strip().lower()] = int(limit)
+        return limits
+
+    def limit(self, hostname: str) -> int:
+        """Maximum number of concurrent requests to hostname"""
+        return self.limits.get(hostname, DEFAULT_HOST_CONCURRENCY)
+
+    def session(self, hostname: str) -> requests.Session:
+        """The shared session for hostname, with a connection pool sized to its limit"""
+        with self._lock:
+            if hostname not in self._sessions:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=self.limit(hostname))
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[hostname] = session
+            return self._sessions[hostname]
+
+    def slot(self, hostname: str) -> threading.BoundedSemaphore:
+        """Semaphore to hold while requesting hostname"""
+        with self._lock:
+            if hostname not in self._slots:
+                self._slots[hostname] = threading.BoundedSemaphore(self.limit(hostname))
+            return self._slots[hostname]
+
+
+host_pool = HostPool()
+
+# Minimum seconds between requests to a host, for the hosts that ask for it
+# but do not report their limits in the response headers
+HOST_MIN_INTERVAL = {
+    "pypistats.org": 3,
+}
+# When less than this fraction of a reported quota (X-RateLimit-Remaining out of
+# X-RateLimit-Limit) is left, the rest is spread evenly until X-RateLimit-Reset
+QUOTA_PACING_FRACTION = 0.1
+
+
+class TokenBucket:
+    """The pace of the requests to a host with a credential.
+
+    Tokens are refilled at `rate` per second (None is unlimited), up to `burst`.
+    The host can also stop the requests until `not_before` (Retry-After or an
+    exhausted quota) and report its `quota` as (remaining, limit, reset_at).
+    """
+
+    def __init__(self, rate: float | None = None, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.time()
+        self.not_before = 0
+        self.quota = None
+
+    def reserve(self, now: float) -> float:
+        """Takes a token, returning how many seconds to wait before using it"""
+        wait = max(0, self.not_before - now)
+        rate = self.rate
+        if self.quota is not None:
+            remaining, limit, reset_at = self.quota
+            if reset_at <= now:
+                self.quota = None
+            elif remaining <= 0:
+                wait = max(wait, reset_at - now)
+            else:
+                self.quota = (remaining - 1, limit, reset_at)
+                if remaining < limit * QUOTA_PACING_FRACTION:
+                    quota_rate = remaining / (reset_at - now)
+                    rate = min(rate, quota_rate) if rate else quota_rate
+        if rate:
+            elapsed = max(0, now - self.updated_at)
+            self.tokens = min(self.burst, self.tokens + elapsed * rate) - 1
+            self.updated_at = now
+            if self.tokens < 0:
+                wait = max(wait, -self.tokens / rate)
+        return wait
+
+
+class RateLimiter:
+    """Token buckets per host and credential, updated with the rate limit
+    headers of the responses (X-RateLimit-* and Retry-After).
+
+    `reserve` tells each request how long to wait, so only the threads with
+    requests to a throttled host wait, while the requests to other hosts go on.
+    """
+
+    def __init__(self, min_intervals: dict[str, float] | None = None):
+        self.min_intervals = dict(
+            HOST_MIN_INTERVAL if min_intervals is None else min_intervals
+        )
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def _bucket(self, hostname: str, credential: str | None) -> TokenBucket:
+        """Call it holding the lock"""
+        if credential is not None:
+            credential = hashlib.sha256(credential.encode()).hexdigest()
+        key = (hostname, credential)
+        if key not in self._buckets:
+            interval = self.min_intervals.get(hostname)
+            self._buckets[key] = TokenBucket(1 / interval if interval else None)
+        return self._buckets[key]
+
+    def reserve(self, hostname: str, credential: str | None = None) -> float:
+        """Seconds to wait before the next request to hostname"""
+        with self._lock:
+            return self._bucket(hostname, credential).reserve(time.time())
+
+    def block(self, hostname: str, credential: str | None, seconds: float):
+        """No requests to hostname in the next seconds"""
+        with self._lock:
+            bucket = self._bucket(hostname, credential)
+            bucket.not_before = max(bucket.not_before, time.time() + seconds)
+
+    def update(self, hostname: str, credential: str | None, response):
+        """Learns the limits of hostname from a (not cached) response"""
+        if getattr(response, "from_cache", False):
+            return
+        headers = response.headers
+        retry_after = retry_after_seconds(headers.get("Retry-After"))
+        with self._lock:
+            bucket = self._bucket(hostname, credential)
+            try:
+                bucket.quota = (
+                    int(headers["X-RateLimit-Remaining"]),
+                    int(headers["X-RateLimit-Limit"]),
+                    int(headers["X-RateLimit-Reset"]),
+                )
+            except (KeyError, ValueError):
+                pass
+        if retry_after is not None:
+            self.block(hostname, credential, retry_after)
+
+
+class SingleFlight:
+    """Shares the result of a GET request with the identical ones (same URL,
+    headers, parser and content handler) made during a run: the ones made while
+    it is in flight wait for it, and the later ones get it right away. The
+    parsers are part of the key, so use module-level functions, not lambdas.
+    `saved` counts the fetches avoided this way. Outside of `run()` it does nothing.
+
+    Failed requests are shared with the requests waiting for them, but not kept.
+    Each caller gets its own copy of the top-level dict of the result, but the
+    nested values are shared: do not modify them.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.saved = 0
+        self._calls = {}  # key -> Future
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def run(self):
+        """Shares the requests made inside the block, and forgets them at the end"""
+        self.reset()
+        self.enabled = True
+        try:
+            yield self
+        finally:
+            self.enabled = False
+            if self.saved:
+                logger.info("%d repeated requests were not fetched again", self.saved)
+            self.reset()
+
+    def reset(self):
+        """Forgets the requests and the counter"""
+        with self._lock:
+            self._calls = {}
+            self.saved = 0
+
+    def do(self, key, function):
+        """The result of function(), or the one of the call with the same key"""
+        if not self.enabled:
+            return function()
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.saved += 1
+        if leader:
+            try:
+                future.set_result(function())
+            except BaseException as exc:
+                future.set_exception(exc)
+                with self._lock:
+                    if self._calls.get(key) is future:
+                        del self._calls[key]
+                raise
+        result = future.result()
+        return dict(result) if isinstance(result, dict) else result
+
+
+single_flight = SingleFlight()
+
+
+def retry_after_seconds(value: str | None) -> float | None:
+    """The seconds in a Retry-After header, that are a number or an HTTP date"""
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return int(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return retry_at.timestamp() - time.time()
+
+
+rate_limiter = RateLimiter()
+# The failed GET requests, remembered between runs
+negative_cache = NegativeCache("_ecosystem_failures.json")
+# The hosts that keep failing are not requested for a while
+circuit_breaker = CircuitBreaker()
+# Where the requests spend their time, per host and endpoint
+request_telemetry = RequestTelemetry()
+# The streamed downloads (request_json(..., stream=True)), cached as by requests_cache
+download_spool = DownloadSpool("_ecosystem_spool", CACHE_EXPIRE_AFTER)
+
+
+def _wait_before_request(url, delay, credential) -> float:
+    """Sleeps the given delay, or longer if the rate limiter says so.
+    Returns how long it slept. Nothing is waited for when replaying."""
+    if exchange_archive.replaying:
+        return delay or 0
+    if delay and delay < 0:
+        logger.warning("Negative delay (%.0f sec) truncated to 0", delay)
+        delay = 0
+    delay = max(delay or 0, rate_limiter.reserve(url.hostname, credential))
+    if delay:
+        if delay >= 900:
+            raise EcosystemError(f"delay for fetching {url} too long: {delay:.0f} sec")
+        if delay >= 5:
+            logger.info("Wait %.0f secs before fetching %s", delay, url)
+        time.sleep(delay)
+        request_telemetry.record_sleep(url, delay)
+    return delay
+
+
 def request_json(
     url: str,
     headers: dict[str, str] = None,
@@ -41,6 +454,7 @@ def request_json(
     content_handler=None,
     delay=None,
     token=None,
+    stream=False,
 ):
     # pylint: disable=too-many-branches
     """Request content from a URL and parse it into a JSON-like Python object.
@@ -59,9 +473,19 @@ def request_json(
             `json.loads`.
         content_handler: Optional callable that receives raw `response.content`
             bytes and returns the text/blob expected by `parser`.
-        delay: Optional delay (seconds) before sending the request.
+        delay: Optional delay (seconds) before sending the request. The request
+            can wait longer, to keep the pace of its host (see `RateLimiter`).
         token: Optional GitHub token override. When `None`, `GH_TOKEN` from the
             environment is used for GitHub API requests.
+        stream: If True (only for `GET`), the body is downloaded in chunks to a file
+            (see `DownloadSpool`), and `content_handler` (or `parser`) gets that
+            file, open in binary mode, instead of the content.
+
+    During a run (see `SingleFlight`), identical GET requests are fetched once.
+    A 5xx or no response is retried with backoff; during a run, failed GET
+    requests are remembered (see `NegativeCache`) and the hosts that keep
+    failing are not requested for a while (see `CircuitBreaker`).
+    The exchanges can be recorded or replayed (see `ExchangeArchive`).
 
     Returns:
         Parsed response data. Non-dict results are wrapped as `{"data": ...}`.
@@ -70,19 +494,23 @@ def request_json(
 
     Raises:
         EcosystemError: If the delay is too large, URL normalization fails,
-            or the response status is not successful after retry handling.
+            the response status is not successful after retry handling (or it
+            failed recently), or the host keeps failing.
     """
     if parser is None:
         parser = json.loads
     url = URL(url)
-    headers = headers or {
-        "Accept": "application/json,"
-        "application/vnd.github+json,"
-        "application/vnd.github.diff,"
-        "text/html,"
-        "application/xhtml+xml,"
-        "application/xml"
-    }
+    headers = dict(
+        headers
+        or {
+            "Accept": "application/json,"
+            "application/vnd.github+json,"
+            "application/vnd.github.diff,"
+            "text/html,"
+            "application/xhtml+xml,"
+            "application/xml"
+        }
+    )
 
     if url.hostname.endswith("api.github.com"):
         token = os.getenv("GH_TOKEN") if token is None else token
@@ -95,45 +523,144 @@ def request_json(
         if token:
             headers["Authorization"] = "Bearer " + token
 
-    if delay:
-        if delay < 0:
-            logger.warning("Negative delay (%.0f sec) truncated to 0", delay)
-            delay = 0
-        if delay >= 900:
-            raise EcosystemError(f"delay for fetching {url} too long: {delay:.0f} sec")
-        if delay >= 5:
-            logger.info("Wait %.0f secs before fetching %s", delay, url)
-        time.sleep(delay)
+    credential = headers.get("Authorization")
 
-    if post is not None:
-        response = requests.post(str(url), headers=headers, timeout=240, json=post)
-    elif put is not None:
-        response = requests.put(str(url), headers=headers, timeout=240, json=put)
-    else:
-        response = requests.get(str(url), headers=headers, timeout=240)
+    if stream and (post is not None or put is not None):
+        raise EcosystemError(f"Only GET requests can be streamed ({url})")
+
+    def fetch():
+        return _request_json(
+            url, headers, credential, post, put, parser, content_handler, delay, stream
+        )
+
+    if post is None and put is None:
+        key = (
+            str(url),
+            tuple(sorted(headers.items())),
+            parser,
+            content_handler,
+            stream,
+        )
+        return single_flight.do(key, fetch)
+    return fetch()
+
+
+def _request_json(  # pylint: disable=too-many-arguments
+    url, headers, credential, post, put, parser, content_handler, delay, stream=False
+):
+    """The request of request_json, once the URL and the headers are ready"""
+    # the recorded and replayed runs see every exchange, once, as it happened
+    resilient = exchange_archive.mode is None
+    negative_key = None
+    if resilient and post is None and put is None:
+        negative_key = NegativeCache.key(str(url), headers)
+        failure = negative_cache.get(negative_key)
+        if failure is not None:
+            raise EcosystemError(
+                f"Bad response {str(url)}: {failure['reason']} "
+                f"({failure['status_code']})"
+            )
+    response, delay = _send(
+        url,
+        headers,
+        credential,
+        post,
+        put,
+        delay,
+        stream,
+        RETRY_ATTEMPTS if resilient else 1,
+    )
 
     if not response.ok:
         if "rate" in response.reason or response.status_code == 429:
             wait_for = delay * 2 if delay else 60
             if "X-RateLimit-Reset" in response.headers:
                 wait_for = int(response.headers["X-RateLimit-Reset"]) - int(time.time())
-            return request_json(
-                url=url.original_url,
-                headers=headers,
-                post=post,
-                put=put,
-                parser=parser,
-                content_handler=content_handler,
-                delay=wait_for,
+            elif "Retry-After" in response.headers:
+                wait_for = (
+                    retry_after_seconds(response.headers["Retry-After"]) or wait_for
+                )
+            # the other requests to this host wait too
+            rate_limiter.block(url.hostname, credential, wait_for)
+            return _request_json(
+                url,
+                headers,
+                credential,
+                post,
+                put,
+                parser,
+                content_handler,
+                wait_for,
+                stream,
             )
+        if negative_key is not None:
+            negative_cache.put(negative_key, str(url), response)
         raise EcosystemError(
             f"Bad response {str(url)}: {response.reason} ({response.status_code})"
         )
-    if content_handler:
-        content = content_handler(response.content)
+    return _parse_response(response, parser, content_handler, stream)
+
+
+def _send(  # pylint: disable=too-many-arguments
+    url, headers, credential, post, put, delay, stream, attempts
+):
+    """The response to the request, and the seconds waited before sending it.
+    A 5xx (or no response) counts as a failure of the host (see `CircuitBreaker`)
+    and is tried again after a backoff, up to `attempts` tries in total."""
+    session = host_pool.session(url.hostname)
+    if stream:
+        session = download_spool.session(session)
+    session = exchange_archive.session(session)
+    attempt = 0
+    while True:
+        circuit_breaker.check(url.hostname)
+        delay = _wait_before_request(url, delay, credential)
+        started = time.monotonic()
+        try:
+            with host_pool.slot(url.hostname):
+                started = time.monotonic()
+                if post is not None:
+                    response = session.post(
+                        str(url), headers=headers, timeout=240, json=post
+                    )
+                elif put is not None:
+                    response = session.put(
+                        str(url), headers=headers, timeout=240, json=put
+                    )
+                else:
+                    response = session.get(str(url), headers=headers, timeout=240)
+        except (requests.ConnectionError, requests.Timeout):
+            request_telemetry.record(url, None, time.monotonic() - started)
+            circuit_breaker.failure(url.hostname)
+            if attempt + 1 >= attempts:
+                raise
+        else:
+            seconds = time.monotonic() - started
+            request_telemetry.record(
+                url, response, seconds, http_cache.record(response)
+            )
+            rate_limiter.update(url.hostname, credential, response)
+            if response.status_code < 500:
+                circuit_breaker.success(url.hostname)
+                return response, delay
+            circuit_breaker.failure(url.hostname)
+            if attempt + 1 >= attempts:
+                return response, delay
+        delay = backoff_delay(attempt)
+        attempt += 1
+        request_telemetry.record_retry(url)
+        logger.info("Retrying %s in %.0f secs (try %d)", url, delay, attempt + 1)
+
+
+def _parse_response(response, parser, content_handler, stream):
+    """The parsed body of a successful response, with its metadata"""
+    if stream:
+        with download_spool.body(response) as file:
+            ret = parser(content_handler(file) if content_handler else file)
+    elif content_handler:
+        ret = parser(content_handler(response.content))
     else:
-        content = response.text
-    ret = parser(content)
+        ret = parser(response.text)
     if ret is None:
         return ret
 
@@ -143,6 +670,41 @@ def request_json(
     return ret | metadata
 
 
+def fetch_all(calls: dict, max_workers: int | None = None) -> dict:
+    """Runs `request_json` for several requests concurrently.
+
+    The requests run in a thread pool, and each host keeps its own concurrency
+    limit (see `HostPool`), so slow or strict hosts do not hold the others back.
+
+    Args:
+        calls: dict of key -> keyword arguments for `request_json`. For example,
+            `{"qiskit": {"url": "pypi.org/pypi/qiskit/json"}}`.
+        max_workers: Number of threads. By default, one per call, up to 32.
+
+    Returns:
+        dict of key -> the `request_json` result, or the exception it raised
+        (`EcosystemError` or `requests.RequestException`).
+    """
+    results = {}
+    if not calls:
+        return results
+    caller = threading.get_ident()
+
+    def call(kwargs):
+        # so the logs go where the ones of the caller go (see ThreadLogBuffer)
+        with log_as(caller):
+            return request_json(**kwargs)
+
+    with ThreadPoolExecutor(max_workers=max_workers or min(32, len(calls))) as pool:
+        futures = {key: pool.submit(call, kw) for key, kw in calls.items()}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except (EcosystemError, requests.RequestException) as err:
+                results[key] = err
+    return results
+
+
 class URL:
     """Wraps URLs"""
 
@@ -229,11 +791,9 @@ def parse_github_contributors_sidebar(html_text):
     estimated_contributors = int
     }
     """
-    soup = BeautifulSoup(html_text, "html.parser")
-    found = soup.find("span", attrs={"title": "3"})
-    if found is None:
+    contributor_text = TextOfElement("span", {"title": "3"}).extract(html_text)
+    if contributor_text is None:
         return None
-    contributor_text = found.get_text()
     for line in contributor_text.split("\n"):
         candidate = line.strip()
         if candidate.isdigit():
@@ -246,29 +806,15 @@ def parse_github_package_ids(html_text):
     Find the package ids for github.com/<owner>/repo/network/
     dependents?dependent_type=REPOSITORY&package_id=PACKAGE_ID
     """
-    soup = BeautifulSoup(html_text, "html.parser")
-    pkgs_selector = soup.find("div", {"class": "select-menu-list"})
+    pkgs, default_pkg = GithubPackageIds().extract(html_text)
 
     def format_pkg_name(pkg_name):
         single_line = re.sub(r"\s+", " ", pkg_name)
         return single_line.strip()
 
-    is_there_a_default_pkg = soup.find("p", {"role": "status"})
-    default_pkg = (
-        is_there_a_default_pkg.find("strong").get_text().strip()
-        if is_there_a_default_pkg
-        else None
-    )
-    if pkgs_selector is None:
-        return {default_pkg: ""}
-
-    pkgs = pkgs_selector.find_all("a")
-    if len(pkgs) == 0:  # there are no dependents in {response.url}
+    if not pkgs:  # there are no dependents in {response.url}
         return {default_pkg: ""}
-
-    return {
-        format_pkg_name(pkg.get_text()): pkg.get("href").split("=")[1] for pkg in pkgs
-    }
+    return {format_pkg_name(text): href.split("=")[1] for text, href in pkgs}
 
 
 def parse_github_dependants(html_text):
@@ -287,20 +833,19 @@ def parse_github_dependants(html_text):
                 continue
             return int(l)
 
-    soup = BeautifulSoup(html_text, "html.parser")
-
-    rep_raw_texts = soup.find_all(text=re.compile(r"( Repository| Repositories)\s*$"))
+    repositories = r"( Repository| Repositories)\s*$"
+    packages = r"( Packages| Package)\s*$"
+    found = MatchingTexts([repositories, packages]).extract(html_text)
+    rep_raw_texts = found[repositories]
     if len(rep_raw_texts) != 1:
-        raise EcosystemError(
-            "BeautifulSoup had problems finding the repository DOM node"
-        )
+        raise EcosystemError("Problems finding the repository DOM node")
     rep_stat = raw_texts_to_int(rep_raw_texts[0])
     if rep_stat is not None:
         ret["repositories"] = rep_stat
 
-    pkg_raw_texts = soup.find_all(text=re.compile(r"( Packages| Package)\s*$"))
+    pkg_raw_texts = found[packages]
     if len(rep_raw_texts) != 1:
-        raise EcosystemError("BeautifulSoup had problems finding the package DOM node")
+        raise EcosystemError("Problems finding the package DOM node")
     pkg_stat = raw_texts_to_int(pkg_raw_texts[0])
     if pkg_stat is not None:
         ret["packages"] = pkg_stat
@@ -317,20 +862,18 @@ def parse_juliapackages(html_text):
     }
     """
     ret = {}
-    soup = BeautifulSoup(html_text, "html.parser")
-    found = soup.find("h2")
-    if found is not None:
-        package_name = found.get_text().strip()
+    package_name = TextOfElement("h2").extract(html_text)
+    if package_name is not None:
+        package_name = package_name.strip()
         if package_name.endswith(".jl"):
             package_name = package_name[:-3]
         ret["package_name"] = package_name
 
-    found = soup.find("span", {"class": "shadow-sm rounded-md"}).find(
-        "a", {"href": re.compile(r"github.com")}
-    )
-    if found is not None:
-        ret["repo_url"] = found["href"].strip()
-
+    repo_url = FirstLinkInElement(
+        "span", {"class": "shadow-sm rounded-md"}, r"github.com"
+    ).extract(html_text)
+    if repo_url is not None:
+        ret["repo_url"] = repo_url.strip()
     return ret
 
 
@@ -354,3 +897,93 @@ def find_first_in_csv_gz(subdict_to_find):
         return {}
 
     return parse_csv_gz
+
+
+class CsvGzIndex:
+    """An on-disk (SQLite) index of a csv.gz file, by some of its columns.
+
+    `update` builds it in a single streaming pass over the file, and keeps it while
+    the file does not change (same sha256). Only the first row of each key is kept,
+    which is all `find_first` needs, so a lookup is an index search instead of a scan
+    of the decompressed file.
+    """
+
+    def __init__(self, db_path: str, key_columns: list[str]):
+        self.db_path = db_path
+        self.key_columns = list(key_columns)
+
+    def _connect(self):
+        """A connection to db_path, closed at the end of the block"""
+        return closing(sqlite3.connect(self.db_path))
+
+    def _meta(self, name):
+        """A value from the meta table, None if the index is not built"""
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT value FROM meta WHERE name = ?", (name,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return json.loads(row[0]) if row else None
+
+    def update(self, file_like) -> dict:
+        """Builds the index for the csv.gz in file_like, unless it is already built
+        for the same content. It can be used as a `request_json` parser."""
+        sha256 = hashlib.file_digest(file_like, "sha256").hexdigest()
+        if sha256 == self._meta("sha256"):
+            return {"sha256": sha256, "rebuilt": False}
+        file_like.seek(0)
+        keys = ", ".join(f'"{column}"' for column in self.key_columns)
+        marks = ", ".join("?" * (len(self.key_columns) + 2))
+        tmp_path = f"{self.db_path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        with closing(sqlite3.connect(tmp_path)) as connection:
+            connection.execute("CREATE TABLE meta (name TEXT PRIMARY KEY, value TEXT)")
+            connection.execute(
+                f"CREATE TABLE rows ({keys}, rownum INTEGER, data TEXT, "
+                f"PRIMARY KEY ({keys}))"
+            )
+            with gzip.open(file_like, "rt") as gz_file:
+                csv_reader = csv.DictReader(gz_file)
+                connection.executemany(
+                    f"INSERT OR IGNORE INTO rows VALUES ({marks})",
+                    (
+                        (
+                            *(row.get(k) for k in self.key_columns),
+                            rownum,
+                            json.dumps(row),
+                        )
+                        for rownum, row in enumerate(csv_reader)
+                    ),
+                )
+                columns = csv_reader.fieldnames or []
+            connection.executemany(
+                "INSERT INTO meta VALUES (?, ?)",
+                [("sha256", json.dumps(sha256)), ("columns", json.dumps(columns))],
+            )
+            connection.commit()
+        os.replace(tmp_path, self.db_path)
+        return {"sha256": sha256, "rebuilt": True}
+
+    def find_first(self, subdict_to_find: dict) -> dict:
+        """Like find_first_in_csv_gz, the first row that matches subdict_to_find
+        (and any of its "statuses"), but only on the key columns."""
+        conditions, params = [], []
+        for column, value in subdict_to_find.items():
+            if column == "statuses":
+                column, value = "status", list(value)
+                conditions.append(f'"{column}" IN ({", ".join("?" * len(value))})')
+                params.extend(value)
+            elif column in self.key_columns:
+                conditions.append(f'"{column}" = ?')
+                params.append(value)
+            elif column in (self._meta("columns") or []):
+                raise EcosystemError(f"{column} is not an indexed column")
+        where = " AND ".join(conditions) or "1"
+        with self._connect() as connection:
+            row = connection.execute(
+                f"SELECT data FROM rows WHERE {where} ORDER BY rownum LIMIT 1", params
+            ).fetchone()
+        return json.loads(row[0]) if row else {}
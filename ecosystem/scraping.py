@@ -0,0 +1,223 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Streaming extraction of a few nodes from HTML pages.
+
+These parsers do not build a document tree: they go through the page once,
+keeping only what they look for, and stop as soon as they have it.
+"""
+
+from abc import ABC, abstractmethod
+from html.parser import HTMLParser
+import re
+
+# Elements without end tag, which do not change the depth of the document
+VOID_ELEMENTS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "source",
+    "track",
+    "wbr",
+}
+
+
+class _Done(Exception):
+    """Raised by an extractor when it has everything it was looking for"""
+
+
+def attrs_match(attrs: list[tuple[str, str]], wanted: dict[str, str]) -> bool:
+    """If the attributes of a start tag have the wanted values. As in
+    BeautifulSoup, a class without spaces matches any of the classes of the tag,
+    and a class with spaces matches the whole attribute."""
+    attrs = dict(attrs)
+    for name, value in wanted.items():
+        actual = attrs.get(name)
+        if actual is None:
+            return False
+        if name == "class" and " " not in value:
+            if value not in actual.split():
+                return False
+        elif actual != value:
+            return False
+    return True
+
+
+class Extractor(HTMLParser, ABC):
+    """Base class of the extractors: `extract(html_text)` feeds the page until
+    the end or until a handler raises _Done, and returns `self.result()`."""
+
+    def extract(self, html_text: str):
+        """Parses html_text (stopping early, if possible) and returns the result"""
+        try:
+            self.feed(html_text)
+            self.close()
+        except _Done:
+            pass
+        return self.result()
+
+    @abstractmethod
+    def result(self):
+        """What was extracted"""
+
+
+class TextOfElement(Extractor):
+    """The text of the first element with the given tag (and attributes),
+    None if there is no such element."""
+
+    def __init__(self, tag: str, attrs: dict[str, str] = None):
+        super().__init__()
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.depth = 0  # depth inside the found element, 0 if not there yet
+        self.texts = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.depth:
+            if tag == self.tag:
+                self.depth += 1
+        elif tag == self.tag and attrs_match(attrs, self.attrs):
+            self.depth = 1
+            self.texts = []
+
+    def handle_endtag(self, tag):
+        if self.depth and tag == self.tag:
+            self.depth -= 1
+            if not self.depth:
+                raise _Done()
+
+    def handle_data(self, data):
+        if self.depth:
+            self.texts.append(data)
+
+    def result(self):
+        return None if self.texts is None else "".join(self.texts)
+
+
+class GithubPackageIds(Extractor):
+    """The entries (text, href) of the first <div class="select-menu-list"> and
+    the <strong> text of the first <p role="status">, from a dependents page."""
+
+    def __init__(self):
+        super().__init__()
+        self.menu = None  # list of [text, href], None if there is no menu
+        self.menu_depth = 0
+        self.menu_done = False
+        self.anchor = None
+        self.status_depth = 0
+        self.default_package = None
+        self.strong = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_ELEMENTS:
+            return
+        if self.menu_depth:
+            if tag == "div":
+                self.menu_depth += 1
+            if tag == "a" and self.anchor is None:
+                self.anchor = [[], dict(attrs).get("href")]
+        elif not self.menu_done and tag == "div":
+            if attrs_match(attrs, {"class": "select-menu-list"}):
+                self.menu_depth = 1
+                self.menu = []
+        if self.status_depth:
+            if tag == "p":
+                self.status_depth += 1
+            if tag == "strong" and self.strong is None:
+                self.strong = []
+        elif self.default_package is None and tag == "p":
+            if attrs_match(attrs, {"role": "status"}):
+                self.status_depth = 1
+
+    def handle_endtag(self, tag):
+        if self.menu_depth:
+            if tag == "a" and self.anchor is not None:
+                self.menu.append(("".join(self.anchor[0]), self.anchor[1]))
+                self.anchor = None
+            elif tag == "div":
+                self.menu_depth -= 1
+                self.menu_done = not self.menu_depth
+        if self.status_depth:
+            if tag == "strong" and self.strong is not None:
+                self.default_package = "".join(self.strong).strip()
+                self.status_depth = 0
+            elif tag == "p":
+                self.status_depth -= 1
+        if self.menu_done and self.default_package is not None:
+            raise _Done()
+
+    def handle_data(self, data):
+        if self.anchor is not None:
+            self.anchor[0].append(data)
+        if self.strong is not None and self.default_package is None:
+            self.strong.append(data)
+
+    def result(self):
+        return self.menu, self.default_package
+
+
+class MatchingTexts(Extractor):
+    """All the text nodes that match any of the given regular expressions,
+    as {pattern: [texts]}. It goes through the whole page."""
+
+    def __init__(self, patterns: list[str]):
+        super().__init__()
+        self.patterns = {pattern: re.compile(pattern) for pattern in patterns}
+        self.found = {pattern: [] for pattern in patterns}
+
+    def handle_data(self, data):
+        for pattern, regex in self.patterns.items():
+            if regex.search(data):
+                self.found[pattern].append(data)
+
+    def result(self):
+        return self.found
+
+
+class FirstLinkInElement(Extractor):
+    """The href of the first <a> with an href matching href_pattern, inside the
+    first element with the given tag and attributes. None if there is none."""
+
+    def __init__(self, tag: str, attrs: dict[str, str], href_pattern: str):
+        super().__init__()
+        self.tag = tag
+        self.attrs = attrs
+        self.href_pattern = re.compile(href_pattern)
+        self.depth = 0
+        self.href = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.depth:
+            if tag == self.tag:
+                self.depth += 1
+            href = dict(attrs).get("href")
+            if tag == "a" and href is not None and self.href_pattern.search(href):
+                self.href = href
+                raise _Done()
+        elif tag == self.tag and attrs_match(attrs, self.attrs):
+            self.depth = 1
+
+    def handle_endtag(self, tag):
+        if self.depth and tag == self.tag:
+            self.depth -= 1
+            if not self.depth:
+                raise _Done()
+
+    def result(self):
+        return self.href
@@ -13,7 +13,12 @@
 """Utility classes for models."""
 
 from abc import ABC
+from copy import deepcopy
 from datetime import date, datetime
+from functools import reduce
+import threading
+
+import jsonpath
 
 from ecosystem.license import License
 from ecosystem.request import URL
@@ -77,6 +82,104 @@ class JsonSerializable(ABC):
         return result
 
 
+class JsonPathAttributes:
+    """Attributes of a class read from a fetched JSON with jsonpath.
+    `aliases` maps attribute names to jsonpath queries, `json_types` converts each
+    match of a query and `reduce` combines its matches when there is more than one.
+    Each query is compiled once per class, and the values are memoized per
+    instance in its `_json_values`, until the JSON object is replaced (for
+    example, by update_json).
+    """
+
+    _missing = object()
+
+    def __init__(self, aliases: dict, json_types: dict, reduce_functions: dict):
+        self.aliases = aliases
+        self.json_types = json_types
+        self.reduce_functions = reduce_functions
+        self._accessors = {}
+
+    def accessor(self, item):
+        """The function that gets item from a JSON (or _missing), with its query
+        compiled. json_types and reduce are looked up when it runs, so they can
+        be extended at any time."""
+        if item not in self._accessors:
+            query = self.aliases.get(item, item)
+            path = jsonpath.compile(query)
+
+            def get(json_data):
+                elements = path.findall(json_data)
+                if query in self.json_types:
+                    elements = [self.json_types[query](e) for e in elements]
+                if len(elements) == 1:
+                    return elements[0]
+                if len(elements) >= 2:
+                    return reduce(self.reduce_functions[query], elements)
+                return JsonPathAttributes._missing
+
+            self._accessors[item] = get
+        return self._accessors[item]
+
+    def get(self, instance, json_data, item):
+        """item from json_data, memoized in instance._json_values.
+        Raises AttributeError if there is no such item in json_data."""
+        memo = instance.__dict__.get("_json_values")
+        if memo is not None and memo[0] is not json_data:
+            memo = (json_data, {})
+            instance.__dict__["_json_values"] = memo
+        if memo is not None and item in memo[1]:
+            value = memo[1][item]
+        else:
+            value = self.accessor(item)(json_data)
+            if memo is not None:
+                memo[1][item] = value
+        if value is JsonPathAttributes._missing:
+            raise AttributeError(
+                f"'{type(instance).__name__}' object has no attribute '{item}'"
+            )
+        return value
+
+
+class Lazy:  # pylint: disable=too-few-public-methods
+    """A value to build from raw (a copy of it) with build(raw), the first time
+    the LazyAttribute that holds it is read."""
+
+    __slots__ = ("build", "raw")
+
+    def __init__(self, build, raw):
+        self.build = build
+        self.raw = raw
+
+
+class LazyAttribute:
+    """Data descriptor for attributes that may hold a Lazy value. The value is
+    kept in the instance __dict__ (so its place among the attributes, and
+    to_dict, do not change) and replaced by what it builds on first read."""
+
+    _lock = threading.RLock()
+
+    def __set_name__(self, owner, name):
+        self.name = name  # pylint: disable=attribute-defined-outside-init
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            value = instance.__dict__[self.name]
+        except KeyError as exc:
+            raise AttributeError(self.name) from exc
+        if isinstance(value, Lazy):
+            with LazyAttribute._lock:
+                value = instance.__dict__[self.name]
+                if isinstance(value, Lazy):
+                    value = value.build(deepcopy(value.raw))
+                    instance.__dict__[self.name] = value
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+
 def parse_date(date_str):
     """Normalize dates to datetime.date ISO format.
     If date_str is "now" or "today", then makes a date with today."""
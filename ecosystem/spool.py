@@ -0,0 +1,192 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Large downloads, spooled to disk in chunks instead of held in memory."""
+
+from datetime import datetime, timezone
+from io import BytesIO
+from pathlib import Path
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests_cache import DO_NOT_CACHE
+from requests_cache.policy.expiration import (
+    get_expiration_datetime,
+    get_url_expiration,
+)
+
+# Bytes read from the network and written to disk at a time
+CHUNK_SIZE = 1024 * 1024
+# Response headers kept with a spooled file
+KEPT_HEADERS = ["Content-Type", "ETag", "Last-Modified"]
+
+
+class SpooledResponse(requests.Response):
+    """A response whose body is a file in a DownloadSpool.
+    The body is only read into memory if `content` (or `text`) is used."""
+
+    def __init__(self, path: Path):
+        super().__init__()
+        self.path = path
+        self.created_at = None
+        self.from_cache = False
+        self.revalidated = False
+
+    @property
+    def content(self):
+        return self.path.read_bytes()
+
+    def open(self):
+        """The body, as a binary file"""
+        return open(self.path, "rb")
+
+
+class DownloadSpool:
+    """Large responses, downloaded in chunks of CHUNK_SIZE to files in a directory.
+
+    requests_cache keeps the whole body of a response in memory, so the spooled
+    requests bypass it, and the spool caches them instead: a file is fresh for
+    the time of its URL in `urls_expire_after` (as in requests_cache), and then it
+    is revalidated with its ETag or Last-Modified, so it is only downloaded again
+    when it changes.
+    """
+
+    def __init__(self, directory: str, urls_expire_after: dict | None = None):
+        self.directory = Path(directory)
+        self.urls_expire_after = urls_expire_after or {}
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> Path:
+        """The spooled body of url (its metadata is next to it, in a .json)"""
+        return self.directory / hashlib.sha256(url.encode()).hexdigest()
+
+    def entry(self, url: str) -> dict | None:
+        """The metadata of the spooled url, None if it is not spooled"""
+        path = self._path(url)
+        try:
+            entry = json.loads(path.with_suffix(".json").read_text())
+        except (OSError, ValueError):
+            return None
+        return entry if path.exists() else None
+
+    @staticmethod
+    def is_fresh(entry: dict) -> bool:
+        """If the spooled file can be used without asking the server"""
+        if entry["expires"] is None:
+            return True
+        return datetime.now(timezone.utc) < datetime.fromisoformat(entry["expires"])
+
+    @staticmethod
+    def validators(entry: dict | None) -> dict:
+        """The headers to revalidate a spooled file"""
+        headers = CaseInsensitiveDict((entry or {}).get("headers", {}))
+        validators = {}
+        if "ETag" in headers:
+            validators["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        return validators
+
+    def _write_entry(self, url: str, headers) -> dict:
+        """Saves the metadata of url, as fetched now"""
+        headers = CaseInsensitiveDict(headers)
+        expires = get_expiration_datetime(
+            get_url_expiration(url, self.urls_expire_after)
+        )
+        entry = {
+            "url": url,
+            "headers": {
+                name: headers[name] for name in KEPT_HEADERS if name in headers
+            },
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "expires": expires.isoformat() if expires else None,
+        }
+        meta_path = self._path(url).with_suffix(".json")
+        meta_path.with_suffix(".tmp").write_text(json.dumps(entry))
+        os.replace(meta_path.with_suffix(".tmp"), meta_path)
+        return entry
+
+    def save(self, url: str, response) -> dict:
+        """Writes the body of response (a streamed one) to the spool, in chunks"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=self.directory, delete=False) as file:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                file.write(chunk)
+        response.close()
+        with self._lock:
+            os.replace(file.name, self._path(url))
+            return self._write_entry(url, response.headers)
+
+    def revalidate(self, url: str, entry: dict, headers) -> dict:
+        """Keeps the spooled file of url, that was not modified (a 304)"""
+        merged = CaseInsensitiveDict(entry["headers"])
+        merged.update(headers)
+        with self._lock:
+            return self._write_entry(url, merged)
+
+    def response(self, url: str, entry: dict, **attributes) -> SpooledResponse:
+        """The spooled response to url"""
+        response = SpooledResponse(self._path(url))
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = url
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.created_at = datetime.fromisoformat(entry["created_at"])
+        for name, value in attributes.items():
+            setattr(response, name, value)
+        return response
+
+    def session(self, session):
+        """A session that spools its GET responses (see SpoolingSession)"""
+        return SpoolingSession(self, session)
+
+    @staticmethod
+    def body(response):
+        """The body of a response to a spooled request, as a binary file"""
+        if isinstance(response, SpooledResponse):
+            return response.open()
+        # a response that was already read, as the replayed ones
+        return BytesIO(response.content)
+
+
+class SpoolingSession:
+    """A session that downloads GET responses to a DownloadSpool, or serves them
+    from it while they are fresh (or not modified)"""
+
+    def __init__(self, spool: DownloadSpool, session):
+        self.spool = spool
+        self.session = session
+
+    def get(self, url, headers=None, **kwargs):
+        """GET, spooled. Only the successful responses are spooled."""
+        entry = self.spool.entry(url)
+        if entry is not None and DownloadSpool.is_fresh(entry):
+            return self.spool.response(url, entry, from_cache=True)
+        response = self.session.get(
+            url,
+            headers=(headers or {}) | DownloadSpool.validators(entry),
+            stream=True,
+            expire_after=DO_NOT_CACHE,
+            **kwargs,
+        )
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            entry = self.spool.revalidate(url, entry, response.headers)
+            return self.spool.response(url, entry, from_cache=True, revalidated=True)
+        if not response.ok:
+            return response
+        return self.spool.response(url, self.spool.save(url, response))
@@ -0,0 +1,324 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Where the requests of a run spend their time, per host and per endpoint."""
+
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+import json
+import os
+import re
+import threading
+import time
+
+from .error_handling import logger
+
+# The endpoints of the requests, as host/path patterns (the first match wins).
+# A * is a path segment and a ** is the rest of the path. The others are host/**.
+ENDPOINT_PATTERNS = [
+    "api.github.com/graphql",
+    "api.github.com/repos/*/*/commits/*",
+    "api.github.com/repos/*/*",
+    "api.github.com/networks/*/*/events",
+    "github.com/*/*/contributors_list",
+    "github.com/*/*/network/dependents",
+    "github.com/*/*/tree/**",
+    "pypi.org/pypi/*/json",
+    "pypi.org/simple/*",
+    "pypistats.org/api/packages/*/*",
+    "juliahub.com/docs/*/*/stable/pkg.json",
+    "juliahub.com/ui/Packages/*/*",
+    "juliapkgstats.com/api/v2/*/*",
+    "api-ssl.bitly.com/v4/bitlinks",
+]
+# Upper bounds (in seconds) of the buckets of the latency histograms
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+
+class RequestStats:
+    """Counters of the requests to a host or an endpoint"""
+
+    def __init__(self):
+        self.requests = 0
+        self.statuses = Counter()  # "2xx", "4xx", ..., and "error" (no response)
+        self.cache = Counter()  # "hit", "revalidated" and "miss"
+        self.bytes = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.retries = 0
+        self.sleeps = 0
+        self.slept = 0.0
+
+    def add(self, status_code: int | None, seconds: float, cache=None, size=0):
+        """Counts a request, that took seconds"""
+        self.requests += 1
+        self.statuses[f"{status_code // 100}xx" if status_code else "error"] += 1
+        if cache:
+            self.cache[cache] += 1
+        self.bytes += size
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        bucket = next(
+            (i for i, bound in enumerate(LATENCY_BUCKETS) if seconds <= bound),
+            len(LATENCY_BUCKETS),
+        )
+        self.histogram[bucket] += 1
+
+    def quantile(self, fraction: float) -> float | None:
+        """Upper bound of the latency of that fraction of the requests"""
+        if not self.requests:
+            return None
+        target = fraction * self.requests
+        count = 0
+        for bound, in_bucket in zip(LATENCY_BUCKETS, self.histogram):
+            count += in_bucket
+            if count >= target:
+                return bound
+        return self.max_seconds
+
+    def as_dict(self) -> dict:
+        """The counters, as JSON"""
+        return {
+            "requests": self.requests,
+            "errors": sum(
+                count for status, count in self.statuses.items() if status != "2xx"
+            ),
+            "statuses": dict(sorted(self.statuses.items())),
+            "cache": dict(sorted(self.cache.items())),
+            "bytes": self.bytes,
+            "seconds": round(self.seconds, 3),
+            "max_seconds": round(self.max_seconds, 3),
+            "p50_seconds": self.quantile(0.5),
+            "p95_seconds": self.quantile(0.95),
+            "histogram": dict(
+                zip([f"<={b}" for b in LATENCY_BUCKETS] + ["more"], self.histogram)
+            ),
+            "retries": self.retries,
+            "sleeps": self.sleeps,
+            "slept_seconds": round(self.slept, 3),
+        }
+
+
+class RequestTelemetry:
+    """Counters, latency histograms, bytes downloaded, cache outcomes, retries and
+    sleeps (for rate limits and backoffs) of the requests of a run, per host and
+    per endpoint (see ENDPOINT_PATTERNS). Outside of `run()` nothing is counted.
+
+    `write_report` saves them as JSON, and as markdown in the GitHub Actions job
+    summary, compared with the report of the previous run.
+    """
+
+    def __init__(self, patterns: list[str] | None = None):
+        self.patterns = [
+            (pattern, RequestTelemetry._compile(pattern))
+            for pattern in (ENDPOINT_PATTERNS if patterns is None else patterns)
+        ]
+        self.enabled = False
+        self.started_at = None
+        self.finished_at = None
+        self._hosts = {}
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _compile(pattern: str) -> re.Pattern:
+        segments = [
+            {"*": "[^/]+", "**": ".*"}.get(segment, re.escape(segment))
+            for segment in pattern.split("/")
+        ]
+        return re.compile("/".join(segments) + "/?")
+
+    def endpoint(self, hostname: str, path: str) -> str:
+        """The endpoint pattern of a request"""
+        url = f"{hostname}/{path.strip('/')}"
+        for pattern, regex in self.patterns:
+            if regex.fullmatch(url):
+                return pattern
+        return f"{hostname}/**"
+
+    @contextmanager
+    def run(self):
+        """Counts the requests made inside the block"""
+        self.reset()
+        self.started_at = time.time()
+        self.enabled = True
+        try:
+            yield self
+        finally:
+            self.enabled = False
+            self.finished_at = time.time()
+
+    def reset(self):
+        """Forgets the counters"""
+        with self._lock:
+            self._hosts = {}
+            self._endpoints = {}
+            self.started_at = self.finished_at = None
+
+    def _stats(self, url) -> list[RequestStats]:
+        """The counters of the host and the endpoint of url. Call it holding the lock"""
+        endpoint = self.endpoint(url.hostname, url.path)
+        return [
+            self._hosts.setdefault(url.hostname, RequestStats()),
+            self._endpoints.setdefault(endpoint, RequestStats()),
+        ]
+
+    def record(self, url, response, seconds: float, cache: str | None = None):
+        """Counts a request to url (a URL), and its response (None if there was
+        none), that took seconds. Only the bytes of cache misses are downloaded."""
+        if not self.enabled:
+            return
+        status_code = getattr(response, "status_code", None)
+        size = 0
+        if response is not None and cache == "miss":
+            path = getattr(response, "path", None)  # spooled to disk
+            size = path.stat().st_size if path else len(response.content or b"")
+        with self._lock:
+            for stats in self._stats(url):
+                stats.add(status_code, seconds, cache, size)
+
+    def record_retry(self, url):
+        """Counts a retry of a request to url (a URL)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            for stats in self._stats(url):
+                stats.retries += 1
+
+    def record_sleep(self, url, seconds: float):
+        """Counts a sleep before a request to url (a URL), for the rate limits of
+        its host or a backoff"""
+        if not self.enabled:
+            return
+        with self._lock:
+            for stats in self._stats(url):
+                stats.sleeps += 1
+                stats.slept += seconds
+
+    def report(self, counters: dict | None = None) -> dict:
+        """The telemetry of the run, as JSON, with other counters of the run"""
+        # the worker threads may still be counting requests
+        with self._lock:
+            hosts = {name: stats.as_dict() for name, stats in self._hosts.items()}
+            endpoints = {
+                name: stats.as_dict() for name, stats in self._endpoints.items()
+            }
+            totals = RequestStats()
+            for stats in self._hosts.values():
+                totals.requests += stats.requests
+                totals.statuses.update(stats.statuses)
+                totals.cache.update(stats.cache)
+                totals.bytes += stats.bytes
+                totals.seconds += stats.seconds
+                totals.histogram = [
+                    a + b for a, b in zip(totals.histogram, stats.histogram)
+                ]
+                totals.max_seconds = max(totals.max_seconds, stats.max_seconds)
+                totals.retries += stats.retries
+                totals.sleeps += stats.sleeps
+                totals.slept += stats.slept
+        finished_at = self.finished_at or time.time()
+        return {
+            "started_at": self.started_at,
+            "duration_seconds": (
+                round(finished_at - self.started_at, 3) if self.started_at else None
+            ),
+            "totals": totals.as_dict(),
+            "counters": dict(counters or {}),
+            "hosts": hosts,
+            "endpoints": endpoints,
+        }
+
+    @staticmethod
+    def markdown(report: dict, previous: dict | None = None) -> str:
+        """The report as markdown tables, slowest first. If there is a previous
+        report, the change of the time of each host is shown too."""
+        previous_hosts = (previous or {}).get("hosts", {})
+        totals = report["totals"]
+        lines = [
+            "## Requests",
+            "",
+            f"{totals['requests']} requests ({totals['errors']} failed) in "
+            f"{report['duration_seconds'] or 0:.0f} s: {totals['seconds']:.1f} s "
+            f"requesting, {totals['slept_seconds']:.1f} s sleeping (rate limits "
+            f"and backoffs), {totals['bytes'] / 1e6:.1f} MB downloaded.",
+        ]
+        counters = ", ".join(
+            f"{count} {name}" for name, count in report["counters"].items()
+        )
+        if counters:
+            lines += ["", counters + "."]
+        lines += [
+            "",
+            "| host | requests | failed | cache hit/reval./miss | MB | seconds "
+            "| vs. last run | p50 (s) | p95 (s) | max (s) | retries | slept (s) |",
+            "|---|--:|--:|--:|--:|--:|--:|--:|--:|--:|--:|--:|",
+        ]
+        for host, stats in sorted(
+            report["hosts"].items(), key=lambda item: -item[1]["seconds"]
+        ):
+            change = ""
+            if host in previous_hosts:
+                change = f"{stats['seconds'] - previous_hosts[host]['seconds']:+.1f}"
+            lines.append(
+                f"| {host} | {stats['requests']} | {stats['errors']} "
+                f"| {RequestTelemetry._cache_cell(stats)} "
+                f"| {stats['bytes'] / 1e6:.1f} | {stats['seconds']:.1f} | {change} "
+                f"| {stats['p50_seconds']} | {stats['p95_seconds']} "
+                f"| {stats['max_seconds']:.1f} | {stats['retries']} "
+                f"| {stats['slept_seconds']:.1f} |"
+            )
+        lines += [
+            "",
+            "| endpoint | requests | failed | cache hit/reval./miss | seconds | p95 (s) |",
+            "|---|--:|--:|--:|--:|--:|",
+        ]
+        for endpoint, stats in sorted(
+            report["endpoints"].items(), key=lambda item: -item[1]["seconds"]
+        ):
+            lines.append(
+                f"| `{endpoint}` | {stats['requests']} | {stats['errors']} "
+                f"| {RequestTelemetry._cache_cell(stats)} "
+                f"| {stats['seconds']:.1f} | {stats['p95_seconds']} |"
+            )
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _cache_cell(stats: dict) -> str:
+        cache = stats["cache"]
+        return "/".join(
+            str(cache.get(outcome, 0)) for outcome in ["hit", "revalidated", "miss"]
+        )
+
+    def write_report(self, path: str | None = None, counters=None) -> str:
+        """The report of the run as markdown, compared with the one in path (JSON),
+        that is replaced with it. In GitHub Actions, it is added to the job
+        summary too, if there were requests."""
+        previous = None
+        if path is not None:
+            path = Path(path)
+            try:
+                previous = json.loads(path.read_text())
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as error:
+                logger.warning("Ignoring the previous report %s: %s", path, error)
+        report = self.report(counters)
+        if path is not None:
+            path.write_text(json.dumps(report, indent=1))
+        markdown = RequestTelemetry.markdown(report, previous)
+        if os.getenv("GITHUB_STEP_SUMMARY") and report["totals"]["requests"]:
+            with open(os.environ["GITHUB_STEP_SUMMARY"], "a", encoding="utf-8") as file:
+                file.write(markdown)
+        return markdown
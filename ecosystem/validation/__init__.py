@@ -12,10 +12,16 @@
 
 """Validation module"""
 
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
+import math
+import multiprocessing
+
 import pytest
 
 from ecosystem.check import ChecksToml
-from ecosystem.validation.conftest import ValidationReport
+from ecosystem.validation.conftest import ValidationSession
 
 # pylint: disable=pointless-string-statement
 """
@@ -37,7 +43,41 @@ def validate_member(member, tests_to_run=None, verbose_level=None):
     """Runs all the validation for a member
     verbose_level: -v, -vv, -q
     """
-    report = ValidationReport(member, ChecksToml())
+    return validate_members(
+        [member], tests_to_run=tests_to_run, verbose_level=verbose_level
+    )[member.name_id]
+
+
+# pytest-order sorts the items of a session in quadratic time, so the members are
+# validated in sessions of, at most, this many members
+MEMBERS_PER_SESSION = 20
+
+
+def validate_members(members, tests_to_run=None, verbose_level=None, jobs=1):
+    """Runs all the validation for many members, parametrizing the checkers over the
+    members, so they are collected once per session (of MEMBERS_PER_SESSION members).
+    Returns a ValidationReport by member name_id.
+    verbose_level: -v, -vv, -q
+    jobs: if more than 1, the sessions run on a pool of processes. The output of
+     each session is printed in order, once the session is done.
+    """
+    members = list(members)
+    session_size = max(1, min(MEMBERS_PER_SESSION, math.ceil(len(members) / jobs)))
+    sessions = [
+        members[start : start + session_size]
+        for start in range(0, len(members), session_size)
+    ]
+    if jobs > 1 and len(sessions) > 1:
+        return _validate_sessions_in_pool(sessions, tests_to_run, verbose_level, jobs)
+    reports = {}
+    for session_members in sessions:
+        reports.update(_validate_session(session_members, tests_to_run, verbose_level))
+    return reports
+
+
+def _validate_session(members, tests_to_run, verbose_level):
+    """Runs a PyTest session for the members"""
+    session = ValidationSession(members, ChecksToml())
     if verbose_level is None:
         verbose_level = "-q"
     if tests_to_run is None:
@@ -50,6 +90,42 @@ def validate_member(member, tests_to_run=None, verbose_level=None):
             verbose_level,
             "--no-header",
         ],
-        plugins=[report],
+        plugins=[session],
     )
-    return report
+    return session.reports
+
+
+def _validate_session_in_worker(
+    member_from_dict, member_dicts, tests_to_run, verbose_level
+):
+    """Runs in a worker process. Returns the reports, in the order of the members,
+    and the output of the session"""
+    members = [member_from_dict(member_dict) for member_dict in member_dicts]
+    with redirect_stdout(StringIO()) as output:
+        reports = _validate_session(members, tests_to_run, verbose_level)
+    return [reports[member.name_id] for member in members], output.getvalue()
+
+
+def _validate_sessions_in_pool(sessions, tests_to_run, verbose_level, jobs):
+    """Runs the sessions on a pool of `jobs` processes. The members travel as dicts,
+    and the reports come back without them."""
+    reports = {}
+    with ProcessPoolExecutor(
+        max_workers=jobs, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        futures = [
+            pool.submit(
+                _validate_session_in_worker,
+                type(members[0]).from_dict,
+                [member.to_dict() for member in members],
+                tests_to_run,
+                verbose_level,
+            )
+            for members in sessions
+        ]
+        for members, future in zip(sessions, futures):
+            session_reports, output = future.result()
+            print(output, end="")
+            # the members rebuilt from dicts might not know the name_id of their file
+            reports.update(zip((member.name_id for member in members), session_reports))
+    return reports
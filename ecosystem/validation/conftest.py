@@ -15,6 +15,8 @@
 See https://docs.pytest.org/en/stable/reference/fixtures.html#conftest-py-sharing-fixtures-across-multiple-files  # pylint: disable=line-too-long
 """
 
+from copy import copy
+
 import pytest
 
 
@@ -26,8 +28,16 @@ def pytest_configure(config):
     )
 
 
+def checker_nodeid(nodeid):
+    """The checker node ID, without the member parametrization.
+    For example, test_github.py::test_G05[member_id] -> test_github.py::test_G05"""
+    return nodeid.partition("[")[0]
+
+
 class ValidationReport:
-    # pylint: disable=missing-function-docstring, missing-class-docstring
+    """The outcome of the validation of a member"""
+
+    # pylint: disable=missing-function-docstring
 
     def __init__(self, member, checktoml):
         self._member = member
@@ -40,6 +50,12 @@ class ValidationReport:
         self.internalerror = []
         self.checktoml = checktoml
 
+    def __getstate__(self):
+        # When validated in another process, the member stays there
+        state = self.__dict__.copy()
+        state["_member"] = None
+        return state
+
     @property
     def xfails(self):
         return {
@@ -54,15 +70,25 @@ class ValidationReport:
             if checkdata.since
         }
 
-    def pytest_itemcollected(self, item):
-        # pylint: disable=protected-access
-        item._nodeid = "/".join(item.nodeid.split("/")[2:])
-
-    @pytest.hookimpl(hookwrapper=True)
-    def pytest_runtest_makereport(self, item, call):  # pylint: disable=unused-argument
-
-        outcome = yield
-        report = outcome.get_result()
+    def mark(self, item, nodeid):
+        """Adds the markers for a collected checker of this member"""
+        self.collected += 1
+        if (
+            self.checktoml.checkup(self.checktoml.id_by_pytest_node(nodeid))[
+                "importance"
+            ]
+            == "LEGACY"
+        ):
+            item.add_marker(pytest.mark.skip(reason="legacy check"))
+        if nodeid in self.xfails:
+            item.add_marker(pytest.mark.xfail(reason=self.xfails[nodeid]))
+        if nodeid in self.previous_failures:
+            item.add_marker(
+                pytest.mark.previously_failed(since=self.previous_failures[nodeid])
+            )
+
+    def add(self, item, report):
+        """Files a (checker nodeid) report of this member, by outcome"""
         if report.when == "call":
             if report.passed:
                 self.passed.append(report)
@@ -70,7 +96,9 @@ class ValidationReport:
                 for mark in item.iter_markers():
                     setattr(report, mark.name, mark)
                 self.failed.append(report)
-                item.config.failed_checkups[item.nodeid] = report
+                item.config.failed_checkups.setdefault(self._member.name_id, {})[
+                    report.nodeid
+                ] = report
             elif hasattr(report, "wasxfail") and report.wasxfail:
                 self.xfailed.append(report)
             else:
@@ -79,30 +107,73 @@ class ValidationReport:
             # internal error: the test failed to run because it is somehow wrongly set
             self.internalerror.append(report)
 
+    def finish(self, exitstatus):
+        """Sets the exitcode of this member out of the session exitstatus"""
+        if exitstatus not in (0, 1, 5):
+            # interrupted, internal or usage error. It is not about the member.
+            self.exitcode = exitstatus
+        elif self.failed or self.internalerror:
+            self.exitcode = 1
+        elif not self.collected:
+            self.exitcode = 5
+        else:
+            self.exitcode = 0
+
+
+class ValidationSession:
+    """PyTest plugin that runs the checkers once for many members.
+    Each checker using the `member` fixture is parametrized over the members and
+    the outcomes are filed by member in its ValidationReport."""
+
+    # pylint: disable=missing-function-docstring
+
+    def __init__(self, members, checktoml):
+        self.reports = {
+            member.name_id: ValidationReport(member, checktoml) for member in members
+        }
+        self._members = list(members)
+
+    def _reports_for(self, item):
+        """The reports of the member(s) that an item checks"""
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and "member" in callspec.params:
+            return [self.reports[callspec.params["member"].name_id]]
+        return list(self.reports.values())
+
+    def pytest_generate_tests(self, metafunc):
+        if "member" in metafunc.fixturenames:
+            metafunc.parametrize(
+                "member",
+                self._members,
+                ids=[member.name_id for member in self._members],
+            )
+
+    def pytest_itemcollected(self, item):
+        # pylint: disable=protected-access
+        item._nodeid = "/".join(item.nodeid.split("/")[2:])
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):  # pylint: disable=unused-argument
+        outcome = yield
+        report = outcome.get_result()
+        for member_report in self._reports_for(item):
+            checker_report = copy(report)
+            checker_report.nodeid = checker_nodeid(report.nodeid)
+            member_report.add(item, checker_report)
+
     def pytest_collection_modifyitems(self, items):
-        self.collected = len(items)
         for item in items:
-            if (
-                self.checktoml.checkup(self.checktoml.id_by_pytest_node(item.nodeid))[
-                    "importance"
-                ]
-                == "LEGACY"
-            ):
-                item.add_marker(pytest.mark.skip(reason="legacy check"))
-            if item.nodeid in self.xfails:
-                item.add_marker(pytest.mark.xfail(reason=self.xfails[item.nodeid]))
-            if item.nodeid in self.previous_failures:
-                item.add_marker(
-                    pytest.mark.previously_failed(
-                        since=self.previous_failures[item.nodeid]
-                    )
-                )
+            for member_report in self._reports_for(item):
+                member_report.mark(item, checker_nodeid(item.nodeid))
 
     def pytest_terminal_summary(
         self, terminalreporter, exitstatus
     ):  # pylint: disable=unused-argument
-        self.exitcode = exitstatus.value if hasattr(exitstatus, "value") else exitstatus
+        exitstatus = exitstatus.value if hasattr(exitstatus, "value") else exitstatus
+        for member_report in self.reports.values():
+            member_report.finish(exitstatus)
 
     @pytest.fixture
-    def member(self):
-        return self._member
+    def failed_checkups(self, pytestconfig, member):
+        """The failed checkups (by checker nodeid) of the member, so far"""
+        return pytestconfig.failed_checkups.get(member.name_id, {})
@@ -47,12 +47,12 @@ def must_pass_all_requierements(requierements, failed_checkups, msg):
 
 
 @pytest.mark.order(after=["test_pypi.py::test_PQ2"])
-def test_Q20(request, pytestconfig):
+def test_Q20(request, failed_checkups):
     """Be compatible with the Qiskit SDK v2 or newer"""
     requierements = request.node.get_closest_marker("order").kwargs["after"]
     must_pass_all_requierements(
         requierements,
-        pytestconfig.failed_checkups,
+        failed_checkups,
         "Not compatible with the Qiskit SDK v2 or newer",
     )
 
@@ -64,23 +64,23 @@ def test_Q20(request, pytestconfig):
         "test_general.py::test_Q20",
     ]
 )
-def test_G00(request, pytestconfig):
+def test_G00(request, failed_checkups):
     """Have a clear support expectation and, if actively maintained,
     show signs of that activity."""
     requierements = request.node.get_closest_marker("order").kwargs["after"]
     must_pass_all_requierements(
         requierements,
-        pytestconfig.failed_checkups,
+        failed_checkups,
         "The project is probably abandoned",
     )
 
 
 @pytest.mark.order(after=["test_github.py::test_G10"])
-def test_001(request, pytestconfig):
+def test_001(request, failed_checkups):
     """Have an OSI-approved open-source license (preferably Apache 2.0 or MIT)"""
     requierements = request.node.get_closest_marker("order").kwargs["after"]
     must_pass_all_requierements(
         requierements,
-        pytestconfig.failed_checkups,
+        failed_checkups,
         "A non-OSI-approved license?",
     )
@@ -13,13 +13,20 @@
 
 """Tests for entities."""
 
+import os
+from datetime import date
 import tempfile
 import shutil
 from pathlib import Path
 from unittest import TestCase
+from unittest.mock import patch
 
-from ecosystem.dao import DAO
+import tomllib
+
+from ecosystem.dao import DAO, SNAPSHOT_FILE, TomlStorage, TomlWriter
 from ecosystem.member import Member
+from ecosystem.pypi import PyPIData
+from ecosystem.request import URL
 
 
 def get_main_repo() -> Member:
@@ -34,6 +41,58 @@ def get_main_repo() -> Member:
     )
 
 
+class TestTomlWriter(TestCase):
+    """Tests the TOML serializer of the members."""
+
+    def test_members_are_written_as_they_are(self):
+        """Tests that the member files are written back byte by byte."""
+        writer = TomlWriter()
+        members_dir = Path(__file__).parents[2] / "resources" / "members"
+        for path in members_dir.glob("*.toml"):
+            with self.subTest(path.name):
+                text = path.read_text(encoding="utf-8")
+                member = Member.from_dict(tomllib.loads(text))
+                self.assertEqual(text, writer.dumps(member.to_dict()))
+
+    def test_dumps(self):
+        """Tests keys, strings, arrays and tables."""
+        data = {
+            "name": 'A "quoted"\tname\\',
+            "created_at": date(2024, 1, 2),
+            "labels": ["a", "b"],
+            "maintainers": [f"https://pypi.org/user/user-{i}/" for i in range(3)],
+            "ratio": 0.5,
+            "skipped": None,
+            "pypi": {"mqt.core": {"stars": 1}, "other": {"ok": True}},
+            "badge": {"style": "flat"},
+        }
+        expected = (
+            'name = "A \\"quoted\\"\\tname\\\\"\n'
+            "created_at = 2024-01-02\n"
+            'labels = ["a", "b"]\n'
+            "maintainers = [\n"
+            '  "https://pypi.org/user/user-0/",\n'
+            '  "https://pypi.org/user/user-1/",\n'
+            '  "https://pypi.org/user/user-2/",\n'
+            "]\n"
+            "ratio = 0.5\n"
+            "\n"
+            "[badge]\n"
+            'style = "flat"\n'
+            "\n"
+            '[pypi."mqt.core"]\n'
+            "stars = 1\n"
+            "\n"
+            "[pypi.other]\n"
+            "ok = true\n"
+        )
+        self.assertEqual(expected, TomlWriter().dumps(data))
+        self.assertEqual(
+            {k: v for k, v in data.items() if v is not None},
+            tomllib.loads(expected),
+        )
+
+
 class TestDao(TestCase):
     """Tests repository related functions."""
 
@@ -58,3 +117,164 @@ class TestDao(TestCase):
         dao.delete(main_repo.name_id)
         dao.refresh_files()
         self.assertEqual(0, len(dao.get_all()))
+
+    def test_lookups(self):
+        """Tests the indexed lookups by name_id, URL, short UUID and package."""
+        main_repo = get_main_repo()
+        main_repo.pypi = {"mock-terra": PyPIData("mock-terra")}
+        dao = DAO(self.path)
+        dao.write(main_repo)
+
+        self.assertEqual(main_repo, dao[main_repo.name_id])
+        self.assertEqual(
+            main_repo, dao.get_by_url("GitHub.com/MockQiskit/mock-qiskit-wsdt.terra")
+        )
+        self.assertEqual(main_repo, dao.get_by_short_uuid(main_repo.short_uuid))
+        self.assertEqual(main_repo, dao.get_by_package("Mock_Terra"))
+
+        self.assertIsNone(dao.get_by_url("https://github.com/MockQiskit/not-there"))
+        self.assertIsNone(dao.get_by_short_uuid("00000000"))
+        self.assertIsNone(dao.get_by_package("not-there"))
+        with self.assertRaises(KeyError):
+            _ = dao["not-there"]
+
+    def test_lookups_return_new_objects(self):
+        """Tests that mutating a fetched member does not alter the index."""
+        main_repo = get_main_repo()
+        dao = DAO(self.path)
+        dao.write(main_repo)
+
+        fetched_repo = dao[main_repo.name_id]
+        fetched_repo.labels.append("mutated")
+        self.assertNotIn("mutated", dao[main_repo.name_id].labels)
+
+    def test_only_modified_files_are_parsed(self):
+        """Tests that the TOML files are parsed once, until they are modified."""
+        main_repo = get_main_repo()
+        other_repo = get_main_repo()
+        other_repo.name = "other-mock"
+        other_repo.url = URL("https://github.com/MockQiskit/other")
+        other_repo.uuid = "11111111-2222-3333-4444-555555555555"
+        dao = DAO(self.path)
+        dao.write(main_repo)
+        dao.write(other_repo)
+
+        with patch("ecosystem.dao.tomllib.load", wraps=tomllib.load) as toml_load:
+            self.assertEqual(2, len(dao.get_all()))
+            self.assertEqual(main_repo, dao.get_by_url(str(main_repo.url)))
+            self.assertEqual(other_repo, dao[other_repo.name_id])
+            self.assertEqual(2, toml_load.call_count)
+
+            toml_path = self.path / "members" / f"{other_repo.name_id}.toml"
+            toml_path.write_text(
+                toml_path.read_text().replace('"other-mock"', '"renamed-mock"')
+            )
+            self.assertEqual("renamed-mock", dao[other_repo.name_id].name)
+            self.assertEqual(3, toml_load.call_count)
+
+            toml_path.unlink()
+            self.assertEqual(1, len(dao.get_all()))
+            self.assertEqual(3, toml_load.call_count)
+
+    def test_update_only_writes_changed_members(self):
+        """Tests that an update only rewrites the files of the changed members."""
+        main_repo = get_main_repo()
+        other_repo = get_main_repo()
+        other_repo.name = "other-mock"
+        other_repo.url = URL("https://github.com/MockQiskit/other")
+        other_repo.uuid = "11111111-2222-3333-4444-555555555555"
+        DAO(self.path).write(main_repo)
+        DAO(self.path).write(other_repo)
+
+        dao = DAO(self.path)
+        with patch("ecosystem.dao.os.replace", wraps=os.replace) as replace:
+            dao.update(main_repo.name_id, description="New description")
+            dao.update(other_repo.name_id, description=other_repo.description)
+            dao.update(main_repo.name_id, description="New description")
+        self.assertEqual(
+            [f"{main_repo.name_id}.toml"],
+            [
+                Path(c.args[1]).name
+                for c in replace.call_args_list
+                if Path(c.args[1]).suffix == ".toml"
+            ],
+        )
+        self.assertEqual(
+            "New description", DAO(self.path)[main_repo.name_id].description
+        )
+        self.assertEqual(
+            sorted(p.name for p in (self.path / "members").iterdir()),
+            sorted([f"{main_repo.name_id}.toml", f"{other_repo.name_id}.toml"]),
+        )
+
+    def test_refresh_files_writes_everything(self):
+        """Tests that refresh_files dumps all the members, changed or not."""
+        main_repo = get_main_repo()
+        dao = DAO(self.path)
+        dao.write(main_repo)
+        with patch("ecosystem.dao.os.replace", wraps=os.replace) as replace:
+            dao.refresh_files()
+        self.assertEqual(1, replace.call_count)
+        self.assertEqual(main_repo, dao[main_repo.name_id])
+
+    def test_file_modes(self):
+        """Tests that a rewritten file keeps its mode, and a new one gets the
+        mode of open() (not the 0600 of temporary files)."""
+        main_repo = get_main_repo()
+        toml_path = self.path / "members" / f"{main_repo.name_id}.toml"
+        with patch("ecosystem.dao.UMASK", 0o022):
+            DAO(self.path).write(main_repo)
+        self.assertEqual(0o644, toml_path.stat().st_mode & 0o777)
+
+        toml_path.chmod(0o664)
+        DAO(self.path).update(main_repo.name_id, description="New description")
+        self.assertEqual(0o664, toml_path.stat().st_mode & 0o777)
+
+    def test_snapshot(self):
+        """Tests that the TOML files are not parsed when the snapshot is up to date."""
+        main_repo = get_main_repo()
+        DAO(self.path).write(main_repo)
+        with patch("ecosystem.dao.UMASK", 0o022):
+            DAO(self.path).get_all()
+        self.assertEqual(0o644, (self.path / SNAPSHOT_FILE).stat().st_mode & 0o777)
+
+        with patch("ecosystem.dao.tomllib.load", wraps=tomllib.load) as toml_load:
+            self.assertEqual([main_repo], list(DAO(self.path).get_all()))
+            self.assertEqual(main_repo, DAO(self.path).get_by_url(main_repo.url))
+            self.assertEqual(0, toml_load.call_count)
+
+            toml_path = self.path / "members" / f"{main_repo.name_id}.toml"
+            toml_path.write_text(
+                toml_path.read_text().replace(main_repo.name, "renamed-mock")
+            )
+            self.assertEqual("renamed-mock", DAO(self.path)[main_repo.name_id].name)
+            self.assertEqual("renamed-mock", DAO(self.path)[main_repo.name_id].name)
+            self.assertEqual(1, toml_load.call_count)
+
+    def test_snapshot_unreadable_or_disabled(self):
+        """Tests that a broken snapshot is ignored, and that it can be disabled."""
+        main_repo = get_main_repo()
+        DAO(self.path).write(main_repo)
+        (self.path / SNAPSHOT_FILE).write_bytes(b"not a pickle")
+        with self.assertLogs("ecosystem", level="WARNING"):
+            self.assertEqual(main_repo, DAO(self.path)[main_repo.name_id])
+
+        (self.path / SNAPSHOT_FILE).unlink()
+        storage = TomlStorage(self.path, snapshot=False)
+        self.assertEqual([main_repo.name_id], list(storage.read()))
+        self.assertFalse((self.path / SNAPSHOT_FILE).exists())
+
+    def test_get_all_fields(self):
+        """Tests that get_all(fields=...) builds the members with only those fields."""
+        main_repo = get_main_repo()
+        main_repo.pypi = {"mock-terra": PyPIData("mock-terra")}
+        dao = DAO(self.path)
+        dao.write(main_repo)
+
+        (member,) = dao.get_all(fields=["labels"])
+        self.assertEqual(main_repo.name_id, member.name_id)
+        self.assertEqual(main_repo.labels, member.labels)
+        self.assertIsNone(member.url)
+        self.assertEqual({}, member.pypi)
+        (member,) = dao.get_all()
+        self.assertEqual(["mock-terra"], list(member.pypi))
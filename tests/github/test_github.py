@@ -12,14 +12,23 @@
 
 """Tests for ecosystem/github.py"""
 
+from contextlib import contextmanager
 from unittest import TestCase
 from unittest.mock import patch
 from datetime import date
-from ecosystem.github import GitHubData
+from ecosystem.github import GitHubData, graphql_repositories_query
 from ecosystem.request import URL
 from ecosystem.error_handling import EcosystemError
 
 
+@contextmanager
+def patch_request_json():
+    """Patches request_json, also for the requests made through fetch_all"""
+    with patch("ecosystem.github.request_json") as mock_request:
+        with patch("ecosystem.request.request_json", mock_request):
+            yield mock_request
+
+
 class TestGitHubDataInit(TestCase):
     """Tests for GitHubData builder"""
 
@@ -259,7 +268,7 @@ class TestGitHubDataUpdateJson(TestCase):
         """fetches dependants for each package returned"""
         gh = GitHubData(owner="Qiskit", repo="qiskit-banana-compiler")
         fake_response = {"data": {}, "_requested_at_": "2024-01-01"}
-        with patch("ecosystem.github.request_json") as mock_request:
+        with patch_request_json() as mock_request:
             mock_request.side_effect = [
                 fake_response,  # for _json_repo
                 fake_response,  # for _json_events
@@ -270,6 +279,129 @@ class TestGitHubDataUpdateJson(TestCase):
             gh.update_json()
             self.assertIn("pkg1", gh.dependants())
 
+    def test_update_json_aggregates_dependants_failures(self):
+        """the packages whose dependants fail are reported in one warning"""
+        gh = GitHubData(owner="Qiskit", repo="qiskit-banana-compiler")
+        dependants = {
+            "id1": {"repositories": 10, "packages": 1},
+            "id2": EcosystemError("Bad response: Not Found (404)"),
+            "id3": EcosystemError("Bad response: Unicorn (500)"),
+        }
+
+        def request_json(url, **_kwargs):
+            if "package_id=" in url:
+                result = dependants[url.rsplit("=", 1)[1]]
+                if isinstance(result, Exception):
+                    raise result
+                return result
+            if "network/dependents" in url:
+                return {"pkg1": "id1", "pkg2": "id2", "pkg3": "id3"}
+            return {"data": []}
+
+        with patch_request_json() as mock_request:
+            mock_request.side_effect = request_json
+            with self.assertLogs("ecosystem", level="WARNING") as logs:
+                gh.update_json()
+
+        warnings = [r for r in logs.records if r.levelname == "WARNING"]
+        self.assertEqual(len(warnings), 1)
+        self.assertIn("2 out of 3 packages", warnings[0].getMessage())
+        self.assertEqual(list(gh.dependants()), ["pkg1"])
+        self.assertEqual(gh.total_dependent_repositories, 10)
+        self.assertEqual(gh.total_dependent_packages, 1)
+
+
+def graphql_repository(owner, repo, **fields):
+    """A repository, as returned by the GraphQL API"""
+    return {
+        "name": repo,
+        "owner": {"login": owner},
+        "url": f"https://github.com/{owner}/{repo}",
+        "stargazerCount": 42,
+        "homepageUrl": "",
+        "description": "A banana compiler",
+        "isPrivate": False,
+        "isArchived": False,
+        "isDisabled": False,
+        "pushedAt": "2024-01-01T00:00:00Z",
+        "licenseInfo": {"name": "Apache License 2.0", "spdxId": "Apache-2.0"},
+        "issues": {"nodes": [{"updatedAt": "2024-03-01T00:00:00Z"}]},
+        "pullRequests": {"nodes": []},
+    } | fields
+
+
+@patch.dict(GitHubData.prefetched, clear=True)
+class TestGitHubDataPrefetch(TestCase):
+    """Tests for GitHubData.prefetch"""
+
+    def test_query_aliases_each_repository(self):
+        """each repository gets an alias in the query"""
+        query = graphql_repositories_query([("Qiskit", "qiskit"), ("a", 'b"c')])
+        self.assertIn('r0: repository(owner: "Qiskit", name: "qiskit")', query)
+        self.assertIn('r1: repository(owner: "a", name: "b\\"c")', query)
+        self.assertIn("fragment repositoryFields on Repository", query)
+
+    def test_prefetch_in_batches(self):
+        """one GraphQL request per batch, missing repositories are skipped"""
+        github_datas = [
+            GitHubData(owner="Qiskit", repo=f"banana-{i}") for i in range(3)
+        ]
+        with patch("ecosystem.github.request_json") as mock_request:
+            mock_request.side_effect = [
+                {
+                    "data": {
+                        "r0": graphql_repository("Qiskit", "banana-0"),
+                        "r1": None,
+                    },
+                    "errors": [{"type": "NOT_FOUND"}],
+                },
+                {"data": {"r0": graphql_repository("Qiskit", "banana-2")}},
+            ]
+            prefetched = GitHubData.prefetch(github_datas, batch_size=2, token="t")
+        self.assertEqual(prefetched, 2)
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(mock_request.call_args.args[0], "api.github.com/graphql")
+        self.assertEqual(
+            set(GitHubData.prefetched), {("qiskit", "banana-0"), ("qiskit", "banana-2")}
+        )
+
+    def test_update_json_uses_prefetched_data(self):
+        """update_json skips the REST requests for prefetched repositories"""
+        gh = GitHubData(owner="Qiskit", repo="qiskit-banana-compiler")
+        with patch("ecosystem.github.request_json") as mock_request:
+            mock_request.side_effect = [
+                {
+                    "data": {
+                        "r0": graphql_repository(
+                            "Qiskit", "qiskit-banana", isArchived=True
+                        )
+                    }
+                },
+                None,  # for _json_contributors_sidebar
+                {},  # for _json_package_ids
+            ]
+            GitHubData.prefetch([gh], token="t")
+            gh.update_json()
+            gh.update_owner_repo()
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(gh.stars, 42)
+        self.assertTrue(gh.archived)
+        self.assertIsNone(gh.homepage)
+        self.assertEqual(gh.last_commit, date(2024, 1, 1))
+        self.assertEqual(gh.last_activity, date(2024, 3, 1))
+        self.assertEqual(gh.license.spdx_id, "Apache-2.0")
+        self.assertEqual(gh.url, "https://github.com/Qiskit/qiskit-banana")
+        self.assertEqual(gh.repo, "qiskit-banana")
+        self.assertEqual(GitHubData.prefetched, {})
+
+    def test_no_token_no_prefetch(self):
+        """the GraphQL API needs a token"""
+        with patch.dict("os.environ", {"GH_TOKEN": ""}):
+            with patch("ecosystem.github.request_json") as mock_request:
+                prefetched = GitHubData.prefetch([GitHubData("Qiskit", "qiskit")])
+        self.assertEqual(prefetched, 0)
+        mock_request.assert_not_called()
+
 
 class TestGitHubDataProperties(TestCase):
     """Tests for dependants, contributors, and property methods"""
@@ -284,7 +416,7 @@ class TestGitHubDataProperties(TestCase):
     def test_total_dependent_repositories_sums_correctly(self):
         """sums repositories across all packages in dependants"""
         gh = GitHubData(owner="Qiskit", repo="qiskit-banana-compiler")
-        with patch("ecosystem.github.request_json") as mock_request:
+        with patch_request_json() as mock_request:
             mock_request.side_effect = [
                 {"_requested_at_": "2024-01-01"},
                 {"data": [], "_requested_at_": "2024-01-01"},
@@ -299,7 +431,7 @@ class TestGitHubDataProperties(TestCase):
     def test_total_dependent_packages_sums_correctly(self):
         """sums packages across all packages in dependants"""
         gh = GitHubData(owner="Qiskit", repo="qiskit-banana-compiler")
-        with patch("ecosystem.github.request_json") as mock_request:
+        with patch_request_json() as mock_request:
             mock_request.side_effect = [
                 {"_requested_at_": "2024-01-01"},
                 {"data": [], "_requested_at_": "2024-01-01"},
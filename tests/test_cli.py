@@ -16,13 +16,19 @@ import io
 import os
 import shutil
 import tempfile
+import time
 from unittest import TestCase, mock
 from contextlib import redirect_stdout
 from pathlib import Path
 
 from ecosystem.cli import CliCI, CliMembers
 from ecosystem.dao import DAO
+from ecosystem.error_handling import logger
+from ecosystem.github import GitHubData
 from ecosystem.member import Member
+from ecosystem.request import fetch_all
+
+from .test_request import fake_response
 
 
 def get_community_repo() -> Member:
@@ -253,3 +259,78 @@ class TestCli(TestCase):
         self.assertTrue('"color": "6929C4"' in json_success)
 
         os.remove(f"{badges_folder_path}/{commu_success.short_uuid}")
+
+    def test_update_member_data_with_workers(self):
+        """Tests that concurrent updates keep the output of each member grouped and in order."""
+        dao = DAO(self.path)
+        members = []
+        for i in range(4):
+            member = get_community_repo()
+            member.name = f"mock-qiskit-{i}"
+            member.uuid = f"{i}{i}{i}{i}{i}{i}{i}{i}-0000-0000-0000-000000000000"
+            member.url = f"https://github.com/MockQiskit/mock-qiskit-{i}"
+            dao.write(member)
+            members.append(member)
+        order = [m.name for m in DAO(self.path).get_all()]
+
+        def update_github(member):
+            # the first members take longer, so they finish last
+            time.sleep(0.01 * (4 - int(member.name[-1])))
+            logger.info("logging from %s", member.name)
+            member.description = f"updated {member.name}"
+
+        captured_output = io.StringIO()
+        with mock.patch.object(GitHubData, "prefetch"):
+            with mock.patch.object(Member, "update_github", update_github):
+                with mock.patch.object(Member, "update_pypi"):
+                    with mock.patch.object(Member, "update_julia"):
+                        with redirect_stdout(captured_output):
+                            CliCI.update_member_data(resources_dir=self.path, workers=4)
+
+        groups = captured_output.getvalue().split("::endgroup::")
+        self.assertEqual(len(groups), 5)
+        for name, group in zip(order, groups):
+            self.assertIn(f"::group:: {name}", group)
+            self.assertIn(f"logging from {name}", group)
+        for member in DAO(self.path).get_all():
+            self.assertEqual(member.description, f"updated {member.name}")
+
+    def test_update_member_data_logs_of_nested_requests(self):
+        """Tests that the logs of the requests fetched concurrently by a member
+        update (in other threads) are kept in the group of the member."""
+        dao = DAO(self.path)
+        for i in range(3):
+            member = get_community_repo()
+            member.name = f"mock-qiskit-{i}"
+            member.uuid = f"{i}{i}{i}{i}{i}{i}{i}{i}-0000-0000-0000-000000000000"
+            member.url = f"https://github.com/MockQiskit/mock-qiskit-{i}"
+            dao.write(member)
+        order = [m.name for m in DAO(self.path).get_all()]
+
+        def update_github(member):
+            fetch_all({i: {"url": f"example.com/{member.name}/{i}"} for i in range(3)})
+
+        not_found = fake_response(ok=False, reason="Not Found", status_code=404)
+        captured_output = io.StringIO()
+        with (
+            mock.patch(
+                "ecosystem.request.requests.Session.get", return_value=not_found
+            ),
+            mock.patch("ecosystem.request.time.sleep"),
+            mock.patch.object(GitHubData, "prefetch"),
+            mock.patch.object(Member, "update_github", update_github),
+            mock.patch.object(Member, "update_pypi"),
+            mock.patch.object(Member, "update_julia"),
+            redirect_stdout(captured_output),
+        ):
+            CliCI.update_member_data(resources_dir=self.path, workers=3)
+
+        groups = captured_output.getvalue().split("::endgroup::")
+        self.assertEqual(len(groups), 4)
+        for name, group in zip(order, groups):
+            self.assertIn(f"::group:: {name}", group)
+            for other in order:
+                self.assertEqual(
+                    group.count(f"Bad response https://example.com/{other}/"),
+                    3 if other == name else 0,
+                )
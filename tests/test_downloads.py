@@ -0,0 +1,109 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for ecosystem/downloads.py."""
+
+from datetime import date, timedelta
+import os
+import tempfile
+from unittest import TestCase
+
+from ecosystem.downloads import DownloadsStore
+from ecosystem.error_handling import EcosystemError
+
+
+class TestDownloadsStore(TestCase):
+    """Test class for ecosystem.downloads.DownloadsStore."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = tmp_dir.name
+        self.store = DownloadsStore(os.path.join(self.tmp_dir, "store.sqlite"))
+
+    def write_csv(self, text):
+        """Writes text in a CSV file in the temporary directory, returning its path"""
+        path = os.path.join(self.tmp_dir, "export.csv")
+        with open(path, "w", encoding="utf-8") as csv_file:
+            csv_file.write(text)
+        return path
+
+    def test_stats_windows(self):
+        """Tests the last month and last 180 days, up to the last stored day"""
+        last_day = date(2026, 6, 30)
+        rows = []
+        for days_ago in range(365):
+            day = (last_day - timedelta(days=days_ago)).isoformat()
+            rows += [(day, "with_mirrors", 2), (day, "without_mirrors", 1)]
+        self.store.add("Banana_Compiler", rows)
+
+        self.assertEqual(
+            self.store.stats("banana-compiler"),
+            {
+                "recent_downloads": {"last_month": 30},
+                "overall_downloads": {"with_mirrors": 360, "without_mirrors": 180},
+            },
+        )
+        self.assertEqual(self.store.stats("other"), {})
+
+    def test_fresh_until(self):
+        """Tests that packages are fresh until the given day"""
+        today = date(2026, 6, 30)
+        self.assertFalse(self.store.is_fresh("banana", today))
+        self.store.add("banana", [], fresh_until=today)
+        self.assertTrue(self.store.is_fresh("banana", today))
+        self.assertFalse(self.store.is_fresh("banana", today + timedelta(days=1)))
+
+    def test_newer_rows_replace_older(self):
+        """Tests that the same day and category is stored once, the last one"""
+        self.store.add("banana", [("2026-06-30", "without_mirrors", 1)])
+        self.store.add("banana", [("2026-06-30", "without_mirrors", 5)])
+        self.assertEqual(
+            self.store.stats("banana")["recent_downloads"]["last_month"], 5
+        )
+
+    def test_ingest_csv(self):
+        """Tests loading a BigQuery-like export"""
+        path = self.write_csv(
+            "file_project,download_date,num_downloads\n"
+            "banana,2026-06-29,3\n"
+            "banana,2026-06-30,4\n"
+            "Apple,2026-06-01,1\n"
+        )
+
+        self.assertEqual(self.store.ingest_csv(path), 3)
+
+        self.assertEqual(
+            self.store.stats("banana")["recent_downloads"]["last_month"], 7
+        )
+        self.assertTrue(self.store.is_fresh("banana", date(2026, 7, 1)))
+        self.assertFalse(self.store.is_fresh("banana", date(2026, 7, 2)))
+        self.assertTrue(self.store.is_fresh("apple", date(2026, 6, 2)))
+
+    def test_ingest_csv_with_categories(self):
+        """Tests that the category column is used when there is one"""
+        path = self.write_csv(
+            "package,date,category,downloads\n"
+            "banana,2026-06-30,with_mirrors,9\n"
+            "banana,2026-06-30,without_mirrors,4\n"
+        )
+        self.store.ingest_csv(path)
+        self.assertEqual(
+            self.store.stats("banana")["overall_downloads"],
+            {"with_mirrors": 9, "without_mirrors": 4},
+        )
+
+    def test_ingest_csv_without_required_columns(self):
+        """Tests that a CSV without downloads is an error"""
+        path = self.write_csv("package,date\nbanana,2026-06-30\n")
+        with self.assertRaises(EcosystemError):
+            self.store.ingest_csv(path)
@@ -0,0 +1,240 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for ecosystem/failures.py, and how request_json uses it."""
+
+from datetime import timedelta
+import json
+import os
+from pathlib import Path
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+
+from ecosystem.error_handling import EcosystemError
+from ecosystem.failures import CircuitBreaker, NegativeCache, backoff_delay
+from ecosystem.recording import ExchangeArchive
+from ecosystem.request import request_json
+
+from .test_request import METADATA, NOW, fake_response
+
+NOT_FOUND = r"Bad response https://example.com/x: Not Found \(404\)"
+
+
+def not_found():
+    """A 404 response"""
+    return fake_response(ok=False, reason="Not Found", status_code=404)
+
+
+def unavailable():
+    """A 503 response"""
+    return fake_response(ok=False, reason="Service Unavailable", status_code=503)
+
+
+class FailuresTestCase(TestCase):
+    """Base class with a patched negative cache, circuit breaker, clock and GET."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = Path(tmp_dir.name) / "failures.json"
+        self.negative_cache = NegativeCache(self.path)
+        self.circuit_breaker = CircuitBreaker(threshold=3, cooldown=100)
+        self.now = NOW
+        self.start_patch("ecosystem.request.negative_cache", self.negative_cache)
+        self.start_patch("ecosystem.request.circuit_breaker", self.circuit_breaker)
+        self.start_patch("ecosystem.failures.time.time", lambda: self.now)
+        self.sleep = self.start_patch("ecosystem.request.time.sleep")
+        self.get = self.start_patch("ecosystem.request.requests.Session.get")
+
+    def start_patch(self, *args, **kwargs):
+        """Starts a patch, that is stopped at the end of the test"""
+        patcher = patch(*args, **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+
+class TestNegativeCache(FailuresTestCase):
+    """Test class for ecosystem.failures.NegativeCache."""
+
+    def test_remembered_failures(self):
+        """Tests that a failed GET is not requested again while remembered"""
+        self.get.return_value = not_found()
+        with self.negative_cache.run():
+            for _ in range(2):
+                with self.assertRaisesRegex(EcosystemError, NOT_FOUND):
+                    request_json("example.com/x")
+            self.assertEqual(self.get.call_count, 1)
+            self.assertEqual(self.negative_cache.hits, 1)
+
+            # other requests are not affected
+            self.get.return_value = fake_response('{"a": 1}')
+            self.assertEqual(
+                request_json("example.com/x", headers={"Accept": "text/html"})["a"], 1
+            )
+
+        # in the next run, until it expires
+        with self.negative_cache.run():
+            with self.assertRaisesRegex(EcosystemError, NOT_FOUND):
+                request_json("example.com/x")
+            self.now += timedelta(days=3).total_seconds()
+            self.assertEqual(request_json("example.com/x"), {"a": 1} | METADATA)
+        self.assertEqual(json.loads(self.path.read_text()), {})
+
+    def test_not_remembered(self):
+        """Tests the failures that are requested again"""
+        self.get.return_value = fake_response(
+            ok=False, reason="Forbidden", status_code=403
+        )
+        with self.negative_cache.run():
+            for _ in range(2):
+                with self.assertRaises(EcosystemError):
+                    request_json("example.com/x")
+            with patch(
+                "ecosystem.request.requests.Session.post", return_value=not_found()
+            ) as post:
+                for _ in range(2):
+                    with self.assertRaises(EcosystemError):
+                        request_json("example.com/x", post={})
+        self.assertEqual(self.get.call_count, 2)
+        self.assertEqual(post.call_count, 2)
+        # without failures to remember, the file is not created
+        self.assertFalse(self.path.exists())
+
+        # nor outside of a run
+        self.get.return_value = not_found()
+        for _ in range(2):
+            with self.assertRaises(EcosystemError):
+                request_json("example.com/x")
+        self.assertEqual(self.get.call_count, 4)
+
+    def test_ttls(self):
+        """Tests the TTLs by status code and class, and their configuration"""
+        self.assertEqual(self.negative_cache.ttl(404), 3 * 24 * 3600)
+        self.assertEqual(self.negative_cache.ttl(400), 6 * 3600)
+        self.assertEqual(self.negative_cache.ttl(403), 0)
+        self.assertEqual(self.negative_cache.ttl(502), 30 * 60)
+        with patch.dict(os.environ, {"ECOSYSTEM_NEGATIVE_CACHE_TTL": "404=1,5XX=0"}):
+            negative_cache = NegativeCache(self.path)
+        self.assertEqual(negative_cache.ttl(404), 3600)
+        self.assertEqual(negative_cache.ttl(502), 0)
+        with self.assertRaises(EcosystemError):
+            NegativeCache.parse_ttls("404=never")
+
+    def test_unreadable_file(self):
+        """Tests that a broken file is ignored"""
+        self.path.write_text("{")
+        self.get.return_value = not_found()
+        with self.negative_cache.run():
+            with self.assertRaises(EcosystemError):
+                request_json("example.com/x")
+        self.assertEqual(len(json.loads(self.path.read_text())), 1)
+
+
+class TestRetries(FailuresTestCase):
+    """Tests for the retries with backoff of request_json."""
+
+    def test_backoff_delay(self):
+        """Tests that the delays grow exponentially, with jitter, up to a maximum"""
+        with patch("ecosystem.failures.random.uniform", lambda a, b: b):
+            self.assertEqual(
+                [backoff_delay(n) for n in range(7)], [2, 4, 8, 16, 32, 60, 60]
+            )
+        delays = {backoff_delay(3) for _ in range(10)}
+        self.assertGreater(len(delays), 1)
+        self.assertTrue(all(0 <= delay <= 16 for delay in delays))
+
+    def test_server_errors(self):
+        """Tests that a 5xx is tried again after a backoff"""
+        self.get.side_effect = [unavailable(), unavailable(), fake_response('{"a": 1}')]
+        self.assertEqual(request_json("example.com/x"), {"a": 1} | METADATA)
+        self.assertEqual(self.get.call_count, 3)
+        self.assertEqual(self.sleep.call_count, 2)
+
+        self.get.side_effect = [unavailable()] * 3
+        with self.assertRaisesRegex(EcosystemError, r"Service Unavailable \(503\)"):
+            request_json("example.com/x")
+        self.assertEqual(self.get.call_count, 6)
+
+    def test_no_response(self):
+        """Tests that connection errors are tried again, and raised at the end"""
+        self.get.side_effect = [requests.ConnectionError, fake_response('{"a": 1}')]
+        self.assertEqual(request_json("example.com/x")["a"], 1)
+        self.get.side_effect = requests.Timeout
+        with self.assertRaises(requests.Timeout):
+            request_json("example.com/x")
+        self.assertEqual(self.get.call_count, 5)
+
+    def test_not_when_replaying(self):
+        """Tests that recorded runs are replayed as they happened"""
+        archive = ExchangeArchive()
+        self.get.return_value = unavailable()
+        with (
+            patch("ecosystem.request.exchange_archive", archive),
+            self.negative_cache.run(),
+        ):
+            with archive.record(self.path.parent / "exchanges"):
+                with self.assertRaises(EcosystemError):
+                    request_json("example.com/x")
+            with archive.replay(self.path.parent / "exchanges"):
+                with self.assertRaises(EcosystemError):
+                    request_json("example.com/x")
+        self.assertEqual(self.get.call_count, 1)
+
+
+class TestCircuitBreaker(FailuresTestCase):
+    """Test class for ecosystem.failures.CircuitBreaker."""
+
+    def test_circuit(self):
+        """Tests that a failing host is not requested until the cooldown ends"""
+        self.get.return_value = unavailable()
+        with self.circuit_breaker.run():
+            # 3 tries, so the circuit opens
+            with self.assertRaisesRegex(EcosystemError, "Service Unavailable"):
+                request_json("example.com/x")
+            self.assertEqual(self.get.call_count, 3)
+            with self.assertRaisesRegex(EcosystemError, "keeps failing"):
+                request_json("example.com/y")
+            self.assertEqual(self.get.call_count, 3)
+            self.assertEqual(self.circuit_breaker.rejected, 1)
+
+            # other hosts are requested
+            self.get.return_value = fake_response('{"a": 1}')
+            self.assertEqual(request_json("example.org/x")["a"], 1)
+
+            # after the cooldown, one request tries again and closes it
+            self.now += 100
+            self.assertEqual(request_json("example.com/y")["a"], 1)
+            self.assertEqual(request_json("example.com/y")["a"], 1)
+        self.assertEqual(self.circuit_breaker.rejected, 0)
+
+    def test_trial_fails(self):
+        """Tests that the circuit opens again if the trial fails"""
+        self.get.side_effect = requests.ConnectionError
+        with self.circuit_breaker.run():
+            with self.assertRaises(requests.ConnectionError):
+                request_json("example.com/x")
+            self.now += 100
+            with self.assertRaisesRegex(EcosystemError, "keeps failing"):
+                # the trial fails, and the retry finds the circuit open
+                request_json("example.com/x")
+            self.assertEqual(self.get.call_count, 4)
+
+    def test_outside_a_run(self):
+        """Tests that the circuits do not open outside of a run"""
+        self.get.return_value = unavailable()
+        for _ in range(2):
+            with self.assertRaisesRegex(EcosystemError, "Service Unavailable"):
+                request_json("example.com/x")
+        self.assertEqual(self.get.call_count, 6)
@@ -1,12 +1,17 @@
 """Tests for ecosystem/julia.py."""
 
 from datetime import date
+import gzip
+from io import BytesIO
+import os
+import tempfile
 from unittest import TestCase
 from unittest.mock import patch
 from urllib.parse import urlparse
 
 from ecosystem.error_handling import EcosystemError
-from ecosystem.julia import JuliaData
+from ecosystem import julia
+from ecosystem.julia import GeneralRegistry, JuliaData, PackageRequests
 from ecosystem.request import URL
 
 PACKAGE_NAME = "BananaCompiler"
@@ -20,9 +25,11 @@ STATS_URL = (
     "https://julialang-logs.s3.amazonaws.com/public_outputs/"
     "current/package_requests.csv.gz"
 )
+REGISTRY_COMMIT = "0123456789abcdef"
+COMMIT_URL = "api.github.com/repos/JuliaRegistries/General/commits/master"
 REGISTRY_URL = (
     "https://raw.githubusercontent.com/JuliaRegistries/"
-    "General/refs/heads/master/Registry.toml"
+    f"General/{REGISTRY_COMMIT}/Registry.toml"
 )
 TREE_URL = f"https://github.com/JuliaRegistries/General/tree/master/{PACKAGE_PATH}"
 PKGSTATS_TOTAL_URL = "https://juliapkgstats.com/api/v2/total_downloads/BananaCompiler/"
@@ -33,7 +40,13 @@ PKGSTATS_MONTHLY_URL = (
 DEFAULT_JSONS = {
     PACKAGE_JSON_URL: {"uuid": PACKAGE_UUID},
     JULIAHUB_URL: {},
-    STATS_URL: {"request_addrs": "42"},
+    # package_requests.csv.gz
+    STATS_URL: gzip.compress(
+        b"package_uuid,status,client_type,request_addrs\n"
+        b"banana-compiler-uuid,200,ci,1\n"
+        b"banana-compiler-uuid,200,user,42\n"
+    ),
+    COMMIT_URL: {"sha": REGISTRY_COMMIT},
     REGISTRY_URL: {
         "packages": {PACKAGE_UUID: {"name": PACKAGE_NAME, "path": PACKAGE_PATH}}
     },
@@ -43,21 +56,60 @@ DEFAULT_JSONS = {
 }
 
 
-class TestJuliaData(TestCase):
-    """Tests for Julia project metadata."""
+class JuliaTestCase(TestCase):
+    """Base class for the tests with mocked Julia requests."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(tmp_dir.cleanup)
+        db_path = os.path.join(tmp_dir.name, "package_requests.sqlite")
+        patcher = patch.object(PackageRequests, "db_path", db_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        PackageRequests.reset()
+        self.addCleanup(PackageRequests.reset)
+        self.index_path = os.path.join(tmp_dir.name, "general_registry.json")
+        patcher = patch.object(GeneralRegistry, "index_path", self.index_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        GeneralRegistry.reset()
+        self.addCleanup(GeneralRegistry.reset)
+        # run the batched requests through the (mocked) julia.request_json
+        patcher = patch("ecosystem.julia.fetch_all", side_effect=self._fetch_all)
+        self.fetch_all = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _fetch_all(calls, max_workers=None):  # pylint: disable=unused-argument
+        results = {}
+        for key, kwargs in calls.items():
+            kwargs = dict(kwargs)
+            try:
+                results[key] = julia.request_json(kwargs.pop("url"), **kwargs)
+            except EcosystemError as err:
+                results[key] = err
+        return results
 
     def _mock_request_json(self, responses):
 
-        def request_json(url, **_kwargs):
+        def request_json(url, **kwargs):
             if url not in responses:
                 raise AssertionError(f"unexpected network request: {url}")
             payload = responses[url]
             if isinstance(payload, Exception):
                 raise payload
+            if isinstance(payload, bytes):
+                # the large files are streamed, and parsed as binary files
+                self.assertTrue(kwargs.get("stream"))
+                return kwargs["parser"](BytesIO(payload))
             return payload
 
         return request_json
 
+
+class TestJuliaData(JuliaTestCase):
+    """Tests for Julia project metadata."""
+
     def test_from_url_accepts_juliahub_ui_url(self):
         """JuliaHub URLs include the registry and package name in the path."""
         data = JuliaData.from_url(urlparse(JULIAHUB_URL))
@@ -154,7 +206,7 @@ class TestJuliaData(TestCase):
 
         self.assertEqual(
             [call.args[0] for call in request_json.call_args_list],
-            [REGISTRY_URL, TREE_URL],
+            [COMMIT_URL, REGISTRY_URL, TREE_URL],
         )
         self.assertEqual(data.general_registry_url, URL(TREE_URL))
 
@@ -175,13 +227,15 @@ class TestJuliaData(TestCase):
 
         with patch(
             "ecosystem.julia.request_json",
-            side_effect=self._mock_request_json({REGISTRY_URL: registry}),
+            side_effect=self._mock_request_json(
+                {COMMIT_URL: {"sha": REGISTRY_COMMIT}, REGISTRY_URL: registry}
+            ),
         ) as request_json:
             self.assertIsNone(data.get_general_registry_url())
 
         self.assertEqual(
             [call.args[0] for call in request_json.call_args_list],
-            [REGISTRY_URL],
+            [COMMIT_URL, REGISTRY_URL],
         )
         self.assertIsNone(data.general_registry_url)
 
@@ -221,3 +275,108 @@ class TestJuliaData(TestCase):
         self.assertEqual(data.estimated_unique_users, 42)
         self.assertEqual(data.juliahub_url, URL(JULIAHUB_URL))
         self.assertEqual(data.general_registry_url, URL(TREE_URL))
+
+
+class TestGeneralRegistry(JuliaTestCase):
+    """Tests for the shared General registry index."""
+
+    def _fetched_urls(self, julia_datas, responses=None):
+        with patch(
+            "ecosystem.julia.request_json",
+            side_effect=self._mock_request_json(responses or DEFAULT_JSONS),
+        ) as request_json:
+            for julia_data in julia_datas:
+                julia_data.get_general_registry_url()
+        return [call.args[0] for call in request_json.call_args_list]
+
+    def test_registry_is_fetched_once_per_run(self):
+        """Many packages cost one registry parse and one check per tree."""
+        datas = [JuliaData(package_name=PACKAGE_NAME) for _ in range(3)]
+
+        self.assertEqual(
+            self._fetched_urls(datas), [COMMIT_URL, REGISTRY_URL, TREE_URL]
+        )
+        for data in datas:
+            self.assertEqual(data.general_registry_url, URL(TREE_URL))
+
+    def test_index_is_reused_for_the_same_commit(self):
+        """The persisted index is used while the registry commit is the same."""
+        self._fetched_urls([JuliaData(package_name=PACKAGE_NAME)])
+        GeneralRegistry.reset()
+
+        self.assertEqual(
+            self._fetched_urls([JuliaData(package_name=PACKAGE_NAME)]),
+            [COMMIT_URL, TREE_URL],
+        )
+
+        GeneralRegistry.reset()
+        new_registry_url = REGISTRY_URL.replace(REGISTRY_COMMIT, "fedcba")
+        self.assertEqual(
+            self._fetched_urls(
+                [JuliaData(package_name=PACKAGE_NAME)],
+                DEFAULT_JSONS
+                | {
+                    COMMIT_URL: {"sha": "fedcba"},
+                    new_registry_url: DEFAULT_JSONS[REGISTRY_URL],
+                },
+            ),
+            [COMMIT_URL, new_registry_url, TREE_URL],
+        )
+
+    def test_without_commit_the_index_is_not_persisted(self):
+        """If the commit is unknown, the master registry is used for this run only."""
+        master_url = REGISTRY_URL.replace(REGISTRY_COMMIT, "refs/heads/master")
+        data = JuliaData(package_name=PACKAGE_NAME)
+
+        with self.assertLogs("ecosystem", level="WARNING"):
+            self._fetched_urls(
+                [data],
+                DEFAULT_JSONS
+                | {
+                    COMMIT_URL: EcosystemError("rate limit"),
+                    master_url: DEFAULT_JSONS[REGISTRY_URL],
+                },
+            )
+
+        self.assertEqual(data.general_registry_url, URL(TREE_URL))
+        self.assertFalse(os.path.exists(self.index_path))
+
+    def test_prefetch_checks_all_the_trees_at_once(self):
+        """JuliaData.prefetch batches the tree checks of all the packages."""
+        other_tree_url = TREE_URL.replace(PACKAGE_PATH, "O/Other")
+        responses = DEFAULT_JSONS | {
+            REGISTRY_URL: {
+                "packages": {
+                    PACKAGE_UUID: {"name": PACKAGE_NAME, "path": PACKAGE_PATH},
+                    "other-uuid": {"name": "Other", "path": "O/Other"},
+                }
+            },
+            other_tree_url: EcosystemError("Not Found"),
+        }
+        datas = [JuliaData(package_name=PACKAGE_NAME), JuliaData(package_name="Other")]
+
+        with patch(
+            "ecosystem.julia.request_json",
+            side_effect=self._mock_request_json(responses),
+        ):
+            JuliaData.prefetch(datas)
+        self.assertEqual(self.fetch_all.call_count, 1)
+        self.assertEqual(
+            set(self.fetch_all.call_args.args[0]), {PACKAGE_PATH, "O/Other"}
+        )
+
+        self.assertEqual(self._fetched_urls(datas, responses), [])
+        self.assertEqual(datas[0].general_registry_url, URL(TREE_URL))
+        self.assertIsNone(datas[1].general_registry_url)
+
+    def test_tree_check_with_request_metadata(self):
+        """A successful tree check sets the URL, with the metadata of request_json."""
+        data = JuliaData(package_name=PACKAGE_NAME)
+
+        self._fetched_urls(
+            [data],
+            DEFAULT_JSONS | {TREE_URL: {"__requested_at__": None, "__url__": TREE_URL}},
+        )
+
+        self.assertEqual(data.general_registry_url, URL(TREE_URL))
+        self.assertEqual(data.to_dict()["general_registry_url"], URL(TREE_URL))
@@ -14,18 +14,32 @@
 
 from datetime import date
 import json
+import os
 import tempfile
 import unittest
 from unittest.mock import mock_open, patch
 
+from packaging.specifiers import SpecifierSet
+
+from ecosystem.downloads import DownloadsStore
 from ecosystem.error_handling import EcosystemError
-from ecosystem.pypi import PyPIData
+from ecosystem.pypi import PyPIData, QiskitReleases
 from ecosystem.request import URL
 
 
 class TestPyPIData(unittest.TestCase):  # pylint: disable=too-many-public-methods
     """Tests for PyPIData."""
 
+    def setUp(self):
+        QiskitReleases.reset()
+        self.addCleanup(QiskitReleases.reset)
+        tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(tmp_dir.cleanup)
+        store = DownloadsStore(os.path.join(tmp_dir.name, "downloads.sqlite"))
+        patcher = patch("ecosystem.pypi.downloads_store", store)
+        self.downloads_store = patcher.start()
+        self.addCleanup(patcher.stop)
+
     def _update_with_pypi_json(self, pypi_data, pypi_payload):
         """Populate a PyPIData object through its public update flow."""
         with patch("ecosystem.pypi.request_json", return_value=pypi_payload):
@@ -159,6 +173,32 @@ class TestPyPIData(unittest.TestCase):  # pylint: disable=too-many-public-method
             del PyPIData.json_types["$.values.*"]
             del PyPIData.reduce["$.values.*"]
 
+    def test_getattr_values_are_memoized_until_update_json(self):
+        """Attributes are evaluated once per fetched JSON, with compiled queries."""
+        pypi_data = PyPIData("banana-compiler")
+        classifiers = ["Development Status :: 4 - Beta", "Framework :: Qiskit"]
+        self._update_with_pypi_json(
+            pypi_data, {"info": {"version": "1.2.3", "classifiers": classifiers}}
+        )
+        # compiles the queries, if no other test did before
+        self.assertEqual("4 - Beta", pypi_data.development_status)
+
+        other_data = PyPIData("banana-compiler")
+        self._update_with_pypi_json(
+            other_data, {"info": {"classifiers": ["Development Status :: 5"]}}
+        )
+        with patch("ecosystem.serializable.jsonpath.compile") as compile_query:
+            self.assertEqual("5", other_data.development_status)
+        compile_query.assert_not_called()
+
+        classifiers[0] = "Development Status :: 6 - Mature"
+        self.assertEqual("4 - Beta", pypi_data.development_status)
+        self._update_with_pypi_json(
+            pypi_data, {"info": {"version": "1.2.4", "classifiers": classifiers}}
+        )
+        self.assertEqual("6 - Mature", pypi_data.development_status)
+        self.assertEqual("1.2.4", pypi_data.version)
+
     def test_getattr_reads_kwargs_without_pypi_json(self):
         """Keyword arguments are the fallback data source."""
         pypi_data = PyPIData("banana-compiler", version="1.2.3")
@@ -339,59 +379,110 @@ class TestPyPIData(unittest.TestCase):  # pylint: disable=too-many-public-method
                         with self.assertRaises(EcosystemError):
                             pypi_data.all_qiskit_versions(force_update=True)
 
-    def test_request_pypistats_combines_recent_and_overall_data(self):
-        """PyPIStats recent and overall responses are normalized."""
+    def test_all_qiskit_versions_are_fetched_once_per_run(self):
+        """Forced updates from many packages hit PyPI only once per run."""
+        qiskit_payload = {
+            "releases": {"1.0.0": [{"upload_time_iso_8601": "2024-01-01"}]}
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch("ecosystem.pypi.path.dirname", return_value=tmpdir):
+                with patch(
+                    "ecosystem.pypi.request_json", return_value=qiskit_payload
+                ) as request_json:
+                    first = PyPIData("banana-compiler").all_qiskit_versions(
+                        force_update=True
+                    )
+                    second = PyPIData("apple-compiler").all_qiskit_versions(
+                        force_update=True
+                    )
+                    QiskitReleases.reset()
+                    PyPIData("apple-compiler").all_qiskit_versions(force_update=True)
+
+        self.assertIs(first, second)
+        self.assertEqual(2, request_json.call_count)
+
+    def test_qiskit_releases_highest_in(self):
+        """The highest release matching a specifier honours every clause."""
+        releases = QiskitReleases(
+            {
+                version: {"upload_at": date(2024, 1, 1)}
+                for version in [
+                    "0.9.0",
+                    "0.10.0",
+                    "1.0.0rc1",
+                    "1.0.0",
+                    "1.1.0",
+                    "1.2.0",
+                    "1.2.1",
+                    "2.0.0",
+                ]
+            }
+        )
+
+        cases = {
+            "": "2.0.0",
+            ">=1,<2": "1.2.1",
+            "<1.2.1": "1.2.0",
+            "<=1.2.0": "1.2.0",
+            "<2,!=1.2.1,!=1.2.0": "1.1.0",
+            "~=0.9": "0.10.0",
+            "<1": "0.10.0",
+            "==1.0.0rc1": "1.0.0rc1",
+            ">=3": None,
+            "<0.9": None,
+        }
+        for specifier, expected in cases.items():
+            with self.subTest(specifier=specifier):
+                self.assertEqual(expected, releases.highest_in(SpecifierSet(specifier)))
+
+    def test_request_pypistats_aggregates_overall_data(self):
+        """PyPIStats daily downloads are stored and aggregated."""
         pypi_data = PyPIData("banana-compiler")
-        recent = {"type": "recent_downloads", "data": {"last_month": 42}}
         overall = {
             "type": "overall_downloads",
             "data": [
-                {"category": "with_mirrors", "downloads": 10},
-                {"category": "with_mirrors", "downloads": 11},
-                {"category": "without_mirrors", "downloads": 7},
-                {"category": "without_mirrors", "downloads": 8},
+                {"category": "with_mirrors", "date": "2026-01-01", "downloads": 10},
+                {"category": "with_mirrors", "date": "2026-05-01", "downloads": 11},
+                {"category": "without_mirrors", "date": "2026-01-01", "downloads": 7},
+                {"category": "without_mirrors", "date": "2026-05-01", "downloads": 8},
             ],
         }
 
-        with patch(
-            "ecosystem.pypi.request_json", side_effect=[recent, overall]
-        ) as request:
+        with patch("ecosystem.pypi.request_json", return_value=overall) as request:
             stats = pypi_data.request_pypistats()
 
         self.assertEqual(
             {
-                "recent_downloads": {"last_month": 42},
+                "recent_downloads": {"last_month": 8},
                 "overall_downloads": {"with_mirrors": 21, "without_mirrors": 15},
             },
             stats,
         )
-        self.assertEqual(
-            [
-                "https://pypistats.org/api/packages/banana-compiler/recent",
-                "https://pypistats.org/api/packages/banana-compiler/overall",
-            ],
-            [call.args[0] for call in request.call_args_list],
+        request.assert_called_once_with(
+            "https://pypistats.org/api/packages/banana-compiler/overall"
         )
 
-    def test_request_pypistats_returns_partial_data_for_missing_package(self):
-        """A PyPIStats 404 stops fetching and returns data collected so far."""
+    def test_request_pypistats_once_a_day(self):
+        """Packages fetched today (or ingested) are read from the downloads store."""
+        self.downloads_store.add("banana-compiler", [("2026-05-01", "with_mirrors", 3)])
+
+        with patch("ecosystem.pypi.request_json") as request:
+            stats = PyPIData("banana-compiler").request_pypistats()
+
+        request.assert_not_called()
+        self.assertEqual(3, stats["overall_downloads"]["with_mirrors"])
+
+    def test_request_pypistats_returns_no_data_for_missing_package(self):
+        """A PyPIStats 404 returns empty stats."""
         pypi_data = PyPIData("banana-compiler")
-        recent = {"type": "recent_downloads", "data": {"last_month": 42}}
 
         def missing_package(*_args, **_kwargs):
-            if missing_package.calls == 0:
-                missing_package.calls += 1
-                return recent
             raise EcosystemError("Bad response: Not Found (404)")
 
-        missing_package.calls = 0
-
         with patch("ecosystem.pypi.request_json", side_effect=missing_package):
             with self.assertLogs("ecosystem", level="ERROR"):
-                self.assertEqual(
-                    {"recent_downloads": {"last_month": 42}},
-                    pypi_data.request_pypistats(),
-                )
+                self.assertEqual({}, pypi_data.request_pypistats())
 
     def test_request_pypistats_reraises_non_404_errors(self):
         """Unexpected PyPIStats errors are re-raised."""
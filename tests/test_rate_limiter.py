@@ -0,0 +1,93 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the rate limiting of ecosystem/request.py."""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from ecosystem.request import RateLimiter, TokenBucket, retry_after_seconds
+
+from .test_request import NOW, fake_response
+
+
+class TestTokenBucket(TestCase):
+    """Test class for ecosystem.request.TokenBucket."""
+
+    def test_rate(self):
+        """Tests that requests are spaced by the rate, and tokens are refilled"""
+        bucket = TokenBucket(rate=1 / 3)
+        bucket.updated_at = NOW
+        for expected in [0, 3, 6]:
+            self.assertAlmostEqual(bucket.reserve(NOW), expected)
+        self.assertEqual(bucket.reserve(NOW + 20), 0)
+
+    def test_unlimited(self):
+        """Tests that there is no wait without a rate or a quota"""
+        bucket = TokenBucket()
+        self.assertEqual([bucket.reserve(NOW) for _ in range(100)], [0] * 100)
+
+    def test_exhausted_quota(self):
+        """Tests that an exhausted quota waits until its reset"""
+        bucket = TokenBucket()
+        bucket.quota = (0, 5000, NOW + 100)
+        self.assertEqual(bucket.reserve(NOW), 100)
+        self.assertEqual(bucket.reserve(NOW + 100), 0)
+        self.assertIsNone(bucket.quota)
+
+    def test_low_quota_is_spread_until_reset(self):
+        """Tests that the last requests of a quota are paced"""
+        bucket = TokenBucket()
+        bucket.quota = (10, 5000, NOW + 100)
+        self.assertEqual(bucket.reserve(NOW), 0)
+        self.assertAlmostEqual(bucket.reserve(NOW), 100 / 9)
+
+        bucket = TokenBucket()
+        bucket.quota = (4000, 5000, NOW + 100)
+        self.assertEqual([bucket.reserve(NOW) for _ in range(100)], [0] * 100)
+
+
+class TestRateLimiter(TestCase):
+    """Test class for ecosystem.request.RateLimiter."""
+
+    def test_quota_per_credential(self):
+        """Tests that the quota reported for a credential only applies to it"""
+        rate_limiter = RateLimiter({})
+        exhausted = fake_response(
+            headers={
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Limit": "60",
+                "X-RateLimit-Reset": str(NOW + 600),
+            }
+        )
+        with patch("ecosystem.request.time.time", return_value=NOW):
+            rate_limiter.update("api.github.com", "token a", exhausted)
+            self.assertEqual(rate_limiter.reserve("api.github.com", "token a"), 600)
+            self.assertEqual(rate_limiter.reserve("api.github.com", "token b"), 0)
+            self.assertEqual(rate_limiter.reserve("api.github.com"), 0)
+
+    def test_cached_responses_are_ignored(self):
+        """Tests that the headers of a cached response are not current"""
+        rate_limiter = RateLimiter({})
+        response = fake_response(headers={"Retry-After": "600"})
+        response.from_cache = True
+        with patch("ecosystem.request.time.time", return_value=NOW):
+            rate_limiter.update("example.com", None, response)
+            self.assertEqual(rate_limiter.reserve("example.com"), 0)
+
+    def test_retry_after_seconds(self):
+        """Tests that Retry-After can be seconds or an HTTP date"""
+        with patch("ecosystem.request.time.time", return_value=NOW):
+            self.assertEqual(retry_after_seconds("120"), 120)
+            self.assertEqual(retry_after_seconds("Mon, 12 Jan 1970 13:48:20 GMT"), 100)
+            self.assertIsNone(retry_after_seconds("soon"))
+            self.assertIsNone(retry_after_seconds(None))
@@ -0,0 +1,133 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for ecosystem/recording.py."""
+
+from datetime import datetime, timezone
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+
+from ecosystem.error_handling import EcosystemError
+from ecosystem.recording import ExchangeArchive
+from ecosystem.request import request_json
+
+from .test_request import RESPONSE_URL, fake_response
+
+# requests_cache sets created_at to a datetime
+CREATED_AT = datetime(2026, 8, 3, tzinfo=timezone.utc)
+METADATA = {"__requested_at__": CREATED_AT, "__url__": RESPONSE_URL}
+
+
+class TestExchangeArchive(TestCase):
+    """Test class for ecosystem.recording.ExchangeArchive."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = Path(tmp_dir.name)
+        patcher = patch("ecosystem.request.exchange_archive", ExchangeArchive())
+        self.archive = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def record(self):
+        """Records a GET (twice, with the same body), a POST and a 404"""
+        responses = [
+            fake_response('{"a": 1}', headers={"Set-Cookie": "x", "ETag": '"e"'}),
+            fake_response('{"a": 1}'),
+            fake_response(ok=False, reason="Not Found", status_code=404),
+        ]
+        posted = fake_response('{"b": 2}')
+        for response in responses + [posted]:
+            response.created_at = CREATED_AT
+        with (
+            self.archive.record(self.path),
+            patch(
+                "ecosystem.request.requests.Session.get", side_effect=responses
+            ) as get,
+            patch(
+                "ecosystem.request.requests.Session.post",
+                return_value=posted,
+            ),
+        ):
+            request_json("example.com/x", token="secret")
+            request_json("example.com/y", headers={"Accept": "text/html"})
+            request_json("example.com/x", post={"q": 1})
+            with self.assertRaises(EcosystemError):
+                request_json("example.com/z")
+        self.assertEqual(get.call_count, 3)
+
+    def test_record(self):
+        """Tests the archive written when recording"""
+        self.record()
+        index = json.loads((self.path / "index.json").read_text())
+        self.assertEqual(len(index), 4)
+        self.assertEqual(
+            sorted((entry["method"], entry["url"]) for entry in index.values()),
+            [
+                ("GET", "https://example.com/x"),
+                ("GET", "https://example.com/y"),
+                ("GET", "https://example.com/z"),
+                ("POST", "https://example.com/x"),
+            ],
+        )
+        # the same bodies are stored once
+        self.assertEqual(len(list((self.path / "objects").iterdir())), 3)
+        first = next(entry for entry in index.values() if entry["url"].endswith("x"))
+        self.assertEqual(first["headers"], {"ETag": '"e"'})
+        self.assertEqual(first["created_at"], CREATED_AT.isoformat())
+        self.assertNotIn("secret", (self.path / "index.json").read_text())
+
+    def test_replay(self):
+        """Tests that a recorded run is replayed without the network"""
+        self.record()
+        with (
+            self.archive.replay(self.path),
+            patch("ecosystem.request.requests.Session.get") as get,
+            patch("ecosystem.request.time.sleep") as sleep,
+        ):
+            self.assertEqual(
+                request_json("example.com/x", delay=10), {"a": 1} | METADATA
+            )
+            self.assertEqual(
+                request_json("example.com/y", headers={"Accept": "text/html"}),
+                {"a": 1} | METADATA,
+            )
+            self.assertEqual(request_json("example.com/x", post={"q": 1})["b"], 2)
+            with self.assertRaisesRegex(EcosystemError, r"Not Found \(404\)"):
+                request_json("example.com/z")
+            with self.assertRaises(requests.ConnectionError):
+                request_json("example.com/y")
+            with self.assertRaises(requests.ConnectionError):
+                request_json("example.com/x", post={"q": 2})
+        get.assert_not_called()
+        sleep.assert_not_called()
+        self.assertIsNone(self.archive.mode)
+
+    def test_from_env(self):
+        """Tests that the mode is chosen from the environment"""
+        path = self.path / "new"
+        with patch.dict(os.environ, {"ECOSYSTEM_RECORD": str(path)}):
+            with self.archive.from_env():
+                self.assertEqual(self.archive.mode, "record")
+        self.assertTrue((path / "index.json").exists())
+        with patch.dict(os.environ, {"ECOSYSTEM_REPLAY": str(path)}):
+            with self.archive.from_env():
+                self.assertTrue(self.archive.replaying)
+        with patch.dict(os.environ, {}, clear=True):
+            with self.archive.from_env():
+                self.assertIsNone(self.archive.mode)
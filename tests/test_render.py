@@ -0,0 +1,126 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for ecosystem/docs/render.py."""
+
+import io
+from pathlib import Path
+import shutil
+import tempfile
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from ecosystem.dao import DAO
+from ecosystem.docs.project_page import ProjectPage
+from ecosystem.docs.pypi_page import PypiPage
+from ecosystem.docs.render import render_member, render_members
+
+RESOURCES = Path(__file__).parent.parent / "resources"
+
+
+class TestRender(TestCase):
+    """Test class for ecosystem.docs.render."""
+
+    @classmethod
+    def setUpClass(cls):
+        tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        cls.addClassCleanup(tmp_dir.cleanup)
+        shutil.copytree(RESOURCES, Path(tmp_dir.name) / "resources")
+        cls.dao = DAO(path=Path(tmp_dir.name) / "resources")
+        cls.member_dicts = cls.dao.get_all_dicts()
+
+    def written_pages(self) -> dict:
+        """The pages written by write_page for each member, as they were written
+        before the rendering moved to ecosystem.docs.render"""
+        pages = {}
+
+        def open_page(filename, _):
+            pages[filename] = [io.StringIO(), None]
+            pages[filename][0].close = lambda: None
+            return pages[filename][0]
+
+        def set_edit_path(filename, edit_path):
+            pages[filename][1] = edit_path
+
+        gen_files = SimpleNamespace(open=open_page, set_edit_path=set_edit_path)
+        with patch("ecosystem.docs.project_page.mkdocs_gen_files", gen_files):
+            for project in self.dao.get_all(sort_key=lambda x: x.name_id):
+                ProjectPage(project, f"p/{project.short_uuid}.md").write_page()
+                for package in project.pypi.values():
+                    PypiPage(
+                        package, project, f"pypi/{package.package_name}.md"
+                    ).write_page()
+        return {
+            filename: (page.getvalue(), edit_path)
+            for filename, (page, edit_path) in pages.items()
+        }
+
+    def test_pages(self):
+        """Tests that the rendered pages are the ones write_page writes"""
+        rendered = render_members(self.member_dicts, jobs=1)
+        pages = {
+            filename: (content, edit_path)
+            for member in rendered
+            for filename, content, edit_path in member["pages"]
+        }
+        self.assertGreater(len(pages), len(self.member_dicts))
+        self.assertEqual(pages, self.written_pages())
+        for filename, (_, edit_path) in pages.items():
+            if filename.startswith("p/"):
+                self.assertEqual(edit_path, f"resources/members/{filename[2:-3]}.toml")
+
+    def test_member(self):
+        """Tests the navigation and the active lists of a member"""
+        name_id, member_dict = next(
+            item for item in self.member_dicts.items() if item[1].get("pypi")
+        )
+        rendered = render_member(name_id, member_dict)
+        short_uuid = member_dict["uuid"].split("-")[0]
+        self.assertEqual(
+            rendered["project_nav"], (member_dict["name"], f"{short_uuid}.md")
+        )
+        self.assertEqual(len(rendered["pypi_nav"]), len(member_dict["pypi"]))
+        active = member_dict.get("status") != "Alumni"
+        self.assertEqual(len(rendered["active_projects"]), int(active))
+        self.assertEqual(
+            len(rendered["active_pypi"]), len(member_dict["pypi"]) if active else 0
+        )
+
+    def test_parallel(self):
+        """Tests that the pages rendered by a pool of processes are the same"""
+        serial = render_members(self.member_dicts, jobs=1)
+        self.assertEqual(
+            render_members(self.member_dicts, jobs=2, min_members_per_job=1), serial
+        )
+
+    def test_jobs(self):
+        """Tests that the members are rendered in parallel if there are enough"""
+        with (
+            patch("ecosystem.docs.render.start_method", return_value="fork"),
+            patch("ecosystem.docs.render.ProcessPoolExecutor") as pool,
+        ):
+            render_members(dict(list(self.member_dicts.items())[:99]), jobs=4)
+            pool.assert_not_called()
+            render_members(self.member_dicts, jobs=4)
+        self.assertEqual(
+            pool.call_args.kwargs["max_workers"], len(self.member_dicts) // 50
+        )
+
+    def test_start_method(self):
+        """Tests that a process with other threads spawns its workers"""
+        member_dicts = dict(list(self.member_dicts.items())[:4])
+        with patch("ecosystem.docs.render.threading.active_count", return_value=2):
+            self.assertEqual(
+                render_members(member_dicts, jobs=2, min_members_per_job=2),
+                render_members(member_dicts, jobs=1),
+            )
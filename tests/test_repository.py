@@ -14,7 +14,9 @@
 
 import unittest
 
+from ecosystem.badge import BadgeData
 from ecosystem.member import Member
+from ecosystem.serializable import Lazy
 
 
 class TestMember(unittest.TestCase):
@@ -36,3 +38,29 @@ class TestMember(unittest.TestCase):
         repo_dict = main_repo.to_dict()
         recovered = Member.from_dict(repo_dict)
         self.assertEqual(main_repo, recovered)
+
+    def test_lazy_sections(self):
+        """Tests that the sections are built on first access, from a copy of the data."""
+        member_dict = {
+            "name": "mock-qiskit-terra",
+            "url": "https://github.com/MockQiskit/mock-qiskit.terra",
+            "labels": ["mock"],
+            "badge": {"url": "https://qisk.it/e-12345678", "style": "flat"},
+            "pypi": {"mock-terra": {"version": "1.0"}},
+        }
+        member = Member.from_dict(member_dict)
+        self.assertIsInstance(member.__dict__["pypi"], Lazy)
+        self.assertIsInstance(member.__dict__["badge"], Lazy)
+
+        self.assertEqual("flat", member.badge.style)
+        self.assertIsInstance(member.__dict__["badge"], BadgeData)
+        self.assertIsInstance(member.__dict__["pypi"], Lazy)
+        self.assertEqual("mock-terra", member.pypi["mock-terra"].package_name)
+
+        member.pypi["mock-terra"].version = "2.0"
+        member.labels.append("mutated")
+        self.assertEqual({"version": "1.0"}, member_dict["pypi"]["mock-terra"])
+        self.assertEqual(["mock"], member_dict["labels"])
+        self.assertEqual(
+            list(Member.from_dict(member_dict).to_dict()), list(member.to_dict())
+        )
@@ -12,21 +12,34 @@
 
 """Tests for ecosystem/request.py.
 
-All the tests here are network independent: ``requests.get``, ``requests.post``,
-``requests.put`` and ``time.sleep`` are patched, so nothing reaches the network
-and nothing blocks.
+All the tests here are network independent: ``requests.Session.get``,
+``requests.Session.post``, ``requests.Session.put`` and ``time.sleep`` are
+patched, so nothing reaches the network and nothing blocks.
 """
 
 import gzip
 import io
 import os
+import tempfile
+import threading
+import time
 from types import SimpleNamespace
 from unittest import TestCase
 from unittest.mock import patch
 
+import requests_cache
+import responses as mock_responses
+from requests_cache.policy.expiration import get_url_expiration
+
 from ecosystem.error_handling import EcosystemError
 from ecosystem.request import (
+    CACHE_EXPIRE_AFTER,
     URL,
+    CsvGzIndex,
+    HostPool,
+    HttpCache,
+    RateLimiter,
+    fetch_all,
     find_first_in_csv_gz,
     parse_github_contributors_sidebar,
     parse_github_dependants,
@@ -174,28 +187,32 @@ class TestRequestJson(TestCase):
     def test_json_response(self):
         """Tests that a json response is parsed and gets the metadata"""
         with patch(
-            "ecosystem.request.requests.get", return_value=fake_response('{"a": 1}')
+            "ecosystem.request.requests.Session.get",
+            return_value=fake_response('{"a": 1}'),
         ):
             self.assertEqual(request_json("example.com/x"), {"a": 1} | METADATA)
 
     def test_non_dict_result_is_wrapped(self):
         """Tests that a non dict payload is wrapped in a data key"""
         with patch(
-            "ecosystem.request.requests.get", return_value=fake_response("[1, 2]")
+            "ecosystem.request.requests.Session.get",
+            return_value=fake_response("[1, 2]"),
         ):
             self.assertEqual(request_json("example.com/x"), {"data": [1, 2]} | METADATA)
 
     def test_parser_returning_none(self):
         """Tests that a None from the parser is returned without metadata"""
         with patch(
-            "ecosystem.request.requests.get", return_value=fake_response("banana")
+            "ecosystem.request.requests.Session.get",
+            return_value=fake_response("banana"),
         ):
             self.assertIsNone(request_json("example.com/x", parser=lambda _: None))
 
     def test_custom_parser_gets_the_text(self):
         """Tests that the parser is called with the response text"""
         with patch(
-            "ecosystem.request.requests.get", return_value=fake_response("banana")
+            "ecosystem.request.requests.Session.get",
+            return_value=fake_response("banana"),
         ):
             result = request_json("example.com/x", parser=lambda text: {"text": text})
         self.assertEqual(result, {"text": "banana"} | METADATA)
@@ -209,7 +226,8 @@ class TestRequestJson(TestCase):
             return content.decode().upper()
 
         with patch(
-            "ecosystem.request.requests.get", return_value=fake_response("banana")
+            "ecosystem.request.requests.Session.get",
+            return_value=fake_response("banana"),
         ):
             result = request_json(
                 "example.com/x",
@@ -222,7 +240,7 @@ class TestRequestJson(TestCase):
     def test_default_accept_header(self):
         """Tests the default Accept header of a plain request"""
         with patch(
-            "ecosystem.request.requests.get", return_value=fake_response()
+            "ecosystem.request.requests.Session.get", return_value=fake_response()
         ) as requests_get:
             request_json("example.com/x")
         headers = requests_get.call_args.kwargs["headers"]
@@ -232,7 +250,7 @@ class TestRequestJson(TestCase):
     def test_custom_headers(self):
         """Tests that custom headers replace the default ones"""
         with patch(
-            "ecosystem.request.requests.get", return_value=fake_response()
+            "ecosystem.request.requests.Session.get", return_value=fake_response()
         ) as requests_get:
             request_json("example.com/x", headers={"Accept": "text/csv"})
         self.assertEqual(
@@ -242,7 +260,7 @@ class TestRequestJson(TestCase):
     def test_url_is_normalized_before_requesting(self):
         """Tests that the requested url is the normalized one"""
         with patch(
-            "ecosystem.request.requests.get", return_value=fake_response()
+            "ecosystem.request.requests.Session.get", return_value=fake_response()
         ) as requests_get:
             request_json("Example.com/x")
         self.assertEqual(requests_get.call_args.args[0], "https://example.com/x")
@@ -250,7 +268,7 @@ class TestRequestJson(TestCase):
     def test_github_token_argument(self):
         """Tests that the token argument is used for api.github.com"""
         with patch(
-            "ecosystem.request.requests.get", return_value=fake_response()
+            "ecosystem.request.requests.Session.get", return_value=fake_response()
         ) as requests_get:
             request_json("api.github.com/repos/banana/split", token="banana-token")
         headers = requests_get.call_args.kwargs["headers"]
@@ -261,7 +279,7 @@ class TestRequestJson(TestCase):
         """Tests that GH_TOKEN is used for api.github.com when no token is given"""
         with patch.dict(os.environ, {"GH_TOKEN": "env-token"}):
             with patch(
-                "ecosystem.request.requests.get", return_value=fake_response()
+                "ecosystem.request.requests.Session.get", return_value=fake_response()
             ) as requests_get:
                 request_json("api.github.com/repos/banana/split")
         headers = requests_get.call_args.kwargs["headers"]
@@ -270,7 +288,7 @@ class TestRequestJson(TestCase):
     def test_github_without_token(self):
         """Tests that an empty token adds no Authorization header"""
         with patch(
-            "ecosystem.request.requests.get", return_value=fake_response()
+            "ecosystem.request.requests.Session.get", return_value=fake_response()
         ) as requests_get:
             request_json("api.github.com/repos/banana/split", token="")
         headers = requests_get.call_args.kwargs["headers"]
@@ -281,7 +299,7 @@ class TestRequestJson(TestCase):
         """Tests that a non github host does not get the github headers"""
         with patch.dict(os.environ, {"GH_TOKEN": "env-token"}):
             with patch(
-                "ecosystem.request.requests.get", return_value=fake_response()
+                "ecosystem.request.requests.Session.get", return_value=fake_response()
             ) as requests_get:
                 request_json("example.com/x")
         headers = requests_get.call_args.kwargs["headers"]
@@ -292,7 +310,7 @@ class TestRequestJson(TestCase):
         """Tests that BITLY_TOKEN is sent as a bearer token to bitly.com"""
         with patch.dict(os.environ, {"BITLY_TOKEN": "bitly-token"}):
             with patch(
-                "ecosystem.request.requests.get", return_value=fake_response()
+                "ecosystem.request.requests.Session.get", return_value=fake_response()
             ) as requests_get:
                 request_json("api-ssl.bitly.com/v4/bitlinks")
         headers = requests_get.call_args.kwargs["headers"]
@@ -301,7 +319,8 @@ class TestRequestJson(TestCase):
     def test_post(self):
         """Tests that a post payload is sent as json with post"""
         with patch(
-            "ecosystem.request.requests.post", return_value=fake_response('{"a": 1}')
+            "ecosystem.request.requests.Session.post",
+            return_value=fake_response('{"a": 1}'),
         ) as requests_post:
             self.assertEqual(
                 request_json("example.com/x", post={"banana": "split"}),
@@ -312,7 +331,8 @@ class TestRequestJson(TestCase):
     def test_put(self):
         """Tests that a put payload is sent as json with put"""
         with patch(
-            "ecosystem.request.requests.put", return_value=fake_response('{"a": 1}')
+            "ecosystem.request.requests.Session.put",
+            return_value=fake_response('{"a": 1}'),
         ) as requests_put:
             self.assertEqual(
                 request_json("example.com/x", put={"banana": "split"}),
@@ -323,7 +343,7 @@ class TestRequestJson(TestCase):
     def test_bad_response(self):
         """Tests that a non ok response raises EcosystemError"""
         response = fake_response(ok=False, reason="Not Found", status_code=404)
-        with patch("ecosystem.request.requests.get", return_value=response):
+        with patch("ecosystem.request.requests.Session.get", return_value=response):
             with self.assertRaises(EcosystemError) as context:
                 request_json("example.com/x")
         self.assertIn("Not Found", str(context.exception))
@@ -333,6 +353,11 @@ class TestRequestJson(TestCase):
 class TestRequestJsonDelay(TestCase):
     """Test class for the delay and rate limit handling of request_json."""
 
+    def setUp(self):
+        patcher = patch("ecosystem.request.rate_limiter", RateLimiter())
+        self.rate_limiter = patcher.start()
+        self.addCleanup(patcher.stop)
+
     def rate_limited(self, headers=None):
         """A rate limited response, optionally with rate limit headers"""
         return fake_response(
@@ -342,7 +367,9 @@ class TestRequestJsonDelay(TestCase):
     def test_delay_sleeps_before_requesting(self):
         """Tests that the delay is awaited before the request"""
         with patch("ecosystem.request.time.sleep") as sleep:
-            with patch("ecosystem.request.requests.get", return_value=fake_response()):
+            with patch(
+                "ecosystem.request.requests.Session.get", return_value=fake_response()
+            ):
                 request_json("example.com/x", delay=7)
         sleep.assert_called_once_with(7)
 
@@ -350,7 +377,7 @@ class TestRequestJsonDelay(TestCase):
         """Tests that a delay of 15 minutes or more is an error"""
         with patch("ecosystem.request.time.sleep") as sleep:
             with patch(
-                "ecosystem.request.requests.get", return_value=fake_response()
+                "ecosystem.request.requests.Session.get", return_value=fake_response()
             ) as requests_get:
                 with self.assertRaises(EcosystemError) as context:
                     request_json("example.com/x", delay=900)
@@ -363,7 +390,7 @@ class TestRequestJsonDelay(TestCase):
         responses = [self.rate_limited(), fake_response('{"a": 1}')]
         with patch("ecosystem.request.time.sleep") as sleep:
             with patch(
-                "ecosystem.request.requests.get", side_effect=responses
+                "ecosystem.request.requests.Session.get", side_effect=responses
             ) as requests_get:
                 self.assertEqual(request_json("example.com/x"), {"a": 1} | METADATA)
         self.assertEqual(requests_get.call_count, 2)
@@ -374,7 +401,7 @@ class TestRequestJsonDelay(TestCase):
         limited = fake_response(ok=False, reason="rate limit exceeded", status_code=403)
         with patch("ecosystem.request.time.sleep") as sleep:
             with patch(
-                "ecosystem.request.requests.get",
+                "ecosystem.request.requests.Session.get",
                 side_effect=[limited, fake_response('{"a": 1}')],
             ):
                 self.assertEqual(request_json("example.com/x"), {"a": 1} | METADATA)
@@ -384,7 +411,7 @@ class TestRequestJsonDelay(TestCase):
         """Tests that an ongoing delay is doubled on a rate limited response"""
         responses = [self.rate_limited(), fake_response('{"a": 1}')]
         with patch("ecosystem.request.time.sleep") as sleep:
-            with patch("ecosystem.request.requests.get", side_effect=responses):
+            with patch("ecosystem.request.requests.Session.get", side_effect=responses):
                 request_json("example.com/x", delay=10)
         self.assertEqual([call.args[0] for call in sleep.call_args_list], [10, 20])
 
@@ -394,7 +421,7 @@ class TestRequestJsonDelay(TestCase):
         with patch("ecosystem.request.time.time", return_value=NOW):
             with patch("ecosystem.request.time.sleep") as sleep:
                 with patch(
-                    "ecosystem.request.requests.get",
+                    "ecosystem.request.requests.Session.get",
                     side_effect=[limited, fake_response('{"a": 1}')],
                 ):
                     request_json("example.com/x")
@@ -405,7 +432,9 @@ class TestRequestJsonDelay(TestCase):
         limited = self.rate_limited({"X-RateLimit-Reset": str(NOW + 1000)})
         with patch("ecosystem.request.time.time", return_value=NOW):
             with patch("ecosystem.request.time.sleep"):
-                with patch("ecosystem.request.requests.get", return_value=limited):
+                with patch(
+                    "ecosystem.request.requests.Session.get", return_value=limited
+                ):
                     with self.assertRaises(EcosystemError) as context:
                         request_json("example.com/x")
         self.assertIn("too long", str(context.exception))
@@ -417,12 +446,218 @@ class TestRequestJsonDelay(TestCase):
         with patch("ecosystem.request.time.time", return_value=NOW):
             with patch("ecosystem.request.time.sleep", side_effect=slept.append):
                 with patch(
-                    "ecosystem.request.requests.get",
+                    "ecosystem.request.requests.Session.get",
                     side_effect=[limited, fake_response('{"a": 1}')],
                 ):
                     request_json("example.com/x")
         self.assertTrue(all(seconds >= 0 for seconds in slept), f"slept {slept}")
 
+    def test_retry_after_header(self):
+        """Tests that Retry-After sets how long to wait"""
+        limited = self.rate_limited({"Retry-After": "30"})
+        with patch("ecosystem.request.time.time", return_value=NOW):
+            with patch("ecosystem.request.time.sleep") as sleep:
+                with patch(
+                    "ecosystem.request.requests.Session.get",
+                    side_effect=[limited, fake_response('{"a": 1}')],
+                ):
+                    request_json("example.com/x")
+        sleep.assert_called_once_with(30)
+
+    def test_rate_limited_host_does_not_hold_other_hosts(self):
+        """Tests that a rate limited host makes its next requests wait, only its"""
+        limited = self.rate_limited({"Retry-After": "30"})
+        with patch("ecosystem.request.time.time", return_value=NOW):
+            with patch("ecosystem.request.time.sleep"):
+                with patch(
+                    "ecosystem.request.requests.Session.get",
+                    side_effect=[limited, fake_response('{"a": 1}')],
+                ):
+                    request_json("example.com/x")
+            self.assertEqual(self.rate_limiter.reserve("example.com"), 30)
+            self.assertEqual(self.rate_limiter.reserve("example.org"), 0)
+
+    def test_pypistats_is_paced(self):
+        """Tests that the requests to pypistats.org are spaced out"""
+        with patch("ecosystem.request.time.time", return_value=NOW):
+            with patch("ecosystem.request.time.sleep") as sleep:
+                with patch(
+                    "ecosystem.request.requests.Session.get",
+                    return_value=fake_response(),
+                ):
+                    request_json("pypistats.org/api/packages/qiskit/recent")
+                    request_json("pypistats.org/api/packages/qiskit/overall")
+        sleep.assert_called_once_with(3)
+
+
+class TestHostPool(TestCase):
+    """Test class for ecosystem.request.HostPool."""
+
+    def test_session_is_shared_per_host(self):
+        """Tests that the same host gets the same session"""
+        pool = HostPool({})
+        self.assertIs(pool.session("example.com"), pool.session("example.com"))
+        self.assertIsNot(pool.session("example.com"), pool.session("example.org"))
+
+    def test_limits(self):
+        """Tests the per host limits and the default one"""
+        pool = HostPool({"example.com": 2})
+        self.assertEqual(pool.limit("example.com"), 2)
+        self.assertEqual(pool.limit("example.org"), 4)
+
+    def test_limits_from_environment(self):
+        """Tests that ECOSYSTEM_HOST_CONCURRENCY overrides the limits"""
+        with patch.dict(
+            os.environ, {"ECOSYSTEM_HOST_CONCURRENCY": "example.com=1, Example.org=3"}
+        ):
+            pool = HostPool({"example.com": 2})
+        self.assertEqual(pool.limit("example.com"), 1)
+        self.assertEqual(pool.limit("example.org"), 3)
+
+    def test_invalid_limits(self):
+        """Tests that a malformed ECOSYSTEM_HOST_CONCURRENCY is an error"""
+        with self.assertRaises(EcosystemError):
+            HostPool.parse_limits("example.com=0")
+        with self.assertRaises(EcosystemError):
+            HostPool.parse_limits("example.com")
+
+
+class TestFetchAll(TestCase):
+    """Test class for ecosystem.request.fetch_all."""
+
+    def test_results_and_errors_by_key(self):
+        """Tests that each key gets its result, or the error it raised"""
+
+        def get(url, **_kwargs):
+            if url.endswith("/missing"):
+                return fake_response(ok=False, reason="Not Found", status_code=404)
+            return fake_response(f'{{"url": "{url}"}}')
+
+        with patch("ecosystem.request.requests.Session.get", side_effect=get):
+            results = fetch_all(
+                {
+                    "a": {"url": "example.com/a"},
+                    "b": {"url": "example.org/b", "parser": lambda x: {"text": x}},
+                    "missing": {"url": "example.com/missing"},
+                }
+            )
+        self.assertEqual(results["a"], {"url": "https://example.com/a"} | METADATA)
+        self.assertEqual(
+            results["b"], {"text": '{"url": "https://example.org/b"}'} | METADATA
+        )
+        self.assertIsInstance(results["missing"], EcosystemError)
+
+    def test_no_calls(self):
+        """Tests that nothing to fetch returns an empty dict"""
+        self.assertEqual(fetch_all({}), {})
+
+    def test_host_limit_is_respected(self):
+        """Tests that no more than the host limit requests run at the same time"""
+        lock = threading.Lock()
+        in_flight = {"example.com": 0, "example.org": 0}
+        max_in_flight = dict(in_flight)
+
+        def get(url, **_kwargs):
+            host = URL(url).hostname
+            with lock:
+                in_flight[host] += 1
+                max_in_flight[host] = max(max_in_flight[host], in_flight[host])
+            time.sleep(0.02)
+            with lock:
+                in_flight[host] -= 1
+            return fake_response()
+
+        calls = {f"com{i}": {"url": f"example.com/{i}"} for i in range(8)}
+        calls |= {f"org{i}": {"url": f"example.org/{i}"} for i in range(8)}
+        pool = HostPool({"example.com": 2, "example.org": 3})
+        with patch("ecosystem.request.host_pool", pool):
+            with patch("ecosystem.request.requests.Session.get", side_effect=get):
+                results = fetch_all(calls)
+        self.assertEqual(len(results), 16)
+        self.assertEqual(max_in_flight, {"example.com": 2, "example.org": 3})
+
+
+class TestHttpCache(TestCase):
+    """Test class for ecosystem.request.HttpCache."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(tmp_dir.cleanup)
+        self.session = requests_cache.CachedSession(
+            os.path.join(tmp_dir.name, "cache"),
+            urls_expire_after={"example.com/stale": 0, "*": 3600},
+            allowable_codes=(200,),
+        )
+        self.addCleanup(self.session.close)
+        self.http_cache = HttpCache(self.session.cache)
+
+    def test_expire_after_by_url(self):
+        """Tests that each kind of URL gets its own freshness"""
+        self.assertEqual(
+            get_url_expiration("https://pypi.org/pypi/qiskit/json", CACHE_EXPIRE_AFTER),
+            CACHE_EXPIRE_AFTER["pypi.org/pypi/qiskit/json"],
+        )
+        self.assertEqual(
+            get_url_expiration(
+                "https://julialang-logs.s3.amazonaws.com/public_outputs/current/"
+                "package_requests.csv.gz",
+                CACHE_EXPIRE_AFTER,
+            ),
+            CACHE_EXPIRE_AFTER["julialang-logs.s3.amazonaws.com/*"],
+        )
+        self.assertEqual(
+            get_url_expiration("https://pypi.org/pypi/other/json", CACHE_EXPIRE_AFTER),
+            CACHE_EXPIRE_AFTER["*"],
+        )
+
+    @mock_responses.activate
+    def test_stale_responses_are_revalidated(self):
+        """Tests that a stale response with an ETag is revalidated with a 304"""
+
+        def etag_callback(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return 304, {"ETag": '"v1"'}, ""
+            return 200, {"ETag": '"v1"'}, '{"version": 1}'
+
+        mock_responses.add_callback(
+            mock_responses.GET, "https://example.com/stale", callback=etag_callback
+        )
+        mock_responses.add(mock_responses.GET, "https://example.com/fresh", body="{}")
+
+        outcomes = [
+            self.http_cache.record(self.session.get(url))
+            for url in [
+                "https://example.com/stale",
+                "https://example.com/stale",
+                "https://example.com/fresh",
+                "https://example.com/fresh",
+            ]
+        ]
+        self.assertEqual(outcomes, ["miss", "revalidated", "miss", "hit"])
+        self.assertEqual(
+            self.session.get("https://example.com/stale").text, '{"version": 1}'
+        )
+        self.assertEqual(
+            dict(self.http_cache.stats), {"miss": 2, "revalidated": 1, "hit": 1}
+        )
+
+    @mock_responses.activate
+    def test_trim_evicts_least_recently_used(self):
+        """Tests that trimming deletes the least recently used responses first"""
+        for name in ["a", "b", "c"]:
+            mock_responses.add(
+                mock_responses.GET, f"https://example.com/{name}", body="x" * 100_000
+            )
+        for name in ["a", "b", "c", "a"]:
+            self.http_cache.record(self.session.get(f"https://example.com/{name}"))
+            time.sleep(0.01)
+
+        self.http_cache.max_mb = 250_000 / 1024 / 1024
+        self.assertEqual(self.http_cache.trim(), 1)
+        self.assertFalse(self.session.cache.contains(url="https://example.com/b"))
+        self.assertTrue(self.session.cache.contains(url="https://example.com/a"))
+        self.assertTrue(self.session.cache.contains(url="https://example.com/c"))
+
 
 class TestParseGithubContributorsSidebar(TestCase):
     """Test class for ecosystem.request.parse_github_contributors_sidebar."""
@@ -549,6 +784,13 @@ class TestParseGithubDependants(TestCase):
         with self.assertRaises(EcosystemError):
             parse_github_dependants(html)
 
+    def test_duplicated_packages_counter(self):
+        """Tests that the first of two packages counters is read"""
+        html = self.counters(["1 Repository"], ["56 Packages", "7 Packages"])
+        self.assertEqual(
+            parse_github_dependants(html), {"repositories": 1, "packages": 56}
+        )
+
 
 class TestParseJuliapackages(TestCase):
     """Test class for ecosystem.request.parse_juliapackages."""
@@ -653,3 +895,54 @@ class TestFindFirstInCsvGz(TestCase):
             {"package_uuid": "split-uuid", "not_a_column": "banana"}
         )
         self.assertEqual(parser(gzipped_csv(self.CSV))["request_addrs"], "30")
+
+
+class TestCsvGzIndex(TestCase):
+    """Test class for ecosystem.request.CsvGzIndex."""
+
+    CSV = TestFindFirstInCsvGz.CSV
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(tmp_dir.cleanup)
+        self.index = CsvGzIndex(
+            os.path.join(tmp_dir.name, "index.sqlite"),
+            ["package_uuid", "client_type", "status"],
+        )
+
+    def test_same_rows_as_find_first_in_csv_gz(self):
+        """Tests that lookups return the same rows as scanning the file"""
+        self.index.update(gzipped_csv(self.CSV))
+        for subdict in [
+            {"package_uuid": "split-uuid"},
+            {"package_uuid": "banana-uuid"},
+            {"package_uuid": "banana-uuid", "statuses": ["302", "301"]},
+            {"package_uuid": "banana-uuid", "statuses": ["302", "200"]},
+            {"package_uuid": "banana-uuid", "statuses": ["404"], "client_type": "user"},
+            {"package_uuid": "no-such-uuid"},
+            {"package_uuid": "split-uuid", "not_a_column": "banana"},
+        ]:
+            with self.subTest(subdict=subdict):
+                self.assertEqual(
+                    self.index.find_first(subdict),
+                    find_first_in_csv_gz(subdict)(gzipped_csv(self.CSV)),
+                )
+
+    def test_rebuilt_only_when_the_file_changes(self):
+        """Tests that the index is kept while the file content is the same"""
+        self.assertTrue(self.index.update(gzipped_csv(self.CSV))["rebuilt"])
+        self.assertFalse(self.index.update(gzipped_csv(self.CSV))["rebuilt"])
+        other_csv = (
+            "package_uuid,status,client_type,request_addrs\nnew-uuid,200,user,1\n"
+        )
+        self.assertTrue(self.index.update(gzipped_csv(other_csv))["rebuilt"])
+        self.assertEqual(self.index.find_first({"package_uuid": "split-uuid"}), {})
+        self.assertEqual(
+            self.index.find_first({"package_uuid": "new-uuid"})["request_addrs"], "1"
+        )
+
+    def test_non_indexed_columns_are_an_error(self):
+        """Tests that filtering on a column that is not a key is not supported"""
+        self.index.update(gzipped_csv(self.CSV))
+        with self.assertRaises(EcosystemError):
+            self.index.find_first({"request_addrs": "10"})
@@ -0,0 +1,122 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for ecosystem/scraping.py and the parsers of saved pages."""
+
+from pathlib import Path
+from unittest import TestCase
+
+from ecosystem.request import (
+    parse_github_contributors_sidebar,
+    parse_github_dependants,
+    parse_github_package_ids,
+    parse_juliapackages,
+)
+from ecosystem.scraping import (
+    Extractor,
+    FirstLinkInElement,
+    MatchingTexts,
+    TextOfElement,
+    attrs_match,
+)
+
+PAGES = Path(__file__).parent / "resources" / "html"
+
+
+def saved_page(name):
+    """The content of a saved page in tests/resources/html"""
+    return (PAGES / name).read_text(encoding="utf-8")
+
+
+class TestExtractors(TestCase):
+    """Test class for the extractors of ecosystem.scraping."""
+
+    def test_attrs_match(self):
+        """Tests the matching of attributes, with classes as in BeautifulSoup"""
+        attrs = [("class", "shadow-sm rounded-md"), ("role", "status")]
+        self.assertTrue(attrs_match(attrs, {"class": "rounded-md"}))
+        self.assertTrue(attrs_match(attrs, {"class": "shadow-sm rounded-md"}))
+        self.assertTrue(attrs_match(attrs, {"role": "status", "class": "shadow-sm"}))
+        self.assertFalse(attrs_match(attrs, {"class": "rounded"}))
+        self.assertFalse(attrs_match(attrs, {"class": "rounded-md shadow-sm"}))
+        self.assertFalse(attrs_match(attrs, {"title": "3"}))
+
+    def test_text_of_the_first_element(self):
+        """Tests that the text of nested elements is included, up to the first match"""
+        html = "<div><span>a<span>b</span>c</span><span>d</span>"
+        self.assertEqual(TextOfElement("span").extract(html), "abc")
+        self.assertIsNone(TextOfElement("h2").extract(html))
+
+    def test_stops_at_the_first_match(self):
+        """Tests that the rest of the page is not parsed"""
+        extractor = TextOfElement("h2")
+        extractor.extract("<h2>name</h2>" + "<p>paragraph</p>" * 100)
+        self.assertLess(extractor.getpos()[1], 20)
+
+    def test_first_link_in_element(self):
+        """Tests that only the links inside the element are considered"""
+        html = (
+            '<a href="https://github.com/outside">x</a>'
+            '<span class="links"><a href="https://example.com">y</a>'
+            '<a href="https://github.com/inside">z</a></span>'
+        )
+        extractor = FirstLinkInElement("span", {"class": "links"}, "github.com")
+        self.assertEqual(extractor.extract(html), "https://github.com/inside")
+
+    def test_matching_texts(self):
+        """Tests that every matching text node is found"""
+        html = "<a>1 Package</a><b>2 Packages</b><c>Packages list</c>"
+        found = MatchingTexts([r" Packages?$"]).extract(html)
+        self.assertEqual(found, {r" Packages?$": ["1 Package", "2 Packages"]})
+
+    def test_result_is_required(self):
+        """Tests that an extractor without result cannot be created"""
+
+        class NoResult(Extractor):  # pylint: disable=abstract-method
+            """An extractor that forgot result"""
+
+        with self.assertRaises(TypeError):
+            NoResult()
+
+
+class TestSavedPages(TestCase):
+    """Tests the parsers of ecosystem.request with the pages in tests/resources/html."""
+
+    def test_github_dependents(self):
+        """Tests the counters and package ids of a dependents page"""
+        page = saved_page("github_dependents.html")
+        self.assertEqual(
+            parse_github_dependants(page), {"repositories": 12345, "packages": 678}
+        )
+        self.assertEqual(
+            parse_github_package_ids(page),
+            {"qiskit": "UGFja2FnZS0xMDk2", "qiskit-terra": "UGFja2FnZS0yNzQ1"},
+        )
+
+    def test_github_contributors_list(self):
+        """Tests the contributors counter"""
+        self.assertEqual(
+            parse_github_contributors_sidebar(
+                saved_page("github_contributors_list.html")
+            ),
+            {"estimated_contributors": 3},
+        )
+
+    def test_juliapackages(self):
+        """Tests the name and repository of a juliapackages.com page"""
+        self.assertEqual(
+            parse_juliapackages(saved_page("juliapackages.html")),
+            {
+                "package_name": "Qiskit",
+                "repo_url": "https://github.com/Qiskit/Qiskit.jl",
+            },
+        )
@@ -0,0 +1,109 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the request deduplication of ecosystem/request.py."""
+
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from ecosystem.badge import BadgeData
+from ecosystem.error_handling import EcosystemError
+from ecosystem.request import SingleFlight, fetch_all, request_json
+
+from .test_request import METADATA, fake_response
+
+
+class TestSingleFlight(TestCase):
+    """Test class for ecosystem.request.SingleFlight."""
+
+    def setUp(self):
+        patcher = patch("ecosystem.request.single_flight", SingleFlight())
+        self.single_flight = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch(
+            "ecosystem.request.requests.Session.get",
+            return_value=fake_response('{"a": 1}'),
+        )
+        self.get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_repeated_requests(self):
+        """Tests that a repeated request is not fetched again during a run"""
+        with self.single_flight.run():
+            first = request_json("example.com/x")
+            first["mutated"] = True
+            self.assertEqual(request_json("https://EXAMPLE.com/x"), {"a": 1} | METADATA)
+            self.assertEqual(self.get.call_count, 1)
+            self.assertEqual(self.single_flight.saved, 1)
+
+            request_json("example.com/x", headers={"Accept": "text/html"})
+            self.assertEqual(self.get.call_count, 2)
+            with patch(
+                "ecosystem.request.requests.Session.post",
+                return_value=fake_response("{}"),
+            ) as post:
+                request_json("example.com/x", post={"b": 2})
+                request_json("example.com/x", post={"b": 2})
+            self.assertEqual(post.call_count, 2)
+            self.assertEqual(self.single_flight.saved, 1)
+        self.assertEqual(self.single_flight.saved, 0)
+
+    def test_parsers_of_the_callers(self):
+        """Tests that the requests with the same module-level parser are shared"""
+        self.get.return_value = fake_response('<svg xmlns="x"></svg>')
+        with self.single_flight.run():
+            for _ in range(2):
+                badge = BadgeData()
+                badge.update_url("qiskit", "abc")
+                self.assertEqual(badge.url, "https://qisk.it/e-abc")
+        self.assertEqual(self.get.call_count, 1)
+
+    def test_outside_a_run(self):
+        """Tests that requests are not shared outside of a run"""
+        request_json("example.com/x")
+        request_json("example.com/x")
+        self.assertEqual(self.get.call_count, 2)
+
+    def test_concurrent_requests(self):
+        """Tests that concurrent requests wait for the one in flight"""
+        started, release = threading.Event(), threading.Event()
+
+        def slow_get(*_, **__):
+            started.set()
+            release.wait(5)
+            return fake_response('{"a": 1}')
+
+        self.get.side_effect = slow_get
+        with self.single_flight.run():
+            first = threading.Thread(target=request_json, args=("example.com/x",))
+            first.start()
+            started.wait(5)
+            timer = threading.Timer(0.2, release.set)
+            timer.start()
+            results = fetch_all({i: {"url": "example.com/x"} for i in range(3)})
+            first.join()
+            timer.join()
+            self.assertEqual(self.get.call_count, 1)
+            self.assertEqual(self.single_flight.saved, 3)
+        self.assertEqual(list(results.values()), [{"a": 1} | METADATA] * 3)
+
+    def test_failures_are_not_kept(self):
+        """Tests that a failed request is tried again"""
+        self.get.return_value = fake_response(
+            ok=False, reason="Not Found", status_code=404
+        )
+        with self.single_flight.run():
+            for _ in range(2):
+                with self.assertRaises(EcosystemError):
+                    request_json("example.com/x")
+        self.assertEqual(self.get.call_count, 2)
@@ -0,0 +1,111 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for ecosystem/spool.py."""
+
+from datetime import timedelta
+from pathlib import Path
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from requests_cache import DO_NOT_CACHE
+
+from ecosystem.error_handling import EcosystemError
+from ecosystem.recording import ExchangeArchive
+from ecosystem.request import request_json
+from ecosystem.spool import DownloadSpool
+
+from .test_request import fake_response
+
+
+def streamed_response(chunks, status_code=200, headers=None):
+    """A stand-in for a response of requests.get(..., stream=True)"""
+    response = fake_response(
+        ok=status_code < 400, reason="", status_code=status_code, headers=headers
+    )
+    response.iter_content = lambda chunk_size: iter(chunks)
+    response.close = lambda: None
+    return response
+
+
+def read_file(file):
+    """A request_json parser that reads a file"""
+    return {"content": file.read()}
+
+
+class TestDownloadSpool(TestCase):
+    """Test class for ecosystem.spool.DownloadSpool."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = Path(tmp_dir.name)
+        self.spool = DownloadSpool(self.path / "spool", {"*": timedelta(days=1)})
+        patcher = patch("ecosystem.request.download_spool", self.spool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch("ecosystem.request.requests.Session.get")
+        self.get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_stream(self):
+        """Tests that the body is written in chunks and parsed as a file"""
+        self.get.return_value = streamed_response([b"a,b\n", b"1,2\n"])
+        result = request_json("example.com/x.csv", parser=read_file, stream=True)
+        self.assertEqual(result["content"], b"a,b\n1,2\n")
+        self.assertEqual(self.get.call_args.kwargs["stream"], True)
+        self.assertEqual(self.get.call_args.kwargs["expire_after"], DO_NOT_CACHE)
+
+        # fresh, so it is not fetched again
+        result = request_json("example.com/x.csv", parser=read_file, stream=True)
+        self.assertEqual(result["content"], b"a,b\n1,2\n")
+        self.assertEqual(self.get.call_count, 1)
+
+    def test_revalidate(self):
+        """Tests that a stale file is revalidated, and kept if not modified"""
+        self.spool.urls_expire_after = {"*": 0}
+        self.get.return_value = streamed_response([b"old"], headers={"ETag": '"v1"'})
+        request_json("example.com/x", parser=read_file, stream=True)
+
+        self.get.return_value = streamed_response([], status_code=304)
+        result = request_json("example.com/x", parser=read_file, stream=True)
+        self.assertEqual(result["content"], b"old")
+        self.assertEqual(self.get.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+
+        self.get.return_value = streamed_response([b"new"], headers={"ETag": '"v2"'})
+        result = request_json("example.com/x", parser=read_file, stream=True)
+        self.assertEqual(result["content"], b"new")
+        self.assertEqual(
+            self.spool.entry("https://example.com/x")["headers"], {"ETag": '"v2"'}
+        )
+
+    def test_errors(self):
+        """Tests that failed responses are not spooled"""
+        self.get.return_value = streamed_response([b"Not Found"], status_code=404)
+        with self.assertRaisesRegex(EcosystemError, "Bad response"):
+            request_json("example.com/x", parser=read_file, stream=True)
+        self.assertIsNone(self.spool.entry("https://example.com/x"))
+        with self.assertRaises(EcosystemError):
+            request_json("example.com/x", post={}, stream=True)
+
+    def test_record_and_replay(self):
+        """Tests that streamed requests can be recorded and replayed"""
+        self.get.return_value = streamed_response([b"a", b"b"])
+        archive = ExchangeArchive()
+        with patch("ecosystem.request.exchange_archive", archive):
+            with archive.record(self.path / "exchanges"):
+                request_json("example.com/x", parser=read_file, stream=True)
+            with archive.replay(self.path / "exchanges"):
+                result = request_json("example.com/x", parser=read_file, stream=True)
+        self.assertEqual(result["content"], b"ab")
+        self.assertEqual(self.get.call_count, 1)
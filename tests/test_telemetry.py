@@ -0,0 +1,163 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for ecosystem/telemetry.py."""
+
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+import requests
+
+from ecosystem.error_handling import EcosystemError
+from ecosystem.request import request_json
+from ecosystem.telemetry import RequestStats, RequestTelemetry
+
+from .test_request import fake_response
+
+
+class TestRequestTelemetry(TestCase):
+    """Test class for ecosystem.telemetry.RequestTelemetry."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = Path(tmp_dir.name)
+        self.telemetry = RequestTelemetry()
+        for target, new in [
+            ("ecosystem.request.request_telemetry", self.telemetry),
+            ("ecosystem.request.time.sleep", lambda _: None),
+        ]:
+            patcher = patch(target, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_endpoint(self):
+        """Tests that URLs are grouped by endpoint pattern"""
+        for hostname, path, endpoint in [
+            ("api.github.com", "/repos/Qiskit/qiskit", "api.github.com/repos/*/*"),
+            (
+                "api.github.com",
+                "/repos/JuliaRegistries/General/commits/master",
+                "api.github.com/repos/*/*/commits/*",
+            ),
+            ("pypi.org", "/simple/qiskit/", "pypi.org/simple/*"),
+            ("github.com", "/a/b/tree/master/Q/Qiskit", "github.com/*/*/tree/**"),
+            ("example.com", "/x/y", "example.com/**"),
+        ]:
+            self.assertEqual(self.telemetry.endpoint(hostname, path), endpoint)
+
+    def test_run(self):
+        """Tests the counters of the requests of a run"""
+        cached = fake_response('{"a": 1}')
+        cached.from_cache = True
+        responses = [
+            fake_response('{"a": 1}'),
+            cached,
+            fake_response(ok=False, reason="Bad Gateway", status_code=502),
+            requests.ConnectionError(),
+            fake_response('{"b": 22}'),
+            fake_response(ok=False, reason="Not Found", status_code=404),
+            fake_response(),
+        ]
+        with (
+            patch("ecosystem.request.requests.Session.get", side_effect=responses),
+            patch("ecosystem.request.rate_limiter.reserve", return_value=0),
+            patch("ecosystem.request.backoff_delay", return_value=1),
+        ):
+            request_json("pypi.org/pypi/qiskit/json")
+            with self.telemetry.run():
+                request_json("pypi.org/pypi/qiskit/json")
+                request_json("pypi.org/simple/qiskit/", delay=1)
+                with self.assertRaises(EcosystemError):
+                    request_json("example.com/x")
+            request_json("example.com/y")
+
+        report = self.telemetry.report({"saved": 3})
+        self.assertEqual(report["counters"], {"saved": 3})
+        self.assertEqual(report["totals"]["requests"], 5)
+        self.assertEqual(report["totals"]["errors"], 3)
+        self.assertEqual(report["totals"]["retries"], 2)
+        self.assertEqual(report["totals"]["sleeps"], 3)
+        pypi = report["hosts"]["pypi.org"]
+        self.assertEqual(pypi["statuses"], {"2xx": 2, "5xx": 1, "error": 1})
+        self.assertEqual(pypi["cache"], {"hit": 1, "miss": 2})
+        self.assertEqual(pypi["bytes"], len('{"b": 22}') + len("{}"))
+        self.assertEqual(sum(pypi["histogram"].values()), 4)
+        self.assertEqual(pypi["p50_seconds"], 0.05)
+        self.assertEqual(report["endpoints"]["pypi.org/simple/*"]["requests"], 3)
+        self.assertEqual(report["endpoints"]["example.com/**"]["statuses"], {"4xx": 1})
+
+    def test_report_while_recording(self):
+        """Tests that a report can be made while other threads count requests"""
+        done = threading.Event()
+
+        def record(worker):
+            for i in range(2000):
+                url = urlparse(f"https://host{worker}-{i}.example.com/x")
+                self.telemetry.record(url, fake_response(), 0.01, "miss")
+            done.set()
+
+        with self.telemetry.run():
+            threads = [threading.Thread(target=record, args=(i,)) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            while not done.is_set():
+                report = self.telemetry.report()
+                self.assertEqual(report["totals"]["requests"], len(report["hosts"]))
+            for thread in threads:
+                thread.join()
+        self.assertEqual(self.telemetry.report()["totals"]["requests"], 8000)
+
+    def test_quantiles(self):
+        """Tests the quantiles of the latency histogram"""
+        stats = RequestStats()
+        for seconds in [0.01] * 90 + [3] * 9 + [100]:
+            stats.add(200, seconds)
+        self.assertEqual(stats.quantile(0.5), 0.05)
+        self.assertEqual(stats.quantile(0.95), 5)
+        self.assertEqual(stats.quantile(1), 100)
+        self.assertIsNone(RequestStats().quantile(0.5))
+
+    def test_write_report(self):
+        """Tests the JSON and markdown reports, and the job summary"""
+        report_path = self.path / "report.json"
+        summary_path = self.path / "summary.md"
+        with patch("ecosystem.request.requests.Session.get") as get:
+            get.return_value = fake_response()
+            for _ in range(2):
+                with self.telemetry.run():
+                    request_json("example.com/x")
+                with patch.dict(os.environ, {"GITHUB_STEP_SUMMARY": str(summary_path)}):
+                    markdown = self.telemetry.write_report(report_path, {"saved": 1})
+
+        self.assertIn("1 requests (0 failed)", markdown)
+        self.assertIn("1 saved.", markdown)
+        self.assertRegex(
+            markdown, r"\| example.com \| 1 \| 0 \| 0/0/1 \| .* \| [+-]0.0 \|"
+        )
+        self.assertIn("| `example.com/**` | 1 |", markdown)
+        self.assertEqual(summary_path.read_text().count("## Requests"), 2)
+        report = json.loads(report_path.read_text())
+        self.assertEqual(report["hosts"]["example.com"]["requests"], 1)
+
+        # without requests, the job summary is not written
+        with self.telemetry.run():
+            pass
+        with patch.dict(os.environ, {"GITHUB_STEP_SUMMARY": str(summary_path)}):
+            self.assertIn("0 requests", self.telemetry.write_report())
+        self.assertEqual(summary_path.read_text().count("## Requests"), 2)
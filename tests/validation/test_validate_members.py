@@ -0,0 +1,118 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for ecosystem.validation.validate_members"""
+
+from unittest import TestCase
+from contextlib import redirect_stdout
+from io import StringIO
+
+from ecosystem.check import CheckData
+from ecosystem.member import Member
+from ecosystem.validation import validate_members
+
+LONG_DESCRIPTION = "Banana" + " long" * 40 + " description."
+
+
+class ValidateMembersTestCase(TestCase):
+    """Tests for ecosystem.validation.validate_members"""
+
+    def _members(self):
+        """A member with a long description, one expected to fail, and a good one"""
+        return [
+            Member(
+                name="long",
+                url="https://github.com/BananaOrg/long-repo",
+                description=LONG_DESCRIPTION,
+            ),
+            Member(
+                name="xfail",
+                url="https://github.com/BananaOrg/xfail-repo",
+                description=LONG_DESCRIPTION,
+                checks={"014": CheckData("014", xfailed="on purpose")},
+            ),
+            Member(
+                name="short",
+                url="https://github.com/BananaOrg/short-repo",
+                description="Banana description.",
+            ),
+        ]
+
+    def test_reports_by_member(self):
+        """The outcome of a single session is filed by member."""
+        long_, xfail, short = self._members()
+        with redirect_stdout(StringIO()):
+            reports = validate_members(
+                [long_, xfail, short],
+                tests_to_run="test_description.py::test_description_len_135",
+            )
+
+        self.assertEqual(
+            ["test_description.py::test_description_len_135"],
+            [report.nodeid for report in reports[long_.name_id].failed],
+        )
+        self.assertEqual(1, reports[long_.name_id].exitcode)
+
+        self.assertEqual([], reports[xfail.name_id].failed)
+        self.assertEqual(
+            ["on purpose"],
+            [report.wasxfail for report in reports[xfail.name_id].xfailed],
+        )
+        self.assertEqual(0, reports[xfail.name_id].exitcode)
+
+        self.assertEqual([], reports[short.name_id].failed)
+        self.assertEqual(1, len(reports[short.name_id].passed))
+        self.assertEqual(0, reports[short.name_id].exitcode)
+
+    def test_same_checkups_as_one_by_one(self):
+        """Validating members together gives the same checkups as one by one."""
+        together = self._members()
+        one_by_one = self._members()
+        with redirect_stdout(StringIO()):
+            reports = validate_members(together)
+            for member in together:
+                member.update_checkups(report=reports[member.name_id])
+            for member in one_by_one:
+                member.update_checkups()
+
+        for member, expected in zip(together, one_by_one):
+            self.assertEqual(
+                {id_: check.to_dict() for id_, check in expected.checks.items()},
+                {id_: check.to_dict() for id_, check in member.checks.items()},
+            )
+        self.assertIn("014", together[0].checks)
+
+    def test_jobs(self):
+        """Validating members on a pool of processes gives the same reports."""
+        members = self._members()
+        with redirect_stdout(StringIO()):
+            sequential = validate_members(members)
+        with redirect_stdout(StringIO()) as buffer:
+            in_pool = validate_members(members, jobs=2)
+
+        self.assertEqual(list(sequential), list(in_pool))
+        for name_id, report in sequential.items():
+            self.assertEqual(
+                [test.nodeid for test in report.failed],
+                [test.nodeid for test in in_pool[name_id].failed],
+            )
+            self.assertEqual(
+                [test.wasxfail for test in report.xfailed],
+                [test.wasxfail for test in in_pool[name_id].xfailed],
+            )
+            self.assertEqual(report.exitcode, in_pool[name_id].exitcode)
+        # the output of both sessions
+        self.assertEqual(2, buffer.getvalue().count("[100%]"))
+
+    def test_no_members(self):
+        """Nothing to validate, nothing to report."""
+        self.assertEqual({}, validate_members([]))